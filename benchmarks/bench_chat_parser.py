@@ -0,0 +1,71 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Measures how many IRC lines per second the chat parser handles, over the lines of the golden test corpus.
+
+Run from the repository root with :code:`python -m benchmarks.bench_chat_parser`.
+Pass a git revision, e.g. :code:`python -m benchmarks.bench_chat_parser HEAD~10`, to compare with the parser of that revision."""
+import importlib.util
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from twitchAPI.chat import Chat
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_corpus():
+    with open(os.path.join(ROOT, 'tests', 'data', 'chat_parser_golden.json')) as f:
+        return json.load(f)
+
+
+def _chat_class_at(revision: str):
+    source = subprocess.run(['git', 'show', f'{revision}:twitchAPI/chat/__init__.py'], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as f:
+        f.write(source)
+    try:
+        spec = importlib.util.spec_from_file_location('twitchAPI.chat_baseline', f.name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.remove(f.name)
+    return module.Chat
+
+
+def _make_parser(cls, corpus):
+    chat = object.__new__(cls)
+    chat.logger = logging.getLogger('twitchAPI.chat')
+    chat._prefix = corpus['command_prefix']
+    chat._channel_command_prefix = corpus['channel_command_prefix']
+    return chat
+
+
+def _read_tags(tags):
+    return [tags.get(key) for key in list(tags)]
+
+
+def main(number: int = 200):
+    logging.disable(logging.CRITICAL)
+    corpus = _load_corpus()
+    lines = [c['line'] for c in corpus['cases']]
+    privmsg = [line for line in lines if ' PRIVMSG ' in line]
+    parsers = [('current', Chat)]
+    if len(sys.argv) > 1:
+        parsers.insert(0, (sys.argv[1], _chat_class_at(sys.argv[1])))
+    for name, cls in parsers:
+        parser = _make_parser(cls, corpus)
+        for label, sample in (('all lines', lines), ('PRIVMSG', privmsg)):
+            best = min(timeit.repeat(lambda: [parser._parse_irc_message(line) for line in sample], number=number, repeat=5))
+            print(f'{name:>10} {label:>10}: {number * len(sample) / best:,.0f} lines/s')
+        # reading every tag through get(), as the event objects eventually do
+        best = min(timeit.repeat(lambda: [_read_tags(parser._parse_irc_message(line)['tags']) for line in privmsg],
+                                 number=number, repeat=5))
+        print(f'{name:>10} {"all tags":>10}: {number * len(privmsg) / best:,.0f} lines/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Compares parse_iso_datetime with dateutil's isoparse over Helix and EventSub timestamp samples.
+
+Run from the repository root with :code:`python -m benchmarks.bench_datetime`"""
+import timeit
+
+from dateutil import parser as du_parser
+
+from twitchAPI.helper import parse_iso_datetime
+
+SAMPLES = [
+    '2021-03-10T15:04:21Z',
+    '2023-06-01T18:24:30.904845Z',
+    '2019-11-16T10:11:12.634234626Z',
+    '2020-07-15T17:16:03.17106713Z',
+    '2024-01-01T00:00:00.123456789+00:00',
+]
+
+
+def main(number: int = 20000):
+    for name, func in (('isoparse', du_parser.isoparse), ('parse_iso_datetime', parse_iso_datetime)):
+        best = min(timeit.repeat(lambda: [func(s) for s in SAMPLES], number=number, repeat=5))
+        print(f'{name:>20}: {best / (number * len(SAMPLES)) * 1e6:.2f}us per timestamp')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Measures the memory used by TwitchObjects with and without compact objects (:code:`TWITCHAPI_COMPACT_OBJECTS`).
+
+Compact objects are chosen when the library is imported, so each mode is measured in its own interpreter.
+Only the memory allocated while building the objects is counted, the payloads they are built from are created beforehand.
+
+Run from the repository root with :code:`python -m benchmarks.bench_object_memory [count]`"""
+import os
+import subprocess
+import sys
+import tracemalloc
+
+COUNT = 100_000
+
+
+def _follower(i: int) -> dict:
+    return {'followed_at': '2022-05-24T22:22:08Z', 'user_id': str(i), 'user_name': f'User{i}', 'user_login': f'user{i}'}
+
+
+def _chatter(i: int) -> dict:
+    return {'user_id': str(i), 'user_login': f'user{i}', 'user_name': f'User{i}'}
+
+
+def _stream(i: int) -> dict:
+    return {'id': str(i), 'user_id': str(i), 'user_login': f'user{i}', 'user_name': f'User{i}', 'game_id': '494131',
+            'game_name': 'Little Nightmares', 'type': 'live', 'title': f'stream {i}', 'viewer_count': i,
+            'started_at': '2021-03-10T15:04:21Z', 'language': 'en', 'thumbnail_url': f'https://example.com/{i}-{{width}}x{{height}}.jpg',
+            'tag_ids': [], 'is_mature': False, 'tags': ['English']}
+
+
+def measure(count: int):
+    """prints the memory used by count objects of each measured class, runs in the mode set by the environment"""
+    from twitchAPI.object.api import ChannelFollower, Chatter, Stream
+
+    for cls, build in ((ChannelFollower, _follower), (Chatter, _chatter), (Stream, _stream)):
+        payloads = [build(i) for i in range(count)]
+        tracemalloc.start()
+        objects = [cls(**p) for p in payloads]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{cls.__name__} {size}')
+        del objects
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    results = {}
+    for mode, env in (('default', '0'), ('compact', '1')):
+        out = subprocess.run([sys.executable, '-c', f'from benchmarks.bench_object_memory import measure; measure({count})'],
+                             env={**os.environ, 'TWITCHAPI_COMPACT_OBJECTS': env}, capture_output=True, text=True, check=True).stdout
+        for line in out.splitlines():
+            name, size = line.split()
+            results.setdefault(name, {})[mode] = int(size)
+    print(f'{count} objects, Python {sys.version.split()[0]}')
+    for name, sizes in results.items():
+        default, compact = sizes['default'] / 1e6, sizes['compact'] / 1e6
+        print(f'{name:>16}: {default:6.1f} MB default, {compact:6.1f} MB compact ({(1 - compact / default) * 100:.0f}% less)')
+
+
+if __name__ == '__main__':
+    main()
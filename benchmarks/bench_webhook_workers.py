@@ -0,0 +1,115 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Measures how many EventSub webhook notifications per second reach the callbacks for a number of worker processes.
+
+The notifications are sent from separate processes, so sending them does not compete with the process running EventSub.
+Worker processes can only help if there is a free CPU core for each of them, the main process and the senders.
+Besides the throughput, the CPU time the main process spends per notification is printed. With enough cores, the main process
+is the limit, so this shows how far worker processes can scale independent of the cores of the machine running the benchmark.
+Every notification is decoded into a :const:`~twitchAPI.object.eventsub.ChannelFollowEvent` before it is passed to the callback.
+
+Run from the repository root with :code:`python -m benchmarks.bench_webhook_workers [workers ...]`"""
+import asyncio
+import hashlib
+import hmac
+import json
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from typing import Tuple
+
+import aiohttp
+
+from twitchAPI.eventsub.webhook import EventSubWebhook
+from twitchAPI.object.eventsub import ChannelFollowEvent
+from twitchAPI.twitch import Twitch
+
+PORT = 18190
+NOTIFICATIONS = 4000
+SENDERS = 2
+CONCURRENCY = 32
+BODY = json.dumps({
+    'subscription': {'id': 'bench', 'type': 'channel.follow', 'version': '2', 'status': 'enabled', 'cost': 0,
+                     'condition': {'broadcaster_user_id': '1337', 'moderator_user_id': '1337'},
+                     'transport': {'method': 'webhook', 'callback': 'https://example.com/callback'},
+                     'created_at': '2019-11-16T10:11:12.634234626Z'},
+    'event': {'user_id': '1234', 'user_login': 'cool_user', 'user_name': 'Cool_User', 'broadcaster_user_id': '1337',
+              'broadcaster_user_login': 'cooler_user', 'broadcaster_user_name': 'Cooler_User',
+              'followed_at': '2020-07-15T18:16:11.17106713Z'}
+}).encode('utf-8')
+
+
+def send(secret: str, count: int, start: 'multiprocessing.synchronize.Event'):
+    """sends count signed notifications, runs in its own process"""
+    messages = []
+    for _ in range(count):
+        msg_id = str(uuid.uuid4())
+        timestamp = '2023-01-01T00:00:00Z'
+        signature = hmac.new(secret.encode('utf-8'), (msg_id + timestamp).encode('utf-8') + BODY, hashlib.sha256).hexdigest()
+        messages.append({'Twitch-Eventsub-Message-Id': msg_id,
+                         'Twitch-Eventsub-Message-Timestamp': timestamp,
+                         'Twitch-Eventsub-Message-Type': 'notification',
+                         'Twitch-Eventsub-Message-Signature': f'sha256={signature}',
+                         'Twitch-Eventsub-Subscription-Type': 'channel.follow',
+                         'Twitch-Eventsub-Subscription-Version': '2'})
+
+    async def run():
+        async def worker(session: aiohttp.ClientSession):
+            while len(messages) > 0:
+                async with session.post(f'http://127.0.0.1:{PORT}/callback', data=BODY, headers=messages.pop()) as response:
+                    await response.read()
+
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*[worker(session) for _ in range(CONCURRENCY)])
+
+    start.wait()
+    asyncio.run(run())
+
+
+async def run(workers: int) -> Tuple[float, float]:
+    twitch = Twitch('client_id', authenticate_app=False)
+    eventsub = EventSubWebhook('https://example.com', PORT, twitch, worker_processes=workers)
+    eventsub.unsubscribe_on_stop = False
+    eventsub.start()
+    received = 0
+    done = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    async def callback(_data):
+        nonlocal received
+        received += 1
+        if received == NOTIFICATIONS:
+            loop.call_soon_threadsafe(done.set)
+
+    eventsub._add_callback('bench', callback, ChannelFollowEvent)
+    eventsub._register_event_type('channel.follow', '2', ChannelFollowEvent)
+    ctx = multiprocessing.get_context('spawn')
+    go = ctx.Event()
+    senders = [ctx.Process(target=send, args=(eventsub.secret, NOTIFICATIONS // SENDERS, go)) for _ in range(SENDERS)]
+    for sender in senders:
+        sender.start()
+    # give the senders time to start up and sign their messages
+    await asyncio.sleep(3)
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    go.set()
+    await asyncio.wait_for(done.wait(), 120)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    for sender in senders:
+        sender.join()
+    await eventsub.stop()
+    await twitch.close()
+    return NOTIFICATIONS / elapsed, cpu / NOTIFICATIONS * 1_000_000
+
+
+def main():
+    print(f'{os.cpu_count()} CPU core(s), {SENDERS} sender processes')
+    for workers in [int(w) for w in sys.argv[1:]] or [1, 2, 4]:
+        rate, cpu = asyncio.run(run(workers))
+        print(f'{workers} worker(s): {rate:.0f} notifications/s, {cpu:.0f} µs CPU time of the main process per notification')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Shared local aiohttp server for the tests that talk to a mocked Twitch"""
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.chat import Chat
+from twitchAPI.twitch import Twitch
+from twitchAPI.type import AuthScope, ChatEvent
+
+
+class MockServer:
+    """An aiohttp server on a free local port, tests add their route handlers to :attr:`router` before running it"""
+
+    def __init__(self):
+        self.app = web.Application()
+        self.router = self.app.router
+        self.url: Optional[str] = None
+        """base url of the running server, ends with a slash"""
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self):
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f'http://127.0.0.1:{self._runner.addresses[0][1]}/'
+
+    async def close(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def run(self, test: Callable[[], Awaitable[None]]):
+        """starts the server in a new event loop, runs ``test()`` and shuts the server down again"""
+
+        async def main():
+            await self.start()
+            try:
+                await test()
+            finally:
+                await self.close()
+
+        asyncio.run(main())
+
+    def run_helix(self, test: Callable[[Twitch], Awaitable[None]]):
+        """runs ``test(twitch)`` with a Twitch instance that uses app authentication and sends every request to this server"""
+
+        async def main():
+            twitch = Twitch('id', authenticate_app=False, base_url=self.url, auth_base_url=self.url + 'oauth2/')
+            await twitch.set_app_authentication('token', [])
+            try:
+                await test(twitch)
+            finally:
+                await twitch.close()
+
+        self.run(main)
+
+    def run_chat(self, test: Callable[[Chat, Callable[[Awaitable], Awaitable]], Awaitable[None]], initial_channel=None, **kwargs):
+        """starts a chat against the :class:`IRCMock` of this server, runs ``test(chat, call)`` and shuts the chat down again
+
+        ``call`` runs a coroutine on the socket loop of the chat."""
+
+        async def main():
+            twitch = Twitch('id', authenticate_app=False)
+            twitch.auto_refresh_auth = False
+            await twitch.set_user_authentication('token', [AuthScope.CHAT_READ, AuthScope.CHAT_EDIT], validate=False)
+
+            async def get_token():
+                return 'token'
+
+            # never try to reach the Twitch API
+            twitch.get_refreshed_user_auth_token = get_token
+            chat = Chat(twitch, connection_url=self.url, initial_channel=initial_channel, **kwargs)
+            chat.username = 'bot'
+            loop = asyncio.get_running_loop()
+            ready = asyncio.Event()
+
+            async def on_ready(_):
+                loop.call_soon_threadsafe(ready.set)
+
+            async def call(coro):
+                return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, chat._Chat__socket_loop))
+
+            chat.register_event(ChatEvent.READY, on_ready)
+            await loop.run_in_executor(None, chat.start)
+            try:
+                await asyncio.wait_for(ready.wait(), 10)
+                await test(chat, call)
+            finally:
+                if chat._Chat__running:
+                    await loop.run_in_executor(None, chat.stop)
+                await twitch.close()
+
+        self.run(main)
+
+
+class IRCMock:
+    """Minimal Twitch IRC websocket server, answers the handshake, JOIN and PART"""
+
+    def __init__(self):
+        self.handshake_delay: float = 0
+        self.sockets = []
+
+    async def handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        async for msg in ws:
+            for line in msg.data.split('\r\n'):
+                if line.startswith('NICK'):
+                    await asyncio.sleep(self.handshake_delay)
+                    await ws.send_str(':tmi.twitch.tv 001 bot :Welcome, GLHF!')
+                elif line.startswith('JOIN'):
+                    for ch in line[5:].split(','):
+                        await ws.send_str(f':bot!bot@bot.tmi.twitch.tv JOIN {ch}\r\n'
+                                          f'@emote-only=0;followers-only=-1;r9k=0;room-id=1;slow=0;subs-only=0 :tmi.twitch.tv ROOMSTATE {ch}')
+                elif line.startswith('PART'):
+                    for ch in line[5:].split(','):
+                        await ws.send_str(f':bot!bot@bot.tmi.twitch.tv PART {ch}')
+        return ws
+
+
+@pytest.fixture
+def mock_server() -> MockServer:
+    return MockServer()
+
+
+@pytest.fixture
+def irc(mock_server) -> IRCMock:
+    mock = IRCMock()
+    mock_server.router.add_get('/', mock.handler)
+    return mock
@@ -0,0 +1,105 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Splitting of long id lists into concurrent requests, tested against a local Helix mock"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.type import TwitchAPIException
+
+
+class UsersMock:
+    """Answers Get Users and Get Channel Information, the first chunk is the slowest. Requests for ids in ``failing`` are rejected"""
+
+    def __init__(self):
+        self.requests = []
+        self.running = 0
+        self.max_running = 0
+        self.failing = set()
+
+    async def handle(self, request: web.Request):
+        ids = request.query.getall('id', []) + request.query.getall('broadcaster_id', [])
+        self.requests.append(ids)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            # later chunks finish first
+            await asyncio.sleep(0.2 / len(self.requests))
+        finally:
+            self.running -= 1
+        if self.failing.intersection(ids):
+            return web.json_response({'error': 'Bad Request', 'status': 400, 'message': 'invalid id'}, status=400)
+        if request.path == '/channels':
+            return web.json_response({'data': [{'broadcaster_id': i, 'broadcaster_name': f'User{i}'} for i in ids]})
+        return web.json_response({'data': [{'id': i, 'login': f'user{i}'} for i in ids]})
+
+
+@pytest.fixture
+def helix(mock_server):
+    mock = UsersMock()
+    mock_server.router.add_get('/users', mock.handle)
+    mock_server.router.add_get('/channels', mock.handle)
+    return mock
+
+
+IDS = [str(i) for i in range(250)]
+
+
+def test_long_lists_are_split(mock_server, helix):
+    async def test(twitch):
+        users = [u async for u in twitch.get_users(user_ids=IDS)]
+        assert sorted(len(r) for r in helix.requests) == [50, 100, 100]
+        assert sorted(i for r in helix.requests for i in r) == sorted(IDS)
+        assert len(users) == 250
+
+    mock_server.run_helix(test)
+
+
+def test_short_lists_are_not_split(mock_server, helix):
+    async def test(twitch):
+        users = [u async for u in twitch.get_users(user_ids=IDS[:100])]
+        assert len(helix.requests) == 1
+        assert [u.id for u in users] == IDS[:100]
+
+    mock_server.run_helix(test)
+
+
+def test_concurrency_is_limited(mock_server, helix):
+    async def test(twitch):
+        twitch.bulk_request_concurrency = 2
+        ids = [str(i) for i in range(520)]
+        assert len([u async for u in twitch.get_users(user_ids=ids)]) == 520
+        assert len(helix.requests) == 6
+        assert helix.max_running == 2
+
+    mock_server.run_helix(test)
+
+
+def test_results_keep_order(mock_server, helix):
+    async def test(twitch):
+        users = [u.id async for u in twitch.get_users(user_ids=IDS)]
+        # the chunks finished in reverse order
+        assert users == IDS
+        channels = await twitch.get_channel_information(IDS)
+        assert [c.broadcaster_id for c in channels] == IDS
+
+    mock_server.run_helix(test)
+
+
+def test_failing_chunk_raises(mock_server, helix):
+    helix.failing.add('150')
+
+    async def test(twitch):
+        users = []
+        with pytest.raises(TwitchAPIException):
+            async for u in twitch.get_users(user_ids=IDS):
+                users.append(u.id)
+        # the chunk before the failing one was handed out in full
+        assert users == IDS[:100]
+        with pytest.raises(TwitchAPIException):
+            await twitch.get_channel_information(IDS)
+        await asyncio.sleep(0.3)
+        # nothing is left running after the error
+        assert helix.running == 0
+
+    mock_server.run_helix(test)
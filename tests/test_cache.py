@@ -0,0 +1,65 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+import asyncio
+import threading
+
+from twitchAPI.cache import ResponseCache, SQLiteCacheBackend, MemoryCacheBackend
+from twitchAPI.twitch import Twitch
+
+
+def test_sqlite_roundtrip(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / 'cache.db'))
+    cache = ResponseCache(backend)
+    cache.set('users', 'login=a', 'Bearer x', {'data': [{'id': '1'}]})
+    assert cache.get('users', 'login=a', 'Bearer x') == {'data': [{'id': '1'}]}
+    assert cache.get('users', 'login=a', 'Bearer y') is None
+    cache.invalidate('users')
+    assert cache.get('users', 'login=a', 'Bearer x') is None
+    backend.close()
+
+
+def test_memory_backend_copies_entries():
+    cache = ResponseCache(MemoryCacheBackend())
+    value = {'data': [{'id': '1'}]}
+    cache.set('users', 'login=a', None, value)
+    value['data'][0]['id'] = '2'
+    result = cache.get('users', 'login=a', None)
+    assert result == {'data': [{'id': '1'}]}
+    result['data'].clear()
+    assert cache.get('users', 'login=a', None) == {'data': [{'id': '1'}]}
+
+
+def test_blocking_backend_runs_off_loop(tmp_path):
+    async def main():
+        twitch = Twitch('id', authenticate_app=False)
+        backend = SQLiteCacheBackend(str(tmp_path / 'cache.db'))
+        twitch.response_cache = ResponseCache(backend)
+        threads = []
+        get = twitch.response_cache.get
+
+        def tracked_get(*args):
+            threads.append(threading.get_ident())
+            return get(*args)
+
+        await twitch._run_cache(twitch.response_cache.set, 'users', 'login=a', None, {'data': []})
+        assert await twitch._run_cache(tracked_get, 'users', 'login=a', None) == {'data': []}
+        assert threads[0] != threading.get_ident()
+        backend.close()
+        await twitch.close()
+
+    asyncio.run(main())
+
+
+def test_memory_backend_runs_on_loop():
+    async def main():
+        twitch = Twitch('id', authenticate_app=False)
+        twitch.response_cache = ResponseCache(MemoryCacheBackend())
+        threads = []
+
+        def tracked(*args):
+            threads.append(threading.get_ident())
+
+        await twitch._run_cache(tracked)
+        assert threads == [threading.get_ident()]
+        await twitch.close()
+
+    asyncio.run(main())
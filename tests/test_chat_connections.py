@@ -0,0 +1,186 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Placement of chat rooms on a pool of connections, tested against a local IRC websocket mock"""
+import asyncio
+import time
+
+import pytest
+
+from twitchAPI.chat import Chat
+
+
+class _ClosedSocket:
+    """stands in for a websocket that went away"""
+    closed = True
+
+    async def close(self):
+        pass
+
+
+def _layout(chat: Chat):
+    return sorted((c.index, sorted(c.rooms)) for c in chat._connections)
+
+
+def _all_rooms(chat: Chat):
+    rooms = [r for c in chat._connections for r in c.rooms]
+    assert len(rooms) == len(set(rooms)), 'room joined through more than one connection'
+    return sorted(rooms)
+
+
+def test_single_connection_by_default(mock_server, irc):
+    async def test(chat, call):
+        assert await call(chat.join_room(['c3', 'c4'])) == []
+        assert len(irc.sockets) == 1
+        assert _layout(chat) == [(0, ['c1', 'c2', 'c3', 'c4'])]
+
+    mock_server.run_chat(test, initial_channel=['c1', 'c2'])
+
+
+def test_fill_connections_up_to_the_limit(mock_server, irc):
+    async def test(chat, call):
+        # 5 rooms at 2 per connection need 3 connections
+        assert len(irc.sockets) == 3
+        assert sorted(len(c.rooms) for c in chat._connections) == [1, 2, 2]
+        # fits into the connection that still has space, no new connection
+        assert await call(chat.join_room('c6')) == []
+        assert len(irc.sockets) == 3
+        assert sorted(len(c.rooms) for c in chat._connections) == [2, 2, 2]
+        # every connection is full
+        assert await call(chat.join_room('c7')) == ['c7']
+        assert _all_rooms(chat) == ['c1', 'c2', 'c3', 'c4', 'c5', 'c6']
+        assert 'c7' not in chat.room_cache
+
+    mock_server.run_chat(test, initial_channel=['c1', 'c2', 'c3', 'c4', 'c5'], max_connections=3, max_rooms_per_connection=2)
+
+
+def test_existing_connections_are_filled_first(mock_server, irc):
+    async def test(chat, call):
+        assert await call(chat.join_room(['c2', 'c3', 'c4'])) == []
+        assert len(irc.sockets) == 1
+        assert await call(chat.join_room(['c5', 'c6'])) == []
+        assert len(irc.sockets) == 2
+        assert sorted(len(c.rooms) for c in chat._connections) == [2, 4]
+
+    mock_server.run_chat(test, initial_channel=['c1'], max_connections=10, max_rooms_per_connection=4)
+
+
+def test_spread_without_room_limit(mock_server, irc):
+    async def test(chat, call):
+        assert await call(chat.join_room(['c2', 'c3', 'c4', 'c5', 'c6'])) == []
+        assert len(irc.sockets) == 3
+        assert sorted(len(c.rooms) for c in chat._connections) == [2, 2, 2]
+
+    mock_server.run_chat(test, initial_channel=['c1'], max_connections=3)
+
+
+def test_connections_open_concurrently(mock_server, irc):
+    delay = 0.3
+    irc.handshake_delay = delay
+
+    async def test(chat, call):
+        start = time.perf_counter()
+        assert await call(chat.join_room([f'c{i}' for i in range(2, 14)])) == []
+        took = time.perf_counter() - start
+        assert len(irc.sockets) == 5
+        # 4 handshakes one after another would take at least 4 * delay
+        assert took < 3 * delay, took
+
+    mock_server.run_chat(test, initial_channel=['c1'], max_connections=5, max_rooms_per_connection=3)
+
+
+def test_reconnect_keeps_rooms(mock_server, irc):
+    async def test(chat, call):
+        before = _all_rooms(chat)
+        await irc.sockets[1].send_str(':tmi.twitch.tv RECONNECT')
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if len(irc.sockets) == 4 and len(chat._room_join_locks) == 0 and all(c.is_ready() for c in chat._connections):
+                break
+        assert len(irc.sockets) == 4
+        assert _all_rooms(chat) == before
+        assert all(len(c.rooms) <= 2 for c in chat._connections)
+        assert sorted(chat.room_cache) == before
+
+    mock_server.run_chat(test, initial_channel=['c1', 'c2', 'c3', 'c4', 'c5', 'c6'], max_connections=3, max_rooms_per_connection=2)
+
+
+def test_connection_lost_moves_rooms(mock_server, irc):
+    async def test(chat, call):
+        before = _all_rooms(chat)
+        lost = [c for c in chat._connections if len(c.rooms) == 1][0]
+        room = next(iter(lost.rooms))
+        # make space for the room on one of the remaining connections
+        assert await call(chat.leave_room('c1')) is None
+        before.remove('c1')
+        chat._Chat__socket_loop.call_soon_threadsafe(chat._connection_lost, lost)
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if _all_rooms(chat) == before:
+                break
+        assert lost not in chat._connections
+        assert _all_rooms(chat) == before
+        # the room fit on a remaining connection, no replacement was opened
+        assert len(irc.sockets) == 3
+        assert any(room in c.rooms for c in chat._connections)
+
+    mock_server.run_chat(test, initial_channel=['c1', 'c2', 'c3', 'c4', 'c5'], max_connections=3, max_rooms_per_connection=2)
+
+
+def test_connection_lost_opens_replacement(mock_server, irc):
+    async def test(chat, call):
+        before = _all_rooms(chat)
+        lost = chat._connections[-1]
+        chat._Chat__socket_loop.call_soon_threadsafe(chat._connection_lost, lost)
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            if _all_rooms(chat) == before:
+                break
+        assert lost not in chat._connections
+        assert _all_rooms(chat) == before
+        # the remaining connections are full, the rooms got a new connection
+        assert len(irc.sockets) == 4
+        assert all(len(c.rooms) <= 2 for c in chat._connections)
+
+    mock_server.run_chat(test, initial_channel=['c1', 'c2', 'c3', 'c4', 'c5', 'c6'], max_connections=3, max_rooms_per_connection=2)
+
+
+def test_last_connection_is_never_dropped(mock_server, irc):
+    async def test(chat, call):
+        connection = chat._connections[0]
+        chat._Chat__socket_loop.call_soon_threadsafe(chat._connection_lost, connection)
+        await asyncio.sleep(0.1)
+        assert chat._connections == [connection]
+        assert connection.rooms == {'c1'}
+
+    mock_server.run_chat(test, initial_channel=['c1'], max_connections=2)
+
+
+def test_send_waiting_for_connection_fails_on_stop(mock_server, irc):
+    async def test(chat, call):
+        chat._connections[0].websocket = _ClosedSocket()
+        send = asyncio.ensure_future(chat.send_message('c1', 'hello'))
+        await asyncio.sleep(0.3)
+        assert not send.done()
+        await asyncio.get_running_loop().run_in_executor(None, chat.stop)
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(send, 2)
+        with pytest.raises(ValueError):
+            await chat.send_message('c1', 'hello')
+
+    mock_server.run_chat(test, initial_channel=['c1'])
+
+
+def test_send_fails_when_last_connection_is_lost(mock_server, irc):
+    async def test(chat, call):
+        connection = chat._connections[0]
+        connection.websocket = _ClosedSocket()
+        send = asyncio.ensure_future(chat.send_message('c1', 'hello'))
+        await asyncio.sleep(0.3)
+        assert not send.done()
+        chat._Chat__socket_loop.call_soon_threadsafe(chat._connection_lost, connection)
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(send, 2)
+        assert not chat.is_ready()
+        with pytest.raises(ValueError):
+            await chat.send_message('c1', 'hello')
+
+    mock_server.run_chat(test, initial_channel=['c1'])
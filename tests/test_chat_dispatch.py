@@ -0,0 +1,218 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Dispatch of received chat lines to handlers, batches and message iterators, tested against a local IRC websocket mock"""
+import asyncio
+
+from twitchAPI.chat import Chat
+from twitchAPI.type import ChatEvent
+
+PRIVMSG = '@badge-info=;badges=;display-name=User;id=msg-{n};room-id=1;user-id=2 :user!user@user.tmi.twitch.tv PRIVMSG #c1 :{text}'
+SUB = '@badge-info=;badges=;display-name=User;msg-id=sub;msg-param-sub-plan=1000;room-id=1;user-id=2 :tmi.twitch.tv USERNOTICE #c1 :hype'
+CLEARCHAT = '@room-id=1;tmi-sent-ts=1 :tmi.twitch.tv CLEARCHAT #c1'
+HOSTTARGET = ':tmi.twitch.tv HOSTTARGET #c1 :c2 10'
+
+
+async def _wait_for(check, timeout: float = 5):
+    for _ in range(int(timeout / 0.02)):
+        if check():
+            return
+        await asyncio.sleep(0.02)
+
+
+def _record_parsed(chat: Chat) -> list:
+    """records the command of every line that got fully parsed"""
+    parsed = []
+    parse = chat._parse_irc_message
+
+    def spy(message: str):
+        result = parse(message)
+        if result is not None:
+            parsed.append(result['command']['command'])
+        return result
+
+    chat._parse_irc_message = spy
+    return parsed
+
+
+def test_filter_follows_registered_handlers(mock_server, irc):
+    async def test(chat, call):
+        async def handler(_):
+            pass
+
+        privmsg = PRIVMSG.format(n=0, text='hello')
+        command = PRIVMSG.format(n=1, text='!hi there')
+        assert chat._skip_irc_message(privmsg)
+        assert chat._skip_irc_message(SUB)
+        assert chat._skip_irc_message(CLEARCHAT)
+        assert chat._skip_irc_message(HOSTTARGET)
+        # commands other handlers depend on are always handled
+        assert not chat._skip_irc_message('@emote-only=0;room-id=1 :tmi.twitch.tv ROOMSTATE #c1')
+        assert not chat._skip_irc_message(':tmi.twitch.tv RECONNECT')
+        chat.register_event(ChatEvent.MESSAGE, handler)
+        assert not chat._skip_irc_message(privmsg)
+        assert chat._skip_irc_message(SUB)
+        chat.register_event(ChatEvent.SUB, handler)
+        assert not chat._skip_irc_message(SUB)
+        assert chat.unregister_event(ChatEvent.MESSAGE, handler)
+        assert chat._skip_irc_message(privmsg)
+        # with only a command registered, just the lines starting with a prefix are handled
+        chat.register_command('hi', handler)
+        assert chat._skip_irc_message(privmsg)
+        assert not chat._skip_irc_message(command)
+        assert chat._skip_irc_message(PRIVMSG.format(n=2, text='?hi'))
+        chat.set_channel_prefix('?', 'c1')
+        assert not chat._skip_irc_message(PRIVMSG.format(n=2, text='?hi'))
+        chat.reset_channel_prefix('c1')
+        assert chat._skip_irc_message(PRIVMSG.format(n=2, text='?hi'))
+        chat.set_prefix('#')
+        assert chat._skip_irc_message(command)
+        assert not chat._skip_irc_message(PRIVMSG.format(n=3, text='#hi'))
+        assert chat.unregister_command('hi')
+        assert chat._skip_irc_message(PRIVMSG.format(n=3, text='#hi'))
+
+    mock_server.run_chat(test, initial_channel='c1')
+
+
+def test_filter_follows_message_iterators(mock_server, irc):
+    async def test(chat, call):
+        privmsg = PRIVMSG.format(n=0, text='hello')
+        assert chat._skip_irc_message(privmsg)
+        messages = chat.messages()
+        received = asyncio.ensure_future(messages.__anext__())
+        await _wait_for(lambda: len(chat._message_queues) > 0)
+        assert not chat._skip_irc_message(privmsg)
+        await irc.sockets[0].send_str(privmsg)
+        assert (await asyncio.wait_for(received, 5)).text == 'hello'
+        await messages.aclose()
+        assert chat._skip_irc_message(privmsg)
+
+    mock_server.run_chat(test, initial_channel='c1')
+
+
+def test_skipped_lines_never_reach_handlers(mock_server, irc):
+    async def test(chat, call):
+        subs = []
+        messages = []
+        commands = []
+
+        async def on_sub(sub):
+            subs.append(sub.sub_plan)
+
+        async def on_message(msg):
+            messages.append(msg.text)
+
+        async def on_command(cmd):
+            commands.append(cmd.parameter)
+
+        parsed = _record_parsed(chat)
+        chat.register_event(ChatEvent.SUB, on_sub)
+        chat.register_command('hi', on_command)
+        await irc.sockets[0].send_str('\r\n'.join([PRIVMSG.format(n=0, text='hello'), CLEARCHAT, HOSTTARGET, SUB,
+                                                   PRIVMSG.format(n=1, text='!hi there')]))
+        await _wait_for(lambda: len(subs) == 1 and len(commands) == 1)
+        assert subs == ['1000']
+        assert commands == ['there']
+        assert parsed == ['USERNOTICE', 'PRIVMSG']
+        # registered later, the next messages are handled
+        chat.register_event(ChatEvent.MESSAGE, on_message)
+        await irc.sockets[0].send_str(PRIVMSG.format(n=2, text='hello again'))
+        await _wait_for(lambda: len(messages) == 1)
+        assert messages == ['hello again']
+        # removed again, plain messages are skipped before being parsed
+        assert chat.unregister_event(ChatEvent.MESSAGE, on_message)
+        assert chat.unregister_command('hi')
+        parsed.clear()
+        await irc.sockets[0].send_str('\r\n'.join([PRIVMSG.format(n=3, text='bye'), PRIVMSG.format(n=4, text='!hi')]))
+        await irc.sockets[0].send_str(SUB)
+        await _wait_for(lambda: len(subs) == 2)
+        assert parsed == ['USERNOTICE']
+        assert messages == ['hello again']
+        assert commands == ['there']
+
+    mock_server.run_chat(test, initial_channel='c1')
+
+
+def _record_calls(chat: Chat, fail_on: str = None) -> list:
+    """registers two message listeners and the command hi, each records its name, the text and the task it ran in"""
+    calls = []
+
+    def listener(name: str):
+        async def handler(data):
+            text = data.parameter if name == 'command' else data.text
+            calls.append((name, text, asyncio.current_task()))
+            if text == fail_on:
+                raise ValueError('broken listener')
+        return handler
+
+    chat.register_command('hi', listener('command'))
+    chat.register_event(ChatEvent.MESSAGE, listener('first'))
+    chat.register_event(ChatEvent.MESSAGE, listener('second'))
+    return calls
+
+
+def _frame(*texts: str) -> str:
+    return '\r\n'.join(PRIVMSG.format(n=n, text=text) for n, text in enumerate(texts))
+
+
+def test_batch_runs_listeners_of_a_frame_in_order(mock_server, irc):
+    async def test(chat, call):
+        calls = _record_calls(chat, fail_on='b')
+        await irc.sockets[0].send_str(_frame('a', '!hi x', 'b', 'c'))
+        await _wait_for(lambda: len(calls) == 9)
+        assert [(name, text) for name, text, _ in calls] == [
+            ('first', 'a'), ('second', 'a'),
+            ('command', 'x'), ('first', '!hi x'), ('second', '!hi x'),
+            # a failing listener does not stop the rest of the batch
+            ('first', 'b'), ('second', 'b'),
+            ('first', 'c'), ('second', 'c')]
+        # every listener of the frame ran one after another in a single task
+        assert len({task for _, _, task in calls}) == 1
+
+    mock_server.run_chat(test, initial_channel='c1', batch_dispatch=True)
+
+
+def test_batch_is_flushed_per_frame(mock_server, irc):
+    async def test(chat, call):
+        calls = _record_calls(chat)
+        await irc.sockets[0].send_str(_frame('a', 'b'))
+        await _wait_for(lambda: len(calls) == 4)
+        await irc.sockets[0].send_str(_frame('c'))
+        await _wait_for(lambda: len(calls) == 6)
+        await asyncio.sleep(0.1)
+        assert [text for _, text, _ in calls] == ['a', 'a', 'b', 'b', 'c', 'c']
+        # each frame got its own task, no listener ran twice
+        assert len({task for _, _, task in calls[:4]}) == 1
+        assert calls[4][2] is calls[5][2] and calls[4][2] is not calls[0][2]
+
+    mock_server.run_chat(test, initial_channel='c1', batch_dispatch=True)
+
+
+def test_without_batch_every_listener_gets_a_task(mock_server, irc):
+    async def test(chat, call):
+        calls = _record_calls(chat)
+        await irc.sockets[0].send_str(_frame('a', 'b'))
+        await _wait_for(lambda: len(calls) == 4)
+        assert sorted(text for _, text, _ in calls) == ['a', 'a', 'b', 'b']
+        assert len({task for _, _, task in calls}) == 4
+
+    mock_server.run_chat(test, initial_channel='c1')
+
+
+def test_messages_end_when_chat_stops(mock_server, irc):
+    async def test(chat, call):
+        received = []
+
+        async def consume():
+            async for msg in chat.messages():
+                received.append(msg.text)
+
+        consumers = [asyncio.ensure_future(consume()), asyncio.ensure_future(consume())]
+        await _wait_for(lambda: len(chat._message_queues) == 2)
+        await irc.sockets[0].send_str(_frame('a', 'b'))
+        await _wait_for(lambda: len(received) == 4)
+        await asyncio.get_running_loop().run_in_executor(None, chat.stop)
+        await asyncio.wait_for(asyncio.gather(*consumers), 5)
+        assert sorted(received) == ['a', 'a', 'b', 'b']
+        assert chat._message_queues == []
+        assert chat._skip_irc_message(PRIVMSG.format(n=0, text='a'))
+
+    mock_server.run_chat(test, initial_channel='c1')
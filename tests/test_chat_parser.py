@@ -0,0 +1,100 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Equivalence of the IRC parser with the parser it replaced.
+
+``data/chat_parser_golden.json`` holds real world Twitch IRC lines together with the output of the previous parser
+(the one before the lazy tag parsing was introduced). Lines with escaped tag values are not part of the corpus,
+the previous parser did not unescape them."""
+import asyncio
+import json
+import logging
+import os
+
+import pytest
+
+from twitchAPI.chat import Chat, ChatMessage, _plain_parsed
+
+with open(os.path.join(os.path.dirname(__file__), 'data', 'chat_parser_golden.json')) as f:
+    GOLDEN = json.load(f)
+
+
+def _make_parser() -> Chat:
+    # the parser only depends on the logger and the command prefixes
+    chat = object.__new__(Chat)
+    chat.logger = logging.getLogger('twitchAPI.chat')
+    chat._prefix = GOLDEN['command_prefix']
+    chat._channel_command_prefix = GOLDEN['channel_command_prefix']
+    return chat
+
+
+def _normalize(parsed):
+    # the parsed message as handed to user code
+    return _plain_parsed(parsed) if parsed is not None else None
+
+
+@pytest.mark.parametrize('case', GOLDEN['cases'], ids=lambda c: c['line'][:60])
+def test_golden(case):
+    assert _normalize(_make_parser()._parse_irc_message(case['line'])) == case['expected']
+
+
+def test_tags_are_parsed_on_access():
+    parsed = _make_parser()._parse_irc_message(GOLDEN['cases'][0]['line'])
+    expected = GOLDEN['cases'][0]['expected']['tags']
+    assert parsed['tags']['badges'] == expected['badges']
+    assert parsed['tags'].get('missing') is None
+    assert 'client-nonce' not in parsed['tags']
+    assert len(parsed['tags']) == len(expected)
+
+
+def test_escaped_tag_values():
+    line = ('@msg-id=sub;system-msg=ronni\\shas\\ssubscribed\\:\\sx\\\\y;login=x;trail=ab\\ '
+            ':tmi.twitch.tv USERNOTICE #dallas :Great stream')
+    tags = _make_parser()._parse_irc_message(line)['tags']
+    assert tags['system-msg'] == 'ronni has subscribed; x\\y'
+    assert tags['trail'] == 'ab'
+    assert tags['login'] == 'x'
+
+
+def test_tag_attributes_stay_writable():
+    case = next(c for c in GOLDEN['cases'] if ' PRIVMSG ' in c['line'] and c['expected']['tags'].get('bits') is None)
+    msg = ChatMessage(_make_parser(), _make_parser()._parse_irc_message(case['line']))
+    assert msg.bits == 0
+    msg.bits = 100
+    assert msg.bits == 100
+    assert msg.id == case['expected']['tags']['id']
+    user = msg.user
+    user.display_name = 'someone'
+    user.mod = True
+    assert user.display_name == 'someone'
+    assert user.mod is True
+    assert user.id == case['expected']['tags']['user-id']
+
+
+def test_tag_attributes_are_computed_once():
+    line = ('@bits=100;id=abc;pinned-chat-paid-amount=500;pinned-chat-paid-currency=USD;pinned-chat-paid-exponent=2;'
+            'pinned-chat-paid-level=ONE;pinned-chat-paid-is-system-message=0;user-id=1 '
+            ':foo!foo@foo.tmi.twitch.tv PRIVMSG #bar :hello')
+    msg = ChatMessage(_make_parser(), _make_parser()._parse_irc_message(line))
+    assert msg.bits == 100
+    assert msg.hype_chat is msg.hype_chat
+    msg.hype_chat.amount = 1000
+    assert msg.hype_chat.amount == 1000
+
+
+def test_parsed_messages_leave_with_plain_tags():
+    case = next(c for c in GOLDEN['cases'] if ' PRIVMSG ' in c['line'])
+    msg = ChatMessage(_make_parser(), _make_parser()._parse_irc_message(case['line']))
+    assert msg.id == case['expected']['tags']['id']
+    assert type(msg._parsed['tags']) is dict
+    assert json.loads(json.dumps(msg._parsed)) == case['expected']
+    msg._parsed['tags']['id'] = 'changed'
+    assert msg._parsed['tags']['id'] == 'changed'
+
+
+def test_raid_payload_has_plain_tags():
+    chat = _make_parser()
+    events = []
+    chat._emit = lambda event, data: events.append(data)
+    line = '@msg-id=raid;msg-param-viewerCount=10;room-id=1 :tmi.twitch.tv USERNOTICE #bar'
+    asyncio.run(chat._handle_user_notice(chat._parse_irc_message(line)))
+    assert type(events[0]['tags']) is dict
+    assert events[0]['tags']['msg-param-viewerCount'] == '10'
@@ -0,0 +1,63 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Selection and behavior of the JSON codecs"""
+import pytest
+
+from twitchAPI import codec
+from twitchAPI.codec import JSONCodec, OrjsonCodec, MsgspecCodec, get_json_codec
+
+DOCUMENT = {'data': [{'id': '1', 'name': 'ä', 'count': 3, 'ratio': 0.5, 'live': True, 'tags': None}], 'pagination': {}}
+
+BACKENDS = [
+    pytest.param('json', id='json'),
+    pytest.param('orjson', id='orjson', marks=pytest.mark.skipif(codec.orjson is None, reason='orjson is not installed')),
+    pytest.param('msgspec', id='msgspec', marks=pytest.mark.skipif(codec.msgspec is None, reason='msgspec is not installed')),
+]
+
+
+@pytest.mark.parametrize('name', BACKENDS)
+def test_roundtrip(name):
+    c = get_json_codec(name)
+    assert c.name == name
+    encoded = c.dumps(DOCUMENT)
+    assert isinstance(encoded, str)
+    assert c.loads(encoded) == DOCUMENT
+    assert c.loads(encoded.encode('utf-8')) == DOCUMENT
+
+
+@pytest.mark.parametrize('name', BACKENDS)
+def test_invalid_document_raises_value_error(name):
+    c = get_json_codec(name)
+    with pytest.raises(ValueError):
+        c.loads(b'{"data": [')
+
+
+def test_auto_prefers_orjson(monkeypatch):
+    monkeypatch.setattr(codec, 'orjson', object())
+    monkeypatch.setattr(codec, 'msgspec', object())
+    assert type(get_json_codec()) is OrjsonCodec
+
+
+def test_auto_falls_back_to_msgspec(monkeypatch):
+    monkeypatch.setattr(codec, 'orjson', None)
+    monkeypatch.setattr(codec, 'msgspec', object())
+    assert type(get_json_codec()) is MsgspecCodec
+
+
+def test_auto_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(codec, 'orjson', None)
+    monkeypatch.setattr(codec, 'msgspec', None)
+    assert type(get_json_codec('auto')) is JSONCodec
+
+
+def test_missing_backend_raises(monkeypatch):
+    monkeypatch.setattr(codec, 'orjson', None)
+    monkeypatch.setattr(codec, 'msgspec', None)
+    with pytest.raises(RuntimeError):
+        get_json_codec('orjson')
+    with pytest.raises(RuntimeError):
+        get_json_codec('msgspec')
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_json_codec('yaml')
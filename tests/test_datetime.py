@@ -0,0 +1,43 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+import pytest
+from dateutil import parser as du_parser
+
+from twitchAPI.helper import parse_iso_datetime
+
+SAMPLES = [
+    # Helix
+    '2021-03-10T15:04:21Z',
+    '2021-03-10T15:04:21.123Z',
+    '2023-06-01T18:24:30.904845Z',
+    # EventSub, nanosecond precision
+    '2019-11-16T10:11:12.634234626Z',
+    '2020-07-15T17:16:03.17106713Z',
+    '2024-01-01T00:00:00.1Z',
+    # numeric offsets
+    '2024-01-01T00:00:00+00:00',
+    '2024-01-01T00:00:00.123456789+00:00',
+    '2024-01-01T00:00:00.123456789-05:30',
+    '2024-01-01T00:00:00.123456789+0000',
+    '2024-01-01T00:00:00.5-0530',
+    '2024-01-01T00:00:00.123+02',
+    # naive and date only
+    '2024-01-01T00:00:00',
+    '2024-01-01T00:00:00.123456789',
+    '2024-01-01',
+    # basic format
+    '20240101T000000Z',
+]
+
+
+@pytest.mark.parametrize('value', SAMPLES)
+def test_parity_with_isoparse(value):
+    expected = du_parser.isoparse(value)
+    result = parse_iso_datetime(value)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize('value', ['', 'not a date', '2024-13-01T00:00:00Z'])
+def test_invalid(value):
+    with pytest.raises(ValueError):
+        parse_iso_datetime(value)
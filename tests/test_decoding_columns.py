@@ -0,0 +1,75 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Decoding of paginated results into columns, tested against a local Helix mock"""
+from array import array
+from datetime import datetime, timezone
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.object.api import Stream
+from twitchAPI.type import DecodingMode
+
+STREAMS = [
+    {'id': '1', 'user_login': 'a', 'viewer_count': 10, 'is_mature': False, 'started_at': '2021-03-19T06:08:33Z', 'tags': ['English']},
+    {'id': '2', 'user_login': 'b', 'viewer_count': 20, 'is_mature': True, 'started_at': '2021-03-20T06:08:33Z', 'tags': []},
+    # missing keys
+    {'id': '3', 'user_login': 'c', 'viewer_count': 30, 'tags': ['German', 'Chill']},
+]
+
+
+class StreamsMock:
+    """Serves the given streams in pages of 2"""
+
+    async def handle(self, request: web.Request):
+        page = int(request.query.get('after', '0'))
+        data = STREAMS[page * 2:page * 2 + 2]
+        return web.json_response({'data': data, 'pagination': {'cursor': str(page + 1)} if page * 2 + 2 < len(STREAMS) else {}})
+
+
+@pytest.fixture
+def streams(mock_server):
+    mock = StreamsMock()
+    mock_server.router.add_get('/streams', mock.handle)
+    return mock
+
+
+def test_columns_of_a_page():
+    columns = Stream._build_columns(STREAMS)
+    # every documented field gets a column
+    assert sorted(columns.keys()) == sorted(Stream._get_annotations().keys())
+    assert columns['id'] == ['1', '2', '3']
+    assert columns['viewer_count'] == array('q', [10, 20, 30])
+    assert columns['tags'] == [['English'], [], ['German', 'Chill']]
+    assert columns['started_at'] == [datetime(2021, 3, 19, 6, 8, 33, tzinfo=timezone.utc),
+                                     datetime(2021, 3, 20, 6, 8, 33, tzinfo=timezone.utc),
+                                     None]
+    # a missing value keeps the column a plain list
+    assert columns['is_mature'] == [False, True, None]
+    assert not isinstance(columns['is_mature'], array)
+    assert columns['game_id'] == [None, None, None]
+
+
+def test_columns_of_all_bool_values():
+    columns = Stream._build_columns(STREAMS[:2])
+    assert columns['is_mature'] == array('b', [False, True])
+
+
+def test_columns_of_an_empty_page():
+    columns = Stream._build_columns([])
+    assert columns['id'] == []
+    assert len(columns['viewer_count']) == 0
+
+
+def test_paginated_call_yields_one_batch_per_page(mock_server, streams):
+    async def test(twitch):
+        with twitch.decoding(DecodingMode.COLUMNS):
+            pages = [p async for p in twitch.get_streams()]
+        assert len(pages) == 2
+        assert pages[0]['user_login'] == ['a', 'b']
+        assert pages[0]['viewer_count'] == array('q', [10, 20])
+        assert pages[1]['user_login'] == ['c']
+        assert pages[1]['is_mature'] == [None]
+        # the mode only applies within the context
+        assert [s.id async for s in twitch.get_streams()] == ['1', '2', '3']
+
+    mock_server.run_helix(test)
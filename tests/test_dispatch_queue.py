@@ -0,0 +1,197 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Overflow policies and spill replay of DispatchQueue"""
+import asyncio
+import os
+import threading
+
+from twitchAPI.eventsub.dispatch import DispatchQueue
+from twitchAPI.type import OverflowPolicy
+
+
+class Handler:
+    """Records payloads, blocks until released"""
+
+    def __init__(self):
+        self.handled = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, payload):
+        await self.release.wait()
+        self.handled.append(payload)
+
+
+async def _drain(queue: DispatchQueue, handler: Handler, count: int):
+    handler.release.set()
+    for _ in range(200):
+        if len(handler.handled) >= count and queue.in_flight == 0:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def _fill(policy: OverflowPolicy, count: int, **kwargs):
+    """puts 0..count-1 into a queue of size 2 with one worker, the worker holds payload 0 until drained"""
+    handler = Handler()
+    queue = DispatchQueue(handler, max_size=2, concurrency=1, overflow_policy=policy, **kwargs)
+    queue.put_nowait(0)
+    # let the worker take the first payload
+    await asyncio.sleep(0)
+    results = [queue.put_nowait(i) for i in range(1, count)]
+    return queue, handler, results
+
+
+def test_drop_oldest():
+    async def main():
+        queue, handler, results = await _fill(OverflowPolicy.DROP_OLDEST, 6)
+        assert results == [True] * 5
+        assert queue.dropped == 3
+        await _drain(queue, handler, 3)
+        assert handler.handled == [0, 4, 5]
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_drop_newest():
+    async def main():
+        queue, handler, results = await _fill(OverflowPolicy.DROP_NEWEST, 6)
+        assert results == [True] * 5
+        assert queue.dropped == 3
+        await _drain(queue, handler, 3)
+        assert handler.handled == [0, 1, 2]
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_block_put_nowait_refuses():
+    async def main():
+        queue, handler, results = await _fill(OverflowPolicy.BLOCK, 4)
+        assert results == [True, True, False]
+        assert queue.dropped == 0
+        assert queue.depth == 2
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_block_put_waits_and_keeps_order():
+    async def main():
+        queue, handler, _ = await _fill(OverflowPolicy.BLOCK, 3)
+        puts = [asyncio.ensure_future(queue.put(i)) for i in range(3, 6)]
+        await asyncio.sleep(0.05)
+        assert not any(p.done() for p in puts)
+        await _drain(queue, handler, 6)
+        assert all(p.done() for p in puts)
+        assert handler.handled == [0, 1, 2, 3, 4, 5]
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_spill_replays_in_order(tmp_path):
+    path = str(tmp_path / 'spill.jsonl')
+
+    async def main():
+        queue, handler, results = await _fill(OverflowPolicy.SPILL_TO_DISK, 8, spill_path=path)
+        assert results == [True] * 7
+        assert queue.spilled == 5
+        assert queue.depth == 7
+        await _drain(queue, handler, 8)
+        assert handler.handled == list(range(8))
+        assert queue.depth == 0
+        # spilled again after the file was emptied
+        handler.release.clear()
+        queue.put_nowait({'a': 1})
+        await asyncio.sleep(0)
+        for i in range(5):
+            queue.put_nowait({'b': i})
+        await _drain(queue, handler, 14)
+        assert handler.handled[8:] == [{'a': 1}] + [{'b': i} for i in range(5)]
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_spill_io_runs_off_loop(tmp_path):
+    path = str(tmp_path / 'spill.jsonl')
+
+    async def main():
+        queue, handler, _ = await _fill(OverflowPolicy.SPILL_TO_DISK, 3, spill_path=path)
+        threads = []
+        write = queue._write_spilled
+
+        def tracked_write(line):
+            threads.append(threading.get_ident())
+            write(line)
+
+        queue._write_spilled = tracked_write
+        queue.put_nowait(3)
+        await _drain(queue, handler, 4)
+        assert handler.handled == [0, 1, 2, 3]
+        assert threads and threading.get_ident() not in threads
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_close_removes_temporary_spill_file():
+    async def main():
+        queue, handler, _ = await _fill(OverflowPolicy.SPILL_TO_DISK, 5)
+        # wait for the writes
+        await asyncio.get_running_loop().run_in_executor(queue._spill_executor(), lambda: None)
+        path = queue._spill_file_path
+        assert path is not None and os.path.exists(path)
+        executor = queue._executor
+        queue.close()
+        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+        assert not os.path.exists(path)
+
+    asyncio.run(main())
+
+
+def test_failed_spill_writes_are_dropped(tmp_path):
+    # the spill file can not be created, every write fails
+    path = str(tmp_path / 'missing' / 'spill.jsonl')
+
+    async def main():
+        queue, handler, results = await _fill(OverflowPolicy.SPILL_TO_DISK, 8, spill_path=path)
+        assert results == [True] * 7
+        await _drain(queue, handler, 3)
+        await asyncio.sleep(0.05)
+        assert handler.handled == [0, 1, 2]
+        assert queue.dropped == 5
+        assert queue.depth == 0
+        # the workers keep running
+        queue.put_nowait(8)
+        await _drain(queue, handler, 4)
+        assert handler.handled == [0, 1, 2, 8]
+        queue.close()
+
+    asyncio.run(main())
+
+
+def test_single_failed_spill_write_only_drops_its_payload(tmp_path):
+    path = str(tmp_path / 'spill.jsonl')
+
+    async def main():
+        handler = Handler()
+        queue = DispatchQueue(handler, max_size=2, concurrency=1, overflow_policy=OverflowPolicy.SPILL_TO_DISK, spill_path=path)
+        write = queue._write_spilled
+
+        def failing_write(line):
+            if queue._json_codec.loads(line)[1] == 4:
+                raise OSError('disk full')
+            write(line)
+
+        queue._write_spilled = failing_write
+        queue.put_nowait(0)
+        await asyncio.sleep(0)
+        for i in range(1, 8):
+            queue.put_nowait(i)
+        await _drain(queue, handler, 7)
+        assert handler.handled == [0, 1, 2, 3, 5, 6, 7]
+        assert queue.dropped == 1
+        assert queue.depth == 0
+        queue.close()
+
+    asyncio.run(main())
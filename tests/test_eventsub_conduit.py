@@ -0,0 +1,134 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Subscriptions of EventSubConduit, tested against a local Helix mock"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.eventsub.base import EventSubSessionBase
+from twitchAPI.eventsub.conduit import EventSubConduit, _ConduitWebsocketShard
+from twitchAPI.twitch import Twitch
+from twitchAPI.type import EventSubSubscriptionConflict, UnauthorizedException
+
+CONDUIT_ID = 'conduit-1'
+
+
+def _sub(sub_id: str, sub_type: str, condition: dict, conduit_id: str = CONDUIT_ID) -> dict:
+    return {'id': sub_id, 'status': 'enabled', 'type': sub_type, 'version': '1', 'condition': condition,
+            'created_at': '2024-01-01T00:00:00Z', 'transport': {'method': 'conduit', 'conduit_id': conduit_id}, 'cost': 0}
+
+
+class HelixMock:
+    """Creates subscriptions unless one with the same type and condition exists, lists them filtered like Twitch does"""
+
+    def __init__(self):
+        self.subs = []
+        self.list_queries = []
+
+    async def create(self, request: web.Request):
+        body = await request.json()
+        if any(s['type'] == body['type'] and s['condition'] == body['condition'] for s in self.subs):
+            return web.json_response({'error': 'Conflict', 'status': 409, 'message': 'subscription already exists'}, status=409)
+        sub = _sub(f'new-{len(self.subs)}', body['type'], body['condition'], body['transport']['conduit_id'])
+        self.subs.append(sub)
+        return web.json_response({'data': [sub], 'total': len(self.subs), 'total_cost': 0, 'max_total_cost': 10000}, status=202)
+
+    async def list(self, request: web.Request):
+        self.list_queries.append(dict(request.query))
+        subs = self.subs
+        if 'user_id' in request.query:
+            subs = [s for s in subs if request.query['user_id'] in s['condition'].values()]
+        if 'type' in request.query:
+            subs = [s for s in subs if s['type'] == request.query['type']]
+        return web.json_response({'data': subs, 'total': len(subs), 'total_cost': 0, 'max_total_cost': 10000, 'pagination': {}})
+
+    async def validate(self, request: web.Request):
+        return web.json_response({'client_id': 'id', 'scopes': [], 'expires_in': 3600})
+
+
+@pytest.fixture
+def helix(mock_server):
+    mock = HelixMock()
+    mock_server.router.add_post('/eventsub/subscriptions', mock.create)
+    mock_server.router.add_get('/eventsub/subscriptions', mock.list)
+    mock_server.router.add_get('/oauth2/validate', mock.validate)
+    return mock
+
+
+def _run_conduit(mock_server, test):
+    """runs ``test(conduit)`` with a conduit that uses a Twitch instance talking to the mock server"""
+
+    async def main(twitch):
+        await test(EventSubConduit(twitch, conduit_id=CONDUIT_ID))
+
+    mock_server.run_helix(main)
+
+
+async def _callback(_):
+    pass
+
+
+def test_new_subscription(mock_server, helix):
+    async def test(conduit):
+        sub_id = await conduit.listen_stream_online('1', _callback)
+        assert sub_id == 'new-0'
+        assert sub_id in conduit._callbacks
+        assert helix.list_queries == []
+
+    _run_conduit(mock_server, test)
+
+
+def test_conflict_reuses_subscription_filtered_by_user(mock_server, helix):
+    existing = [_sub(f'other-{i}', 'stream.online', {'broadcaster_user_id': str(100 + i)}) for i in range(50)]
+    existing.append(_sub('other-conduit', 'stream.online', {'broadcaster_user_id': '1'}, conduit_id='conduit-2'))
+    existing.append(_sub('offline', 'stream.offline', {'broadcaster_user_id': '1'}))
+    existing.append(_sub('online', 'stream.online', {'broadcaster_user_id': '1'}))
+
+    async def test(conduit):
+        assert await conduit.listen_stream_online('1', _callback) == 'online'
+        assert helix.list_queries == [{'user_id': '1'}]
+        assert 'online' in conduit._callbacks
+
+    helix.subs.extend(existing)
+    _run_conduit(mock_server, test)
+
+
+def test_conflict_without_user_filters_by_type(mock_server, helix):
+    existing = [_sub('grant', 'user.authorization.grant', {'client_id': 'id'})]
+
+    async def test(conduit):
+        assert await conduit.listen_user_authorization_grant('id', _callback) == 'grant'
+        assert helix.list_queries == [{'type': 'user.authorization.grant'}]
+
+    helix.subs.extend(existing)
+    _run_conduit(mock_server, test)
+
+
+def test_conflict_with_unknown_subscription(mock_server, helix):
+    # the conflicting subscription belongs to a different conduit
+    existing = [_sub('elsewhere', 'stream.online', {'broadcaster_user_id': '1'}, conduit_id='conduit-2')]
+
+    async def test(conduit):
+        with pytest.raises(EventSubSubscriptionConflict):
+            await conduit.listen_stream_online('1', _callback)
+
+    helix.subs.extend(existing)
+    _run_conduit(mock_server, test)
+
+
+def test_websocket_shard_requires_app_auth():
+    async def main():
+        twitch = Twitch('id', authenticate_app=False)
+        conduit = EventSubConduit(twitch, conduit_id=CONDUIT_ID)
+        shard = _ConduitWebsocketShard(conduit, '0', None)
+        with pytest.raises(UnauthorizedException, match='app authentication'):
+            shard.start()
+        await twitch.close()
+
+    asyncio.run(main())
+
+
+def test_conduit_has_no_session_members():
+    assert not issubclass(EventSubConduit, EventSubSessionBase)
+    assert not hasattr(EventSubConduit, 'enable_dispatch_queue')
+    assert issubclass(_ConduitWebsocketShard, EventSubSessionBase)
@@ -0,0 +1,252 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Incoming notifications of EventSubWebhook, posted to its aiohttp application"""
+import asyncio
+import hashlib
+import hmac
+import json
+import multiprocessing
+import os
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer, TestClient
+
+from twitchAPI.eventsub.webhook import EventSubWebhook, _SharedMessageIdHistory
+from twitchAPI.object.eventsub import Subscription
+from twitchAPI.twitch import Twitch
+from twitchAPI.type import OverflowPolicy
+
+SUB_ID = 'sub-1'
+
+
+def _headers(secret: str, msg_id: str, body: bytes, msg_type: str = 'notification', sub_type: str = 'test') -> dict:
+    timestamp = '2024-01-01T00:00:00Z'
+    sig = hmac.new(secret.encode('utf-8'), msg_id.encode('utf-8') + timestamp.encode('utf-8') + body, hashlib.sha256).hexdigest()
+    return {
+        'Twitch-Eventsub-Message-Id': msg_id,
+        'Twitch-Eventsub-Message-Type': msg_type,
+        'Twitch-Eventsub-Message-Timestamp': timestamp,
+        'Twitch-Eventsub-Message-Signature': f'sha256={sig}',
+        'Twitch-Eventsub-Subscription-Type': sub_type,
+        'Twitch-Eventsub-Subscription-Version': '1',
+    }
+
+
+def _body(num: int, sub_id: str = SUB_ID) -> bytes:
+    return json.dumps({'subscription': {'id': sub_id}, 'event': {'num': num}}).encode('utf-8')
+
+
+class _Event:
+    def __init__(self, subscription: dict, event: dict, metadata: dict):
+        self.subscription = Subscription(**subscription)
+        self.num = event['num']
+        # the process that built this event
+        self.pid = os.getpid()
+
+
+class _OtherEvent(_Event):
+    pass
+
+
+def _run_webhook(test, **kwargs):
+    """runs ``test(hook, client, received, release)`` against the callback application of a webhook that is not started"""
+
+    async def main():
+        twitch = Twitch('id', authenticate_app=False)
+        hook = EventSubWebhook('https://example.com', 0, twitch, **kwargs)
+        received = []
+        release = asyncio.Event()
+
+        async def callback(event: _Event):
+            await release.wait()
+            received.append(event.num)
+
+        hook._callback_loop = asyncio.get_running_loop()
+        hook._add_callback(SUB_ID, callback, _Event)
+        client = TestClient(TestServer(hook._EventSubWebhook__build_runner().app))
+        await client.start_server()
+        try:
+            await test(hook, client, received, release)
+        finally:
+            await client.close()
+            if hook.dispatch_queue is not None:
+                hook.dispatch_queue.close()
+            await twitch.close()
+
+    asyncio.run(main())
+
+
+async def _post(hook: EventSubWebhook, client: TestClient, msg_id: str, body: bytes) -> int:
+    r = await client.post('/callback', data=body, headers=_headers(hook.secret, msg_id, body))
+    return r.status
+
+
+async def _wait_for(received: list, count: int):
+    for _ in range(200):
+        if len(received) >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_full_queue_asks_for_redelivery():
+    async def test(hook, client, received, release):
+        hook.enable_dispatch_queue(max_size=1, concurrency=1, overflow_policy=OverflowPolicy.BLOCK)
+        assert await _post(hook, client, 'm0', _body(0)) == 200
+        await asyncio.sleep(0.05)
+        assert await _post(hook, client, 'm1', _body(1)) == 200
+        assert await _post(hook, client, 'm2', _body(2)) == 503
+        release.set()
+        await _wait_for(received, 2)
+        # the redelivered message is not treated as a duplicate
+        assert await _post(hook, client, 'm2', _body(2)) == 200
+        await _wait_for(received, 3)
+        assert received == [0, 1, 2]
+
+    _run_webhook(test)
+
+
+def test_full_queue_drops_oldest():
+    async def test(hook, client, received, release):
+        queue = hook.enable_dispatch_queue(max_size=1, concurrency=1, overflow_policy=OverflowPolicy.DROP_OLDEST)
+        assert await _post(hook, client, 'm0', _body(0)) == 200
+        await asyncio.sleep(0.05)
+        for i in range(1, 4):
+            assert await _post(hook, client, f'm{i}', _body(i)) == 200
+        release.set()
+        await _wait_for(received, 2)
+        assert received == [0, 3]
+        assert queue.dropped == 2
+
+    _run_webhook(test)
+
+
+def test_full_queue_drops_newest():
+    async def test(hook, client, received, release):
+        queue = hook.enable_dispatch_queue(max_size=1, concurrency=1, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        assert await _post(hook, client, 'm0', _body(0)) == 200
+        await asyncio.sleep(0.05)
+        for i in range(1, 4):
+            assert await _post(hook, client, f'm{i}', _body(i)) == 200
+        release.set()
+        await _wait_for(received, 2)
+        assert received == [0, 1]
+        assert queue.dropped == 2
+
+    _run_webhook(test)
+
+
+def test_block_rejected_with_workers():
+    async def test(hook, client, received, release):
+        with pytest.raises(ValueError):
+            hook.enable_dispatch_queue(overflow_policy=OverflowPolicy.BLOCK)
+        hook.enable_dispatch_queue(overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+    _run_webhook(test, worker_processes=2)
+
+
+def test_malformed_body_is_not_remembered():
+    async def test(hook, client, received, release):
+        release.set()
+        assert await _post(hook, client, 'm0', b'{not json') == 400
+        # the redelivery with the same id is handled
+        assert await _post(hook, client, 'm0', _body(0)) == 200
+        await _wait_for(received, 1)
+        # an actual duplicate is not
+        assert await _post(hook, client, 'm0', _body(0)) == 200
+        await asyncio.sleep(0.05)
+        assert received == [0]
+
+    _run_webhook(test)
+
+
+def test_shared_message_id_history():
+    ctx = multiprocessing.get_context('spawn')
+    history = _SharedMessageIdHistory(ctx, 2)
+    assert history.add('m0')
+    assert history.add('m1')
+    assert not history.add('m0')
+    # pushes out the oldest id
+    assert history.add('m2')
+    assert history.add('m0')
+    assert not history.add('m2')
+    no_history = _SharedMessageIdHistory(ctx, 0)
+    assert no_history.add('m0')
+    assert no_history.add('m0')
+
+
+def _run_workers(test, port: int):
+    """runs ``test(hook, received)`` against a webhook with 2 worker processes, ``received`` holds the events passed to the callbacks"""
+
+    async def main():
+        twitch = Twitch('id', authenticate_app=False)
+        hook = EventSubWebhook('https://example.com', port, twitch, host_binding='127.0.0.1', worker_processes=2)
+        hook.unsubscribe_on_stop = False
+        received = []
+
+        async def callback(event: _Event):
+            received.append(event)
+
+        hook._add_callback(SUB_ID, callback, _Event)
+        hook._add_callback('sub-2', callback, _OtherEvent)
+        await asyncio.get_running_loop().run_in_executor(None, hook.start)
+        try:
+            await test(hook, received)
+        finally:
+            await hook.stop()
+            await twitch.close()
+
+    asyncio.run(main())
+
+
+async def _post_to_workers(hook: EventSubWebhook, port: int, msg_id: str, num: int, sub_id: str = SUB_ID, sub_type: str = 'test'):
+    body = _body(num, sub_id)
+    # a new connection for every message, so the messages get spread over the workers
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f'http://127.0.0.1:{port}/callback', data=body,
+                                headers=_headers(hook.secret, msg_id, body, sub_type=sub_type)) as r:
+            assert r.status == 200
+
+
+def test_worker_processes_decode_and_deduplicate_once():
+    async def test(hook, received):
+        for _ in range(2):
+            for i in range(10):
+                await _post_to_workers(hook, 18191, f'm{i}', i)
+        await _wait_for(received, 10)
+        await asyncio.sleep(0.2)
+        assert sorted(e.num for e in received) == list(range(10))
+        # without a known event type, the workers hand over the data and the event is built here
+        assert all(e.pid == os.getpid() for e in received)
+
+    _run_workers(test, 18191)
+
+
+def test_worker_processes_build_events_by_subscription_type():
+    async def test(hook, received):
+        hook._register_event_type('test', '1', _Event)
+        hook._register_event_type('other', '1', _OtherEvent)
+        await _post_to_workers(hook, 18192, 'm0', 0)
+        await _post_to_workers(hook, 18192, 'm1', 1, sub_id='sub-2', sub_type='other')
+        await _post_to_workers(hook, 18192, 'm1', 1, sub_id='sub-2', sub_type='other')
+        await _wait_for(received, 2)
+        await asyncio.sleep(0.2)
+        assert sorted((type(e).__name__, e.num) for e in received) == [('_Event', 0), ('_OtherEvent', 1)]
+        assert all(e.pid != os.getpid() for e in received)
+
+    _run_workers(test, 18192)
+
+
+def test_worker_processes_hand_over_data_when_spilling_to_disk():
+    async def test(hook, received):
+        hook._register_event_type('test', '1', _Event)
+        hook.enable_dispatch_queue(overflow_policy=OverflowPolicy.SPILL_TO_DISK)
+        await _post_to_workers(hook, 18193, 'm0', 0)
+        await _wait_for(received, 1)
+        # event objects can not be written to disk, so the event is built here
+        assert [(e.num, e.pid) for e in received] == [(0, os.getpid())]
+        hook.enable_dispatch_queue(overflow_policy=OverflowPolicy.DROP_OLDEST)
+        await _post_to_workers(hook, 18193, 'm1', 1)
+        await _wait_for(received, 2)
+        assert received[1].num == 1 and received[1].pid != os.getpid()
+
+    _run_workers(test, 18193)
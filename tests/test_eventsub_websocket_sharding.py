@@ -0,0 +1,177 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Placement of subscriptions on the shards of ShardedEventSubWebsocket, tested against a local EventSub websocket and Helix mock"""
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.eventsub.websocket import ShardedEventSubWebsocket
+from twitchAPI.twitch import Twitch
+from twitchAPI.type import AuthScope, EventSubSubscriptionError
+
+
+class EventSubMock:
+    """Opens a websocket session per connection and creates subscriptions on them, conditions listed in ``failing`` are rejected"""
+
+    def __init__(self):
+        self.sessions = 0
+        self.created = []
+        self.deleted = []
+        self.failing = set()
+
+    async def websocket(self, request: web.Request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sessions += 1
+        await ws.send_str(json.dumps({'metadata': {'message_type': 'session_welcome'},
+                                      'payload': {'session': {'id': f'session-{self.sessions}', 'status': 'connected',
+                                                              'keepalive_timeout_seconds': 600, 'reconnect_url': None}}}))
+        async for _ in ws:
+            pass
+        return ws
+
+    async def create(self, request: web.Request):
+        body = await request.json()
+        user = body['condition']['broadcaster_user_id']
+        if user in self.failing:
+            return web.json_response({'error': 'Bad Request', 'status': 400, 'message': 'rejected'}, status=400)
+        sub_id = f'sub-{len(self.created)}'
+        self.created.append((sub_id, user, body['transport']['session_id']))
+        return web.json_response({'data': [{'id': sub_id}], 'total': 0, 'total_cost': 0, 'max_total_cost': 10}, status=202)
+
+    async def delete(self, request: web.Request):
+        self.deleted.append(request.query['id'])
+        return web.Response(status=204)
+
+
+@pytest.fixture
+def eventsub(mock_server):
+    mock = EventSubMock()
+    mock_server.router.add_get('/ws', mock.websocket)
+    mock_server.router.add_post('/eventsub/subscriptions', mock.create)
+    mock_server.router.add_delete('/eventsub/subscriptions', mock.delete)
+    return mock
+
+
+def _run_sharded(mock_server, test, **kwargs):
+    """starts a ShardedEventSubWebsocket against the mock server, runs ``test(manager)`` and stops it again"""
+
+    async def main():
+        twitch = Twitch('id', authenticate_app=False, base_url=mock_server.url)
+        twitch.auto_refresh_auth = False
+        await twitch.set_user_authentication('token', [AuthScope.CHANNEL_READ_SUBSCRIPTIONS], validate=False)
+
+        async def get_token():
+            return 'token'
+
+        twitch.get_refreshed_user_auth_token = get_token
+        manager = ShardedEventSubWebsocket(twitch, connection_url=mock_server.url + 'ws', subscription_url=mock_server.url, **kwargs)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, manager.start)
+        try:
+            await test(manager)
+        finally:
+            if manager._running:
+                await manager.stop()
+            await twitch.close()
+
+    mock_server.run(main)
+
+
+async def _callback(_):
+    pass
+
+
+async def _on_shard(shard, coro):
+    """runs coro on the loop of the given shard"""
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, shard._socket_loop))
+
+
+async def _wait_closed(shard):
+    for _ in range(100):
+        if shard._socket_loop.is_closed():
+            return
+        await asyncio.sleep(0.05)
+
+
+def _subs_per_shard(manager):
+    return [sorted(s['condition']['broadcaster_user_id'] for s in shard._active_subscriptions.values()) for shard in manager.shards]
+
+
+def test_default_limits():
+    manager = ShardedEventSubWebsocket(Twitch('id', authenticate_app=False))
+    assert manager.max_subscriptions_per_shard == 300
+    assert manager.max_shards == 3
+
+
+def test_subscriptions_fill_shards_up_to_the_limit(mock_server, eventsub):
+    async def test(manager):
+        for user in range(6):
+            await manager.listen_stream_online(str(user), _callback)
+        assert len(manager.shards) == 3
+        assert eventsub.sessions == 3
+        assert sorted(len(s) for s in _subs_per_shard(manager)) == [2, 2, 2]
+        # every subscription was created on the session of its shard
+        sessions = {shard.active_session.id: shard for shard in manager.shards}
+        for sub_id, user, session in eventsub.created:
+            assert sub_id in sessions[session]._active_subscriptions
+        with pytest.raises(EventSubSubscriptionError):
+            await manager.listen_stream_online('6', _callback)
+        assert len(manager.shards) == 3
+
+    _run_sharded(mock_server, test, max_subscriptions_per_shard=2, max_shards=3)
+
+
+def test_failed_shard_moves_subscriptions(mock_server, eventsub):
+    async def test(manager):
+        for user in range(3):
+            await manager.listen_stream_online(str(user), _callback)
+        failed = [s for s in manager.shards if len(s._active_subscriptions) == 1][0]
+        moved = list(failed._active_subscriptions.values())[0]['condition']['broadcaster_user_id']
+        await _on_shard(failed, manager._handle_shard_failure(failed))
+        assert failed not in manager.shards
+        # the remaining shard is full, the subscription got a new shard
+        assert len(manager.shards) == 2
+        assert sorted(u for s in _subs_per_shard(manager) for u in s) == ['0', '1', '2']
+        assert eventsub.created[-1][1] == moved
+        assert eventsub.created[-1][2] == f'session-{eventsub.sessions}'
+        await _wait_closed(failed)
+        assert failed._socket_loop.is_closed()
+
+    _run_sharded(mock_server, test, max_subscriptions_per_shard=2, max_shards=3)
+
+
+def test_failed_resubscribe_drops_stale_ids(mock_server, eventsub):
+    async def test(manager):
+        ids = [await manager.listen_stream_online(str(user), _callback) for user in range(2)]
+        shard = manager.shards[0]
+        assert sorted(shard._callbacks.keys()) == sorted(ids)
+        eventsub.failing.add('1')
+        await _on_shard(shard, shard._resubscribe())
+        # the old ids are gone, the working subscription got a new one on this shard
+        new_id = eventsub.created[-1][0]
+        assert sorted(shard._callbacks.keys()) == [new_id]
+        assert list(shard._active_subscriptions.keys()) == [new_id]
+        assert all(i not in s._callbacks for s in manager.shards for i in ids)
+
+    _run_sharded(mock_server, test, max_subscriptions_per_shard=2, max_shards=3)
+
+
+def test_empty_shard_is_released(mock_server, eventsub):
+    async def test(manager):
+        ids = [await manager.listen_stream_online(str(user), _callback) for user in range(3)]
+        assert len(manager.shards) == 2
+        second = manager._find_shard(ids[2])
+        assert await manager.unsubscribe_topic(ids[2])
+        assert eventsub.deleted == [ids[2]]
+        assert second not in manager.shards and len(manager.shards) == 1
+        await _wait_closed(second)
+        assert second._socket_loop.is_closed()
+        # the last shard stays open even without subscriptions
+        for sub_id in ids[:2]:
+            assert await manager.unsubscribe_topic(sub_id)
+        assert len(manager.shards) == 1
+        assert manager.shards[0]._running
+
+    _run_sharded(mock_server, test, max_subscriptions_per_shard=2, max_shards=3)
@@ -0,0 +1,149 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Merging of concurrent user and stream lookups, tested against a local Helix mock"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.cache import ResponseCache
+from twitchAPI.helper import first
+from twitchAPI.twitch import Twitch
+from twitchAPI.type import TwitchAPIException, DecodingMode
+
+
+class HelixMock:
+    """Answers Get Users and Get Streams, logins containing a ``!`` are rejected like Twitch does with malformed logins"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def handle(self, request: web.Request):
+        self.calls.append(request.path_qs)
+        q = request.query
+        if request.path.endswith('/users'):
+            logins = q.getall('login', [])
+            if any('!' in login for login in logins):
+                return web.json_response({'error': 'Bad Request', 'status': 400, 'message': 'Invalid login names'}, status=400)
+            data = [{'id': i, 'login': f'user{i}', 'display_name': f'User{i}'} for i in q.getall('id', [])]
+            data += [{'id': f'id_{login}', 'login': login, 'display_name': login} for login in logins]
+            return web.json_response({'data': data})
+        if request.path.endswith('/streams'):
+            data = [{'id': u, 'user_id': u, 'viewer_count': int(u), 'type': 'live'} for u in q.getall('user_id', [])]
+            return web.json_response({'data': data, 'pagination': {}})
+        return web.json_response({'data': []})
+
+
+@pytest.fixture
+def helix(mock_server):
+    mock = HelixMock()
+    mock_server.router.add_route('*', '/{tail:.*}', mock.handle)
+    return mock
+
+
+async def _login(twitch: Twitch, login: str):
+    user = await first(twitch.get_users(logins=[login]))
+    return user.login if user is not None else None
+
+
+def test_merging_is_off_by_default(mock_server, helix):
+    async def test(twitch):
+        assert await asyncio.gather(*[_login(twitch, f'a{i}') for i in range(3)]) == ['a0', 'a1', 'a2']
+        assert len(helix.calls) == 3
+
+    mock_server.run_helix(test)
+
+
+def test_concurrent_lookups_are_merged(mock_server, helix):
+    async def test(twitch):
+        twitch.lookup_batch_window = 0
+        assert await asyncio.gather(*[_login(twitch, f'a{i}') for i in range(3)]) == ['a0', 'a1', 'a2']
+        assert len(helix.calls) == 1
+        streams = await asyncio.gather(*[first(twitch.get_streams(user_id=[str(i)])) for i in range(1, 4)])
+        assert [s.user_id for s in streams] == ['1', '2', '3']
+        assert len(helix.calls) == 2
+
+    mock_server.run_helix(test)
+
+
+def test_invalid_login_only_fails_its_caller(mock_server, helix):
+    async def test(twitch):
+        twitch.lookup_batch_window = 0
+        results = await asyncio.gather(_login(twitch, 'a'), _login(twitch, 'in!valid'), _login(twitch, 'b'), return_exceptions=True)
+        assert results[0] == 'a'
+        assert isinstance(results[1], TwitchAPIException)
+        assert results[2] == 'b'
+        # the merged request and one retry per caller
+        assert len(helix.calls) == 4
+
+    mock_server.run_helix(test)
+
+
+def test_single_caller_error_is_not_retried(mock_server, helix):
+    async def test(twitch):
+        twitch.lookup_batch_window = 0
+        with pytest.raises(TwitchAPIException):
+            await _login(twitch, 'in!valid')
+        assert len(helix.calls) == 1
+
+    mock_server.run_helix(test)
+
+
+def test_merged_lookups_use_response_cache(mock_server, helix):
+    async def test(twitch):
+        twitch.response_cache = ResponseCache()
+        twitch.lookup_batch_window = 0
+        assert await asyncio.gather(_login(twitch, 'a'), _login(twitch, 'b')) == ['a', 'b']
+        assert len(helix.calls) == 1
+        # answered from the cache, merged or not
+        assert await _login(twitch, 'a') == 'a'
+        twitch.lookup_batch_window = None
+        assert await _login(twitch, 'b') == 'b'
+        assert len(helix.calls) == 1
+        # a not merged lookup fills the cache for merged ones as well
+        assert await _login(twitch, 'c') == 'c'
+        twitch.lookup_batch_window = 0
+        assert await _login(twitch, 'c') == 'c'
+        assert len(helix.calls) == 2
+
+    mock_server.run_helix(test)
+
+
+def test_raw_results_are_not_shared(mock_server, helix):
+    async def test(twitch):
+        twitch.response_cache = ResponseCache()
+        twitch.decoding_mode = DecodingMode.RAW
+
+        async def get(login):
+            return await first(twitch.get_users(logins=[login]))
+
+        # coalesced identical requests
+        a, b = await asyncio.gather(get('a'), get('a'))
+        assert len(helix.calls) == 1
+        a['login'] = 'changed'
+        assert b['login'] == 'a'
+        # answered from the response cache
+        assert (await get('a'))['login'] == 'a'
+        assert len(helix.calls) == 1
+        # merged lookups of the same user
+        twitch.lookup_batch_window = 0
+        c, d = await asyncio.gather(get('c'), get('c'))
+        c['login'] = 'changed'
+        assert d['login'] == 'c'
+        assert (await get('c'))['login'] == 'c'
+
+    mock_server.run_helix(test)
+
+
+def test_streams_larger_than_first_are_not_merged(mock_server, helix):
+    async def test(twitch):
+        twitch.lookup_batch_window = 0
+        streams = [s async for s in twitch.get_streams(user_id=['1', '2', '3'], first=2)]
+        assert sorted(s.user_id for s in streams) == ['1', '2', '3']
+        assert len(helix.calls) == 1
+        assert 'first=2' in helix.calls[0]
+        # fits into a single page, merged with the other lookup
+        await asyncio.gather(first(twitch.get_streams(user_id=['4'], first=1)), first(twitch.get_streams(user_id=['5', '6'])))
+        assert len(helix.calls) == 2
+        assert 'first=100' in helix.calls[1]
+
+    mock_server.run_helix(test)
@@ -0,0 +1,153 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Decoding of raw API data into TwitchObjects"""
+import copy
+import inspect
+from datetime import datetime
+from enum import Enum
+from typing import Union
+
+import pytest
+
+from twitchAPI.object import api, eventsub
+from twitchAPI.object.api import Poll
+from twitchAPI.object.base import TwitchObject, AsyncIterTwitchObject
+
+POLL = {
+    'id': 'poll-1',
+    'broadcaster_id': '141981764',
+    'broadcaster_name': 'TwitchDev',
+    'broadcaster_login': 'twitchdev',
+    'title': 'Heads or Tails?',
+    'choices': [{'id': 'c1', 'title': 'Heads', 'votes': 3, 'channel_point_votes': 0},
+                {'id': 'c2', 'title': 'Tails', 'votes': 5, 'channel_point_votes': 2}],
+    'channel_point_voting_enabled': False,
+    'channel_points_per_vote': 0,
+    'status': 'ACTIVE',
+    'duration': 1800,
+    'started_at': '2021-03-19T06:08:33.871278372Z',
+    'unknown_field': 'ignored',
+}
+
+
+@pytest.fixture
+def lazy(monkeypatch):
+    monkeypatch.setattr(Poll, 'lazy_decoding', True)
+
+
+def _eager() -> Poll:
+    Poll.lazy_decoding = False
+    try:
+        return Poll(**copy.deepcopy(POLL))
+    finally:
+        Poll.lazy_decoding = True
+
+
+def test_lazy_object_drops_decoded_raw_data(lazy):
+    poll = Poll(**copy.deepcopy(POLL))
+    assert list(vars(poll).keys()) == ['_lazy_raw']
+    assert 'unknown_field' not in poll._lazy_raw
+    assert poll.title == 'Heads or Tails?'
+    assert 'title' not in poll._lazy_raw
+    for name in Poll._get_annotations().keys():
+        getattr(poll, name)
+    # only the decoded fields are left, same as for a eagerly decoded object
+    assert vars(poll).keys() == vars(_eager()).keys()
+
+
+def test_lazy_to_dict_matches_eager(lazy):
+    eager = _eager()
+    poll = Poll(**copy.deepcopy(POLL))
+    assert poll.to_dict() == eager.to_dict()
+    # partly decoded
+    assert poll.choices[1].votes == 5
+    assert poll.to_dict() == eager.to_dict()
+    assert poll.to_dict(include_none_values=True) == eager.to_dict(include_none_values=True)
+
+
+def test_lazy_repr_matches_eager(lazy):
+    poll = Poll(**copy.deepcopy(POLL))
+    assert repr(poll) == repr(_eager())
+    assert '_lazy_raw' not in vars(poll)
+
+
+def test_lazy_field_reassignment(lazy):
+    poll = Poll(**copy.deepcopy(POLL))
+    # before the field was decoded
+    poll.title = 'changed'
+    assert poll.title == 'changed'
+    assert poll.to_dict()['title'] == 'changed'
+    assert 'title=changed' in repr(poll)
+    # after the field was decoded
+    assert poll.duration == 1800
+    poll.duration = 60
+    assert poll.duration == 60
+    assert poll.to_dict()['duration'] == 60
+
+
+def _sample(instance, depth: int = 0):
+    """builds raw API data for the given annotation"""
+    origin = instance.__origin__ if hasattr(instance, '__origin__') else None
+    if instance == datetime:
+        return '2021-03-19T06:08:33.871278372Z'
+    if origin is list:
+        return [_sample(instance.__args__[0], depth), None, _sample(instance.__args__[0], depth)]
+    if origin is dict:
+        return {'a': _sample(instance.__args__[1], depth), 'b': None}
+    if origin is Union:
+        return _sample(instance.__args__[0], depth)
+    if issubclass(instance, TwitchObject):
+        if depth > 3:
+            return {}
+        return {name: _sample(a, depth + 1) for name, a in instance._get_annotations().items()}
+    if issubclass(instance, Enum):
+        return list(instance)[0].value
+    return {str: 'text', int: 3, float: 1.5, bool: True, dict: {'key': 'value'}, list: ['value']}.get(instance, 'text')
+
+
+def _reflective_decode(self, data: dict):
+    """how objects were decoded before decoder plans"""
+    for name, cls in self._get_annotations().items():
+        if name in data:
+            setattr(self, name, TwitchObject._val_by_instance(cls, data[name]))
+
+
+def _normalize(val):
+    if isinstance(val, TwitchObject):
+        return type(val).__name__, {name: _normalize(v) for name, v in vars(val).items()}
+    if isinstance(val, list):
+        return [_normalize(v) for v in val]
+    if isinstance(val, dict):
+        return {k: _normalize(v) for k, v in val.items()}
+    return type(val), val
+
+
+OBJECT_TYPES = [c for module in (api, eventsub) for _, c in inspect.getmembers(module, inspect.isclass)
+                if issubclass(c, TwitchObject) and not issubclass(c, AsyncIterTwitchObject) and c.__module__ == module.__name__]
+
+
+@pytest.mark.parametrize('cls', OBJECT_TYPES, ids=lambda c: c.__name__)
+def test_decoder_plan_matches_reflective_decoding(cls, monkeypatch):
+    data = _sample(cls)
+    # Optional and other fields that are missing or None
+    for i, name in enumerate(list(data.keys())):
+        if i % 3 == 1:
+            data[name] = None
+        elif i % 3 == 2:
+            del data[name]
+    planned = _normalize(cls(**copy.deepcopy(data)))
+    monkeypatch.setattr(TwitchObject, '_decode', _reflective_decode)
+    assert planned == _normalize(cls(**copy.deepcopy(data)))
+    monkeypatch.undo()
+    # every field set
+    data = _sample(cls)
+    planned = _normalize(cls(**copy.deepcopy(data)))
+    monkeypatch.setattr(TwitchObject, '_decode', _reflective_decode)
+    assert planned == _normalize(cls(**copy.deepcopy(data)))
+
+
+def test_object_types_cover_nested_and_optional_fields():
+    annotations = [str(a) for c in OBJECT_TYPES for a in c._get_annotations().values()]
+    assert len(OBJECT_TYPES) > 100
+    assert any(a.startswith('typing.List[twitchAPI.object') for a in annotations)
+    assert any(a.startswith('typing.Optional[') or a.startswith('typing.Union[') for a in annotations)
+    assert any(a.startswith('typing.Dict[str, typing.Dict') for a in annotations)
@@ -0,0 +1,69 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+import pytest
+from aiohttp import web
+
+from twitchAPI.helper import PaginationCheckpoint
+
+
+class VideosMock:
+    """Serves 3 pages of 2 videos for every user, the cursor is the number of the next page"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def handle(self, request: web.Request):
+        self.calls.append((request.query['user_id'], request.query.get('after')))
+        page = int(request.query.get('after', '0'))
+        data = [{'id': f'{request.query["user_id"]}-{page}-{i}', 'user_id': request.query['user_id']} for i in range(2)]
+        return web.json_response({'data': data, 'pagination': {'cursor': str(page + 1)} if page < 2 else {}})
+
+
+@pytest.fixture
+def videos(mock_server):
+    mock = VideosMock()
+    mock_server.router.add_get('/videos', mock.handle)
+    return mock
+
+
+def test_resume_from_cursor(mock_server, videos):
+    async def test(twitch):
+        cursors = []
+        checkpoint = PaginationCheckpoint(cursor='1', sink=cursors.append)
+        with twitch.pagination_checkpoint(checkpoint):
+            ids = [v.id async for v in twitch.get_videos(user_id='a')]
+        assert ids == ['a-1-0', 'a-1-1', 'a-2-0', 'a-2-1']
+        assert cursors == ['2', None]
+        assert checkpoint.done
+
+    mock_server.run_helix(test)
+
+
+def test_nested_calls_do_not_use_checkpoint(mock_server, videos):
+    async def test(twitch):
+        cursors = []
+        checkpoint = PaginationCheckpoint(cursor='1', sink=cursors.append)
+        nested = []
+        with twitch.pagination_checkpoint(checkpoint):
+            async for video in twitch.get_videos(user_id='a'):
+                nested.append([v.id async for v in twitch.get_videos(user_id=video.id)])
+        # the nested calls start at the first page and never touch the checkpoint
+        assert all(len(n) == 6 for n in nested)
+        first_pages = {}
+        for user, after in videos.calls:
+            first_pages.setdefault(user, after)
+        assert first_pages.pop('a') == '1'
+        assert len(first_pages) == 4 and all(after is None for after in first_pages.values())
+        assert cursors == ['2', None]
+
+    mock_server.run_helix(test)
+
+
+def test_second_call_in_context_is_not_tracked(mock_server, videos):
+    async def test(twitch):
+        checkpoint = PaginationCheckpoint()
+        with twitch.pagination_checkpoint(checkpoint):
+            assert len([v async for v in twitch.get_videos(user_id='a')]) == 6
+            assert len([v async for v in twitch.get_videos(user_id='b')]) == 6
+        assert checkpoint.done
+
+    mock_server.run_helix(test)
@@ -0,0 +1,85 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Fetching pages of paginated results ahead, tested against a local Helix mock"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.helper import first
+from twitchAPI.type import TwitchAPIException
+
+
+class StreamsMock:
+    """Serves 5 pages of 2 streams, the cursor is the number of the next page. Fails the page ``fail_at`` if set"""
+
+    def __init__(self):
+        self.calls = []
+        self.fail_at = None
+
+    async def handle(self, request: web.Request):
+        page = int(request.query.get('after', '0'))
+        self.calls.append(page)
+        if page == self.fail_at:
+            return web.json_response({'error': 'Bad Request', 'status': 400, 'message': 'broken page'}, status=400)
+        data = [{'id': f'{page}-{i}', 'user_id': str(i), 'type': 'live'} for i in range(2)]
+        return web.json_response({'data': data, 'pagination': {'cursor': str(page + 1)} if page < 4 else {}})
+
+
+@pytest.fixture
+def streams(mock_server):
+    mock = StreamsMock()
+    mock_server.router.add_get('/streams', mock.handle)
+    return mock
+
+
+def test_prefetch_is_off_by_default(mock_server, streams):
+    async def test(twitch):
+        assert twitch.prefetch_depth == 0
+        stream = await first(twitch.get_streams(first=1))
+        assert stream.id == '0-0'
+        await asyncio.sleep(0.1)
+        assert streams.calls == [0]
+
+    mock_server.run_helix(test)
+
+
+def test_prefetch_yields_all_pages_in_order(mock_server, streams):
+    async def test(twitch):
+        twitch.prefetch_depth = 2
+        ids = [s.id async for s in twitch.get_streams()]
+        assert ids == [f'{page}-{i}' for page in range(5) for i in range(2)]
+        assert streams.calls == [0, 1, 2, 3, 4]
+
+    mock_server.run_helix(test)
+
+
+def test_producer_is_cancelled_on_early_exit(mock_server, streams):
+    async def test(twitch):
+        twitch.prefetch_depth = 1
+        gen = twitch.get_streams()
+        assert (await gen.__anext__()).id == '0-0'
+        await asyncio.sleep(0.1)
+        await gen.aclose()
+        await asyncio.sleep(0.1)
+        fetched = len(streams.calls)
+        # the current page, the prefetched page and at most the one the producer waits to hand over
+        assert fetched <= 3
+        assert not [t for t in asyncio.all_tasks() if t.get_coro().__qualname__.endswith('_produce')]
+        await asyncio.sleep(0.1)
+        assert len(streams.calls) == fetched
+
+    mock_server.run_helix(test)
+
+
+def test_prefetch_error_reaches_consumer(mock_server, streams):
+    async def test(twitch):
+        twitch.prefetch_depth = 2
+        streams.fail_at = 2
+        ids = []
+        with pytest.raises(TwitchAPIException):
+            async for s in twitch.get_streams():
+                ids.append(s.id)
+        # the pages before the broken one are still handed out
+        assert ids == ['0-0', '0-1', '1-0', '1-1']
+
+    mock_server.run_helix(test)
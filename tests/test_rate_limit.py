@@ -0,0 +1,95 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.helper import HelixRateLimitBucket, first
+
+
+def test_acquire_takes_point():
+    async def main():
+        bucket = HelixRateLimitBucket(limit=10, period=60)
+        await bucket.acquire()
+        assert bucket.in_flight == 1
+        assert bucket.tokens == pytest.approx(9, abs=0.01)
+        bucket.release()
+        assert bucket.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_acquire_returns_point():
+    async def main():
+        bucket = HelixRateLimitBucket(limit=1, period=60)
+        await bucket.acquire()
+        waiting = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0.01)
+        assert bucket.in_flight == 2
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert bucket.in_flight == 1
+        # only the admitted request still holds a point, the next one waits for a single refill
+        assert bucket.tokens == pytest.approx(0, abs=0.01)
+
+    asyncio.run(main())
+
+
+def test_cancelled_acquire_does_not_delay_queue():
+    async def main():
+        bucket = HelixRateLimitBucket(limit=10, period=1)
+        for _ in range(10):
+            await bucket.acquire()
+        tasks = [asyncio.ensure_future(bucket.acquire()) for _ in range(5)]
+        await asyncio.sleep(0)
+        for t in tasks[:4]:
+            t.cancel()
+        await asyncio.gather(*tasks[:4], return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        # the remaining waiter was queued last, but a new request only waits for a single point
+        await asyncio.wait_for(bucket.acquire(), 1)
+        assert loop.time() - start < 0.5
+
+    asyncio.run(main())
+
+
+class RateLimitedMock:
+    """Rejects the first ``limited`` requests with 429 and a reset ``reset_in`` seconds ahead"""
+
+    def __init__(self):
+        self.limited = 0
+        self.reset_in = 0.3
+        self.calls = []
+
+    async def handle(self, request: web.Request):
+        self.calls.append(time.monotonic())
+        if len(self.calls) <= self.limited:
+            headers = {'Ratelimit-Limit': '800', 'Ratelimit-Remaining': '0', 'Ratelimit-Reset': str(time.time() + self.reset_in)}
+            return web.json_response({'error': 'Too Many Requests', 'status': 429, 'message': ''}, status=429, headers=headers)
+        headers = {'Ratelimit-Limit': '800', 'Ratelimit-Remaining': '799', 'Ratelimit-Reset': str(int(time.time()))}
+        return web.json_response({'data': [{'id': '1', 'login': 'user'}]}, headers=headers)
+
+
+@pytest.fixture
+def helix(mock_server):
+    mock = RateLimitedMock()
+    mock_server.router.add_get('/users', mock.handle)
+    return mock
+
+
+@pytest.mark.parametrize('limited', [1, 3])
+def test_rate_limited_request_waits_for_reset(mock_server, helix, limited):
+    helix.limited = limited
+
+    async def test(twitch):
+        user = await first(twitch.get_users(logins=['user']))
+        assert user.login == 'user'
+        assert len(helix.calls) == limited + 1
+        # every retry waited for the reset announced by the 429 before it
+        for before, after in zip(helix.calls, helix.calls[1:]):
+            assert after - before >= helix.reset_in - 0.05
+
+    mock_server.run_helix(test)
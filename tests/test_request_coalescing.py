@@ -0,0 +1,71 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""Sharing of identical in flight GET requests, tested against a local Helix mock"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from twitchAPI.helper import first
+
+
+class SlowUsersMock:
+    """Answers Get Users after a short delay, so concurrent calls overlap"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def handle(self, request: web.Request):
+        self.calls.append(request.path_qs)
+        await asyncio.sleep(0.1)
+        return web.json_response({'data': [{'id': f'id_{login}', 'login': login} for login in request.query.getall('login', [])]})
+
+
+@pytest.fixture
+def helix(mock_server):
+    mock = SlowUsersMock()
+    mock_server.router.add_get('/users', mock.handle)
+    return mock
+
+
+async def _login(twitch, login: str) -> str:
+    return (await first(twitch.get_users(logins=[login]))).login
+
+
+def test_identical_requests_share_one_call(mock_server, helix):
+    async def test(twitch):
+        assert await asyncio.gather(*[_login(twitch, 'a') for _ in range(5)]) == ['a'] * 5
+        assert len(helix.calls) == 1
+        # different requests are not shared
+        assert await asyncio.gather(_login(twitch, 'a'), _login(twitch, 'b')) == ['a', 'b']
+        assert len(helix.calls) == 3
+        # a finished request is not reused
+        assert await _login(twitch, 'a') == 'a'
+        assert len(helix.calls) == 4
+
+    mock_server.run_helix(test)
+
+
+def test_sharing_can_be_disabled(mock_server, helix):
+    async def test(twitch):
+        twitch.coalesce_requests = False
+        assert await asyncio.gather(_login(twitch, 'a'), _login(twitch, 'a')) == ['a', 'a']
+        assert len(helix.calls) == 2
+
+    mock_server.run_helix(test)
+
+
+@pytest.mark.parametrize('cancelled', [0, 1])
+def test_cancelled_caller_does_not_cancel_shared_request(mock_server, helix, cancelled):
+    async def test(twitch):
+        callers = [asyncio.ensure_future(_login(twitch, 'a')) for _ in range(3)]
+        await asyncio.sleep(0.02)
+        # cancel the caller that started the request or one that joined it
+        callers[cancelled].cancel()
+        remaining = [c for i, c in enumerate(callers) if i != cancelled]
+        assert await asyncio.gather(*remaining) == ['a', 'a']
+        with pytest.raises(asyncio.CancelledError):
+            await callers[cancelled]
+        assert len(helix.calls) == 1
+        assert twitch._inflight_requests == {}
+
+    mock_server.run_helix(test)
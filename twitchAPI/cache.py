@@ -0,0 +1,288 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""
+Response Cache
+--------------
+
+Some resources of the Twitch API like chat badges, emotes or cheermotes change rarely but are requested often.
+:const:`~twitchAPI.cache.ResponseCache` keeps the responses of these endpoints around for a configurable time, so repeated calls
+do not have to hit the network every time.
+
+The cache is disabled by default, set :const:`~twitchAPI.twitch.Twitch.response_cache` to enable it.
+
+Only GET requests are cached. Every endpoint has its own time to live, endpoints without one are never cached.
+Any other request (e.g. a POST or PATCH) to a endpoint invalidates all cached responses of that endpoint.
+Responses are cached per authorization, tokens themselves are never stored in the cache, only a hash of them.
+
+************
+Code Example
+************
+
+.. code-block:: python
+
+    from twitchAPI.twitch import Twitch
+    from twitchAPI.cache import ResponseCache
+
+    twitch = await Twitch(APP_ID, APP_SECRET)
+    twitch.response_cache = ResponseCache()
+    # the second call will be answered from the cache
+    badges = await twitch.get_global_chat_badges()
+    badges = await twitch.get_global_chat_badges()
+    print(twitch.response_cache.hits, twitch.response_cache.misses)
+
+********
+Backends
+********
+
+By default, entries are kept in memory of the current process using :const:`~twitchAPI.cache.MemoryCacheBackend`.
+
+If you run multiple worker processes which should share their entries, you can use :const:`~twitchAPI.cache.SQLiteCacheBackend`
+with the same file in each process:
+
+.. code-block:: python
+
+    twitch.response_cache = ResponseCache(SQLiteCacheBackend('twitch_cache.db'))
+
+SQLite calls block while the database is locked by another process, so :const:`~twitchAPI.twitch.Twitch` runs all calls to
+backends with :const:`~twitchAPI.cache.CacheBackend.blocking` set in the default executor of the event loop instead of on the loop itself.
+
+You can also implement your own backend by subclassing :const:`~twitchAPI.cache.CacheBackend`.
+
+*******************
+Class Documentation
+*******************"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+from .helper import copy_json
+
+__all__ = ['DEFAULT_CACHE_TTL', 'CacheBackend', 'MemoryCacheBackend', 'SQLiteCacheBackend', 'ResponseCache']
+
+DEFAULT_CACHE_TTL: Dict[str, float] = {
+    'chat/badges/global': 3600,
+    'chat/badges': 600,
+    'chat/emotes/global': 3600,
+    'chat/emotes': 600,
+    'chat/emotes/set': 3600,
+    'bits/cheermotes': 3600,
+    'content_classification_labels': 86400,
+    'users': 300
+}
+"""The default time to live in seconds for cached responses of each endpoint"""
+
+
+class CacheBackend(ABC):
+    """Base class for storage backends of :const:`~twitchAPI.cache.ResponseCache`"""
+
+    blocking: bool = False
+    """If calls to this backend might block, :const:`~twitchAPI.twitch.Twitch` then runs them in the default executor of the event loop"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the value stored for key or None if there is none or it is expired
+
+        :param key: the key of the entry
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float):
+        """Stores value for key
+
+        :param key: the key of the entry
+        :param value: the json serializable value to store
+        :param ttl: time in seconds after which the entry expires
+        """
+        pass
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str):
+        """Removes all entries whose key starts with prefix
+
+        :param prefix: the key prefix
+        """
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Removes all entries"""
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Keeps entries in memory of the current process, evicting the least recently used entries once full.
+    Values are copied when they are stored and returned."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        :param max_entries: the maximum number of entries kept |default| :code:`1024`
+        """
+        self.max_entries: int = max_entries
+        """the maximum number of entries kept"""
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        # the cache might be used from the event loops of multiple threads
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+        # callers get their own copy, changing it must not change the cached entry
+        return copy_json(entry[1])
+
+    def set(self, key: str, value: Any, ttl: float):
+        value = copy_json(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            for key in [k for k in self._entries.keys() if k.startswith(prefix)]:
+                self._entries.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Keeps entries in a SQLite database file, which can be shared between multiple processes.
+    Evicts the least recently used entries once full."""
+
+    blocking: bool = True
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        """
+        :param path: path to the database file, it is created if it does not exist yet
+        :param max_entries: the maximum number of entries kept |default| :code:`10000`
+        """
+        self.path: str = path
+        """path to the database file"""
+        self.max_entries: int = max_entries
+        """the maximum number of entries kept"""
+        self._lock: threading.Lock = threading.Lock()
+        self._con: sqlite3.Connection = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        self._con.execute('PRAGMA journal_mode=WAL')
+        self._con.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires REAL, accessed REAL, value TEXT)')
+        self._con.execute('CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)')
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._con.execute('SELECT expires, value FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if row[0] < now:
+                self._con.execute('DELETE FROM cache WHERE key = ?', (key,))
+                return None
+            self._con.execute('UPDATE cache SET accessed = ? WHERE key = ?', (now, key))
+        return json.loads(row[1])
+
+    def set(self, key: str, value: Any, ttl: float):
+        now = time.time()
+        data = json.dumps(value)
+        with self._lock:
+            self._con.execute('INSERT OR REPLACE INTO cache (key, expires, accessed, value) VALUES (?, ?, ?, ?)', (key, now + ttl, now, data))
+            self._con.execute('DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                              (self.max_entries,))
+
+    def delete_prefix(self, prefix: str):
+        escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        with self._lock:
+            self._con.execute("DELETE FROM cache WHERE key LIKE ? ESCAPE '\\'", (escaped + '%',))
+
+    def clear(self):
+        with self._lock:
+            self._con.execute('DELETE FROM cache')
+
+    def close(self):
+        """Closes the database connection"""
+        with self._lock:
+            self._con.close()
+
+
+class ResponseCache:
+    """Caches the responses of GET requests to slow changing endpoints"""
+
+    def __init__(self,
+                 backend: Optional[CacheBackend] = None,
+                 ttl: Optional[Dict[str, float]] = None):
+        """
+        :param backend: the backend used to store the entries. Defaults to a new :const:`~twitchAPI.cache.MemoryCacheBackend`
+        :param ttl: time to live in seconds for each endpoint, the endpoint is given as the path relative to the API base url,
+                    e.g. :code:`chat/badges/global`. |default| :const:`~twitchAPI.cache.DEFAULT_CACHE_TTL`
+        """
+        self.backend: CacheBackend = backend if backend is not None else MemoryCacheBackend()
+        """the backend used to store the entries"""
+        self.ttl: Dict[str, float] = dict(ttl if ttl is not None else DEFAULT_CACHE_TTL)
+        """time to live in seconds for each endpoint, endpoints not listed here are not cached"""
+        self.hits: int = 0
+        """Number of requests answered from the cache"""
+        self.misses: int = 0
+        """Number of cacheable requests that where not found in the cache"""
+
+    @staticmethod
+    def _build_key(endpoint: str, query: str, authorization: Optional[str]) -> str:
+        auth = hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:32] if authorization is not None else ''
+        return f'{endpoint}|{auth}|{query}'
+
+    def get(self, endpoint: str, query: str, authorization: Optional[str]) -> Optional[Any]:
+        """Returns the cached response or None if there is none
+
+        :param endpoint: the path of the endpoint relative to the API base url
+        :param query: the query string of the request
+        :param authorization: the authorization header used for the request
+        """
+        if endpoint not in self.ttl:
+            return None
+        value = self.backend.get(self._build_key(endpoint, query, authorization))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, endpoint: str, query: str, authorization: Optional[str], value: Any):
+        """Stores the response if the endpoint is cacheable
+
+        :param endpoint: the path of the endpoint relative to the API base url
+        :param query: the query string of the request
+        :param authorization: the authorization header used for the request
+        :param value: the decoded response body
+        """
+        ttl = self.ttl.get(endpoint)
+        if ttl is None or ttl <= 0:
+            return
+        self.backend.set(self._build_key(endpoint, query, authorization), value, ttl)
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """Removes cached responses
+
+        :param endpoint: only remove the responses of this endpoint. Removes all responses if None |default| :code:`None`
+        """
+        if endpoint is None:
+            self.backend.clear()
+        else:
+            self.backend.delete_prefix(f'{endpoint}|')
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit and miss counters"""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def reset_stats(self):
+        """Resets the hit and miss counters"""
+        self.hits = 0
+        self.misses = 0
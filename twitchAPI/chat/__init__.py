@@ -126,6 +126,57 @@ Available Events
        Payload: :const:`~twitchAPI.chat.NoticeEvent`
      - Triggered when server sends a notice message.
 
+.. note:: Tags of received messages are only parsed once they are first read.
+    The payload of :const:`~twitchAPI.type.ChatEvent.RAID` is the parsed message with its :code:`tags` as a plain :const:`dict`.
+
+Iterating over messages
+=======================
+
+Instead of registering a listener for :const:`~twitchAPI.type.ChatEvent.MESSAGE`, you can also iterate over all chat messages
+using :const:`~twitchAPI.chat.Chat.messages()`:
+
+.. code-block:: python
+
+    async for msg in chat.messages():
+        print(f'{msg.user.name}: {msg.text}')
+
+The iteration ends once the chat is stopped.
+
+****************
+Batched Dispatch
+****************
+
+By default, every received line and every listener call runs in its own task.
+In bots that are in a lot of busy channels, creating these tasks can limit how many messages per second can be handled.
+
+With :code:`batch_dispatch=True`, the lines of each received websocket frame are handled right away and all listener
+calls of that frame are run one after another in a single task:
+
+.. code-block:: python
+
+    chat = await Chat(twitch, batch_dispatch=True)
+
+Keep in mind that in this mode a slow listener delays the listeners of all following messages of the same frame.
+
+********************
+Multiple Connections
+********************
+
+By default, all chat rooms are joined using a single connection.
+For bots in a lot of channels, the rooms can be spread over multiple connections using :code:`max_connections`.
+Connections are opened as needed and each room is joined through the connection with the least rooms.
+:code:`max_rooms_per_connection` limits how many rooms a single connection may join, if set the existing connections
+are filled up to that limit before additional connections are opened.
+All connections needed to join a list of rooms are opened at the same time.
+
+.. code-block:: python
+
+    chat = await Chat(twitch, max_connections=10, max_rooms_per_connection=100)
+
+Whenever a connection reconnects, its rooms are joined again through the least used connections.
+If a connection can not be reestablished, its rooms are moved to the remaining connections.
+Events and commands of all connections are handled exactly like they would be with a single connection.
+
 
 ************
 Code example
@@ -224,7 +275,8 @@ import datetime
 import re
 import threading
 from asyncio import CancelledError
-from functools import partial
+from contextvars import ContextVar
+from functools import partial, wraps
 from logging import getLogger, Logger
 from time import sleep
 import aiohttp
@@ -235,7 +287,7 @@ from twitchAPI.object.api import TwitchUser
 from twitchAPI.helper import TWITCH_CHAT_URL, first, RateLimitBucket, RATE_LIMIT_SIZES, done_task_callback
 from twitchAPI.type import ChatRoom, TwitchBackendException, AuthType, AuthScope, ChatEvent, UnauthorizedException
 
-from typing import List, Optional, Union, Callable, Dict, Awaitable, Any, TYPE_CHECKING
+from typing import List, Optional, Union, Callable, Dict, Awaitable, Any, Mapping, Tuple, FrozenSet, AsyncGenerator, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from twitchAPI.chat.middleware import BaseCommandMiddleware
@@ -245,6 +297,25 @@ __all__ = ['Chat', 'ChatUser', 'EventData', 'ChatMessage', 'ChatCommand', 'ChatS
            'JoinEvent', 'JoinedEvent', 'LeftEvent', 'ClearChatEvent', 'WhisperEvent', 'MessageDeletedEvent', 'NoticeEvent', 'HypeChat']
 
 
+def _tag_property(func):
+    """A property read from the message tags on first access that can still be overwritten like a plain attribute.
+    The value is cached like :code:`functools.cached_property` does."""
+    name = func.__name__
+
+    @wraps(func)
+    def fget(self):
+        cache = self.__dict__
+        if name in cache:
+            return cache[name]
+        value = cache[name] = func(self)
+        return value
+
+    def fset(self, value):
+        self.__dict__[name] = value
+
+    return property(fget, fset)
+
+
 class ChatUser:
     """Represents a user in a chat channel
     """
@@ -252,36 +323,73 @@ class ChatUser:
     def __init__(self, chat, parsed, name_override=None):
         self.chat: 'Chat' = chat
         """The :const:`twitchAPI.chat.Chat` instance"""
+        self._tags = parsed['tags']
         self.name: str = parsed['source']['nick'] if parsed['source']['nick'] is not None else f'{chat.username}'
         """The name of the user"""
         if self.name[0] == ':':
             self.name = self.name[1:]
         if name_override is not None:
             self.name = name_override
-        self.badge_info = parsed['tags'].get('badge-info')
+
+    @_tag_property
+    def badge_info(self):
         """All infos related to the badges of the user"""
-        self.badges = parsed['tags'].get('badges')
+        return self._tags.get('badge-info')
+
+    @_tag_property
+    def badges(self):
         """The badges of the user"""
-        self.source_badges = parsed['tags'].get('source-badges')
+        return self._tags.get('badges')
+
+    @_tag_property
+    def source_badges(self):
         """The badges for the chatter in the room the message was sent from. This uses the same format as the badges tag."""
-        self.source_badge_info = parsed['tags'].get('source-badge-info')
+        return self._tags.get('source-badges')
+
+    @_tag_property
+    def source_badge_info(self):
         """Contains metadata related to the chat badges in the source-badges tag."""
-        self.color: str = parsed['tags'].get('color')
+        return self._tags.get('source-badge-info')
+
+    @_tag_property
+    def color(self) -> str:
         """The color of the chat user if set"""
-        self.display_name: str = parsed['tags'].get('display-name')
+        return self._tags.get('color')
+
+    @_tag_property
+    def display_name(self) -> str:
         """The display name, should usually be the same as name"""
-        self.mod: bool = parsed['tags'].get('mod', '0') == '1'
+        return self._tags.get('display-name')
+
+    @_tag_property
+    def mod(self) -> bool:
         """if the user is a mod in chat channel"""
-        self.subscriber: bool = parsed['tags'].get('subscriber') == '1'
+        return self._tags.get('mod', '0') == '1'
+
+    @_tag_property
+    def subscriber(self) -> bool:
         """if the user is a subscriber to the channel"""
-        self.turbo: bool = parsed['tags'].get('turbo') == '1'
+        return self._tags.get('subscriber') == '1'
+
+    @_tag_property
+    def turbo(self) -> bool:
         """Indicates whether the user has site-wide commercial free mode enabled"""
-        self.id: str = parsed['tags'].get('user-id')
+        return self._tags.get('turbo') == '1'
+
+    @_tag_property
+    def id(self) -> str:
         """The ID of the user"""
-        self.user_type: str = parsed['tags'].get('user-type')
+        return self._tags.get('user-id')
+
+    @_tag_property
+    def user_type(self) -> str:
         """The type of user"""
-        self.vip: bool = parsed['tags'].get('vip') == '1'
+        return self._tags.get('user-type')
+
+    @_tag_property
+    def vip(self) -> bool:
         """if the chatter is a channel VIP"""
+        return self._tags.get('vip') == '1'
 
 
 class EventData:
@@ -392,7 +500,8 @@ class ChatMessage(EventData):
 
     def __init__(self, chat, parsed):
         super(ChatMessage, self).__init__(chat)
-        self._parsed = parsed
+        self._raw_parsed = parsed
+        self._tags = parsed['tags']
         self.text: str = parsed['parameters']
         """The message"""
         self.is_me: bool = False
@@ -401,55 +510,106 @@ class ChatMessage(EventData):
         if result is not None:
             self.text = result.group('msg')
             self.is_me = True
-        self.bits: int = int(parsed['tags'].get('bits', '0'))
+
+    @property
+    def _parsed(self) -> dict:
+        """the parsed IRC message, with the tags as plain dict"""
+        return _plain_parsed(self._raw_parsed)
+
+    @_tag_property
+    def bits(self) -> int:
         """The amount of Bits the user cheered"""
-        self.first: bool = parsed['tags'].get('first-msg', '0') != '0'
+        return int(self._tags.get('bits') or '0')
+
+    @_tag_property
+    def first(self) -> bool:
         """Flag if message is user's first ever in room"""
-        self.sent_timestamp: int = int(parsed['tags'].get('tmi-sent-ts'))
+        return self._tags.get('first-msg', '0') != '0'
+
+    @_tag_property
+    def sent_timestamp(self) -> int:
         """the unix timestamp of when the message was sent"""
-        self.reply_parent_msg_id: Optional[str] = parsed['tags'].get('reply-parent-msg-id')
+        return int(self._tags.get('tmi-sent-ts'))
+
+    @_tag_property
+    def reply_parent_msg_id(self) -> Optional[str]:
         """An ID that uniquely identifies the parent message that this message is replying to."""
-        self.reply_parent_user_id: Optional[str] = parsed['tags'].get('reply-parent-user-id')
+        return self._tags.get('reply-parent-msg-id')
+
+    @_tag_property
+    def reply_parent_user_id(self) -> Optional[str]:
         """An ID that identifies the sender of the parent message."""
-        self.reply_parent_user_login: Optional[str] = parsed['tags'].get('reply-parent-user-login')
+        return self._tags.get('reply-parent-user-id')
+
+    @_tag_property
+    def reply_parent_user_login(self) -> Optional[str]:
         """The login name of the sender of the parent message. """
-        self.reply_parent_display_name: Optional[str] = parsed['tags'].get('reply-parent-display-name')
+        return self._tags.get('reply-parent-user-login')
+
+    @_tag_property
+    def reply_parent_display_name(self) -> Optional[str]:
         """The display name of the sender of the parent message."""
-        self.reply_parent_msg_body: Optional[str] = parsed['tags'].get('reply-parent-msg-body')
+        return self._tags.get('reply-parent-display-name')
+
+    @_tag_property
+    def reply_parent_msg_body(self) -> Optional[str]:
         """The text of the parent message"""
-        self.reply_thread_parent_msg_id: Optional[str] = parsed['tags'].get('reply-thread-parent-msg-id')
+        return self._tags.get('reply-parent-msg-body')
+
+    @_tag_property
+    def reply_thread_parent_msg_id(self) -> Optional[str]:
         """An ID that uniquely identifies the top-level parent message of the reply thread that this message is replying to.
            Is :code:`None` if this message is not a reply."""
-        self.reply_thread_parent_user_login: Optional[str] = parsed['tags'].get('reply-thread-parent-user-login')
+        return self._tags.get('reply-thread-parent-msg-id')
+
+    @_tag_property
+    def reply_thread_parent_user_login(self) -> Optional[str]:
         """The login name of the sender of the top-level parent message. Is :code:`None` if this message is not a reply."""
-        self.emotes = parsed['tags'].get('emotes')
+        return self._tags.get('reply-thread-parent-user-login')
+
+    @_tag_property
+    def emotes(self):
         """The emotes used in the message"""
-        self.id: str = parsed['tags'].get('id')
+        return self._tags.get('emotes')
+
+    @_tag_property
+    def id(self) -> str:
         """the ID of the message"""
-        self.hype_chat: Optional[HypeChat] = HypeChat(parsed) if parsed['tags'].get('pinned-chat-paid-level') is not None else None
+        return self._tags.get('id')
+
+    @_tag_property
+    def hype_chat(self) -> Optional[HypeChat]:
         """Hype Chat related data, is None if the message was not a hype chat"""
-        self.source_id: Optional[str] = parsed['tags'].get('source-id')
-        """A UUID that identifies the source message from the channel the message was sent from."""
-        self.source_room_id: Optional[str] = parsed['tags'].get('source-room-id')
-        """An ID that identifies the chat room (channel) the message was sent from."""
+        return HypeChat(self._raw_parsed) if self._tags.get('pinned-chat-paid-level') is not None else None
 
+    @_tag_property
+    def source_id(self) -> Optional[str]:
+        """A UUID that identifies the source message from the channel the message was sent from."""
+        return self._tags.get('source-id')
 
+    @_tag_property
+    def source_room_id(self) -> Optional[str]:
+        """An ID that identifies the chat room (channel) the message was sent from."""
+        return self._tags.get('source-room-id')
 
     @property
     def room(self) -> Optional[ChatRoom]:
         """The channel the message was issued in"""
-        return self.chat.room_cache.get(self._parsed['command']['channel'][1:])
+        return self.chat.room_cache.get(self._raw_parsed['command']['channel'][1:])
 
     @property
     def user(self) -> ChatUser:
         """The user that issued the message"""
-        return ChatUser(self.chat, self._parsed)
+        return ChatUser(self.chat, self._raw_parsed)
 
     async def reply(self, text: str):
         """Reply to this message"""
-        bucket = self.chat._get_message_bucket(self._parsed['command']['channel'][1:])
+        bucket = self.chat._get_message_bucket(self._raw_parsed['command']['channel'][1:])
         await bucket.put()
-        await self.chat.send_raw_irc_message(f'@reply-parent-msg-id={self.id} PRIVMSG #{self.room.name} :{text}')
+        if not self.chat.is_ready():
+            raise ValueError('can\'t send message: bot not ready')
+        room_name = self._raw_parsed['command']['channel'][1:]
+        await self.chat._send_room_message(room_name, f'@reply-parent-msg-id={self.id} PRIVMSG #{room_name} :{text}')
 
 
 class ChatCommand(ChatMessage):
@@ -476,41 +636,73 @@ class ChatSub:
     def __init__(self, chat, parsed):
         self.chat: 'Chat' = chat
         """The :const:`twitchAPI.chat.Chat` instance"""
-        self._parsed = parsed
-        self.sub_type: str = parsed['tags'].get('msg-id')
-        """The type of sub given"""
+        self._raw_parsed = parsed
+        self._tags = parsed['tags']
         self.sub_message: str = parsed['parameters'] if parsed['parameters'] is not None else ''
         """The message that was sent together with the sub"""
-        self.sub_plan: str = parsed['tags'].get('msg-param-sub-plan')
+
+    @property
+    def _parsed(self) -> dict:
+        """the parsed IRC message, with the tags as plain dict"""
+        return _plain_parsed(self._raw_parsed)
+
+    @_tag_property
+    def sub_type(self) -> str:
+        """The type of sub given"""
+        return self._tags.get('msg-id')
+
+    @_tag_property
+    def sub_plan(self) -> str:
         """the ID of the subscription plan that was used"""
-        self.sub_plan_name: str = parsed['tags'].get('msg-param-sub-plan-name')
+        return self._tags.get('msg-param-sub-plan')
+
+    @_tag_property
+    def sub_plan_name(self) -> str:
         """the name of the subscription plan that was used"""
-        self.system_message: str = parsed['tags'].get('system-msg', '').replace('\\\\s', ' ')
+        return self._tags.get('msg-param-sub-plan-name')
+
+    @_tag_property
+    def system_message(self) -> str:
         """the system message that was generated for this sub"""
+        return self._tags.get('system-msg') or ''
 
     @property
     def room(self) -> Optional[ChatRoom]:
         """The room this sub was issued in"""
-        return self.chat.room_cache.get(self._parsed['command']['channel'][1:])
+        return self.chat.room_cache.get(self._raw_parsed['command']['channel'][1:])
 
 
 class ClearChatEvent(EventData):
 
     def __init__(self, chat, parsed):
         super(ClearChatEvent, self).__init__(chat)
+        self._tags = parsed['tags']
         self.room_name: str = parsed['command']['channel'][1:]
         """The name of the chat room the event happened in"""
-        self.room_id: str = parsed['tags'].get('room-id')
-        """The ID of the chat room the event happened in"""
         self.user_name: str = parsed['parameters']
         """The name of the user who's messages got cleared"""
-        self.duration: Optional[int] = int(parsed['tags']['ban-duration']) if parsed['tags'].get('ban-duration') not in (None, '') else None
+
+    @_tag_property
+    def room_id(self) -> str:
+        """The ID of the chat room the event happened in"""
+        return self._tags.get('room-id')
+
+    @_tag_property
+    def duration(self) -> Optional[int]:
         """duration of the timeout in seconds. None if user was not timed out"""
-        self.banned_user_id: Optional[str] = parsed['tags'].get('target-user-id')
+        duration = self._tags.get('ban-duration')
+        return int(duration) if duration not in (None, '') else None
+
+    @_tag_property
+    def banned_user_id(self) -> Optional[str]:
         """The ID of the user who got banned or timed out. if :const:`~twitchAPI.chat.ClearChatEvent.duration` is None, the user was banned.
         Will be None when the user was not banned nor timed out."""
-        self.sent_timestamp: int = int(parsed['tags'].get('tmi-sent-ts'))
+        return self._tags.get('target-user-id')
+
+    @_tag_property
+    def sent_timestamp(self) -> int:
         """The timestamp the event happened at"""
+        return int(self._tags.get('tmi-sent-ts'))
 
     @property
     def room(self) -> Optional[ChatRoom]:
@@ -522,14 +714,19 @@ class WhisperEvent(EventData):
 
     def __init__(self, chat, parsed):
         super(WhisperEvent, self).__init__(chat)
-        self._parsed = parsed
+        self._raw_parsed = parsed
         self.message: str = parsed['parameters']
         """The message that was send"""
 
+    @property
+    def _parsed(self) -> dict:
+        """the parsed IRC message, with the tags as plain dict"""
+        return _plain_parsed(self._raw_parsed)
+
     @property
     def user(self) -> ChatUser:
         """The user that DMed your bot"""
-        return ChatUser(self.chat, self._parsed)
+        return ChatUser(self.chat, self._raw_parsed)
 
 
 class NoticeEvent(EventData):
@@ -537,13 +734,17 @@ class NoticeEvent(EventData):
 
     def __init__(self, chat, parsed):
         super(NoticeEvent, self).__init__(chat)
+        self._tags = parsed['tags']
         self._room_name = parsed['command']['channel'][1:]
         """The name of the chat room the notice is from"""
-        self.msg_id: str = parsed['tags'].get('msg-id')
-        """Message ID of the notice, `Msg-id reference <https://dev.twitch.tv/docs/irc/msg-id/>`__"""
         self.message: str = parsed['parameters']
         """Description for the msg_id"""
 
+    @_tag_property
+    def msg_id(self) -> str:
+        """Message ID of the notice, `Msg-id reference <https://dev.twitch.tv/docs/irc/msg-id/>`__"""
+        return self._tags.get('msg-id')
+
     @property
     def room(self) -> Optional[ChatRoom]:
         """The room this notice is from"""
@@ -556,6 +757,162 @@ CHATROOM_TYPE = Union[str, ChatRoom]
 
 _ME_REGEX = re.compile(r'^\x01ACTION (?P<msg>.+)\x01$')
 
+_IRC_CHANNEL_COMMANDS = frozenset(('JOIN', 'PART', 'NOTICE', 'CLEARCHAT', 'HOSTTARGET', 'PRIVMSG',
+                                   'USERSTATE', 'ROOMSTATE', '001', 'USERNOTICE', 'CLEARMSG', 'WHISPER'))
+_IRC_BADGE_TAGS = frozenset(('badges', 'badge-info', 'source-badges', 'source-badge-info'))
+_IRC_IGNORED_TAGS = frozenset(('client-nonce', 'flags'))
+# commands which only have to be parsed if a handler for one of their events is registered
+_IRC_EVENT_COMMANDS: Dict[str, Tuple[ChatEvent, ...]] = {
+    'PRIVMSG': (ChatEvent.MESSAGE,),
+    'USERNOTICE': (ChatEvent.SUB, ChatEvent.RAID),
+    'CLEARMSG': (ChatEvent.MESSAGE_DELETE,),
+    'CLEARCHAT': (ChatEvent.CHAT_CLEARED,),
+    'NOTICE': (ChatEvent.NOTICE,),
+    'WHISPER': (ChatEvent.WHISPER,)
+}
+# known commands nothing listens to
+_IRC_UNHANDLED_COMMANDS = frozenset(('HOSTTARGET', 'GLOBALUSERSTATE', '353'))
+# commands whose handlers wait for other lines or reconnect, they can not be handled inline
+_IRC_TASK_COMMANDS = frozenset(('001', 'RECONNECT'))
+# listener calls collected for the frame the current receive loop handles inline, None if not batching
+_CHAT_BATCH: ContextVar[Optional[List[Tuple[Callable[[Any], Awaitable[None]], Any]]]] = ContextVar('twitch_chat_batch', default=None)
+_IRC_TAG_ESCAPES = {':': ';', 's': ' ', '\\': '\\', 'r': '\r', 'n': '\n'}
+
+
+def _unescape_tag_value(value: str) -> str:
+    # IRCv3 message tag escaping, an unknown escape stands for the escaped character and a trailing backslash is dropped
+    parts = []
+    idx = 0
+    while True:
+        end_idx = value.find('\\', idx)
+        if end_idx == -1:
+            parts.append(value[idx:])
+            return ''.join(parts)
+        parts.append(value[idx:end_idx])
+        escaped = value[end_idx + 1:end_idx + 2]
+        parts.append(_IRC_TAG_ESCAPES.get(escaped, escaped))
+        idx = end_idx + 2
+
+
+def _parse_badges(value: str) -> Dict[str, str]:
+    badges = {}
+    for badge in value.split(','):
+        name, _, version = badge.partition('/')
+        badges[name] = version
+    return badges
+
+
+def _parse_emotes(value: str) -> Dict[str, List[Dict[str, str]]]:
+    emotes = {}
+    for emote in value.split('/'):
+        emote_id, _, positions = emote.partition(':')
+        text_positions = []
+        for position in positions.split(','):
+            start, _, end = position.partition('-')
+            text_positions.append({
+                'start_position': start,
+                'end_position': end
+            })
+        emotes[emote_id] = text_positions
+    return emotes
+
+
+def _decode_tag(key: str, value: str):
+    if not value:
+        return None
+    if '\\' in value:
+        value = _unescape_tag_value(value)
+        if not value:
+            return None
+    if key in _IRC_BADGE_TAGS:
+        return _parse_badges(value)
+    if key == 'emotes':
+        return _parse_emotes(value)
+    if key == 'emote-sets':
+        return value.split(',')
+    return value
+
+
+class _IRCTags(Mapping):
+    """Read only mapping of the tags of a IRC message.
+
+    The raw tags are only split once the first tag is accessed and each value is only decoded on its first access.
+    Never handed to user code, see :code:`_plain_parsed()`."""
+
+    __slots__ = ('_raw', '_values', '_decoded')
+
+    def __init__(self, raw: str):
+        self._raw: str = raw
+        self._values: Optional[Dict[str, str]] = None
+        self._decoded: Dict[str, Any] = {}
+
+    def _split(self) -> Dict[str, str]:
+        values = self._values
+        if values is None:
+            values = dict(tag.partition('=')[::2] for tag in self._raw.split(';'))
+            for key in _IRC_IGNORED_TAGS:
+                values.pop(key, None)
+            self._values = values
+        return values
+
+    def __getitem__(self, key: str):
+        decoded = self._decoded
+        if key in decoded:
+            return decoded[key]
+        value = _decode_tag(key, self._split()[key])
+        decoded[key] = value
+        return value
+
+    def get(self, key: str, default=None):
+        decoded = self._decoded
+        if key in decoded:
+            return decoded[key]
+        values = self._split()
+        if key not in values:
+            return default
+        value = _decode_tag(key, values[key])
+        decoded[key] = value
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._split()
+
+    def __iter__(self):
+        return iter(self._split())
+
+    def __len__(self) -> int:
+        return len(self._split())
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+
+def _plain_parsed(parsed: dict) -> dict:
+    """Replaces the lazily parsed tags of a parsed message with a plain dict, used before the message is handed to user code"""
+    tags = parsed['tags']
+    if not isinstance(tags, dict):
+        parsed['tags'] = dict(tags)
+    return parsed
+
+
+class _ChatConnection:
+    """A single IRC websocket of a :const:`~twitchAPI.chat.Chat` and the rooms joined through it"""
+
+    def __init__(self, index: int):
+        self.index: int = index
+        self.websocket: Optional[aiohttp.ClientWebSocketResponse] = None
+        self.rooms: Set[str] = set()
+        self.ready: Optional[asyncio.Event] = None
+        self.task: Optional[asyncio.Future] = None
+        self.reconnecting: bool = False
+
+    @property
+    def closed(self) -> bool:
+        return self.websocket is None or self.websocket.closed
+
+    def is_ready(self) -> bool:
+        return self.ready is not None and self.ready.is_set() and not self.closed
+
 
 class Chat:
     """The chat bot instance"""
@@ -567,7 +924,10 @@ class Chat:
                  initial_channel: Optional[List[str]] = None,
                  callback_loop: Optional[asyncio.AbstractEventLoop] = None,
                  no_message_reset_time: Optional[float] = 10,
-                 no_shared_chat_messages: bool = True):
+                 no_shared_chat_messages: bool = True,
+                 batch_dispatch: bool = False,
+                 max_connections: int = 1,
+                 max_rooms_per_connection: Optional[int] = None):
         """
         :param twitch: A Authenticated twitch instance
         :param connection_url: alternative connection url |default|:code:`None`
@@ -581,9 +941,19 @@ class Chat:
             the connection active. At 10 minutes we've definitely missed at least one PING |default|:code:`10`
         :param no_shared_chat_messages: Filter out Twitch shared chat messages from other channels. This will only
             listen for messages that were sent in the chat room that the bot is listening in.
+        :param batch_dispatch: Handle received lines right away and run all listeners of a websocket frame one after another in
+            a single task instead of using a task for each line and listener. |default|:code:`False`
+        :param max_connections: The maximum number of connections the joined chat rooms are spread over. |default|:code:`1`
+        :param max_rooms_per_connection: The maximum number of chat rooms joined through a single connection.
+            :code:`None` means no limit. |default|:code:`None`
+        :raises ValueError: if max_connections or max_rooms_per_connection is smaller than 1
         """
         self.logger: Logger = getLogger('twitchAPI.chat')
         """The logger used for Chat related log messages"""
+        if max_connections < 1:
+            raise ValueError('max_connections has to be at least 1')
+        if max_rooms_per_connection is not None and max_rooms_per_connection < 1:
+            raise ValueError('max_rooms_per_connection has to be at least 1')
         self._prefix: str = "!"
         self.twitch: Twitch = twitch
         """The twitch instance being used"""
@@ -598,13 +968,20 @@ class Chat:
         self._callback_loop = callback_loop
         self.no_message_reset_time: Optional[float] = no_message_reset_time
         self.no_shared_chat_messages: bool = no_shared_chat_messages
+        self.batch_dispatch: bool = batch_dispatch
+        """Handle received lines right away and run all listeners of a websocket frame in a single task"""
+        self.max_connections: int = max_connections
+        """The maximum number of connections the joined chat rooms are spread over"""
+        self.max_rooms_per_connection: Optional[int] = max_rooms_per_connection
+        """The maximum number of chat rooms joined through a single connection, None means no limit"""
         self.listen_confirm_timeout: int = 30
         """Time in second that any :code:`listen_` should wait for its subscription to be completed."""
         self.reconnect_delay_steps: List[int] = [0, 1, 2, 4, 8, 16, 32, 64, 128]
         """Time in seconds between reconnect attempts"""
         self.log_no_registered_command_handler: bool = True
         """Controls if instances of commands being issued in chat where no handler exists should be logged. |default|:code:`True`"""
-        self.__connection = None
+        self._connections: List[_ChatConnection] = []
+        self._next_connection_index: int = 0
         self._session = None
         self.__socket_thread: Optional[threading.Thread] = None
         self.__running: bool = False
@@ -634,6 +1011,9 @@ class Chat:
         self.default_command_execution_blocked_handler: Optional[Callable[[ChatCommand], Awaitable[None]]] = None
         """The default handler to be called should a command execution be blocked by a middleware that has no specific handler set."""
         self.username: Optional[str] = None
+        self._message_queues: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._dispatch_filter: Tuple[FrozenSet[str], Optional[Tuple[str, ...]]] = (frozenset(), None)
+        self._update_dispatch_filter()
 
     def __await__(self):
         t = asyncio.create_task(self._get_username())
@@ -648,159 +1028,131 @@ class Chat:
     # command parsing
     ##################################################################################################################################################
 
+    def _update_dispatch_filter(self):
+        # has to be called every time handlers or prefixes change
+        skipped = set(_IRC_UNHANDLED_COMMANDS)
+        for command, events in _IRC_EVENT_COMMANDS.items():
+            if command == 'PRIVMSG' and len(self._message_queues) > 0:
+                continue
+            if not any(self._event_handler.get(event) for event in events):
+                skipped.add(command)
+        prefixes = None
+        if 'PRIVMSG' in skipped and len(self._command_handler) > 0:
+            # only messages that might be a command are of interest
+            skipped.discard('PRIVMSG')
+            prefixes = tuple({self._prefix, *self._channel_command_prefix.values()})
+        self._dispatch_filter = (frozenset(skipped), prefixes)
+
+    def _skip_irc_message(self, message: str) -> bool:
+        """Returns True if no handler is interested in this line, without fully parsing it"""
+        skipped, prefixes = self._dispatch_filter
+        idx = 0
+        if message.startswith('@'):
+            idx = message.find(' ') + 1
+        if message.startswith(':', idx):
+            idx = message.find(' ', idx) + 1
+        end_idx = message.find(' ', idx)
+        command = message[idx:] if end_idx == -1 else message[idx:end_idx]
+        if command in skipped:
+            return True
+        if prefixes is not None and command == 'PRIVMSG':
+            params_idx = message.find(':', idx)
+            return params_idx == -1 or not message.startswith(prefixes, params_idx + 1)
+        return False
+
     def _parse_irc_message(self, message: str):
-        parsed_message = {
-            'tags': {},
-            'source': None,
-            'command': None,
-            'parameters': None
-        }
         idx = 0
         raw_tags_component = None
         raw_source_component = None
         raw_parameters_component = None
 
-        if message[idx] == '@':
-            end_idx = message.index(' ')
-            raw_tags_component = message[1:end_idx]
-            idx = end_idx + 1
+        if message[0] == '@':
+            idx = message.index(' ')
+            raw_tags_component = message[1:idx]
+            idx += 1
 
         if message[idx] == ':':
             end_idx = message.index(' ', idx)
             raw_source_component = message[idx:end_idx]
             idx = end_idx + 1
 
-        try:
-            end_idx = message.index(':', idx)
-        except ValueError:
-            end_idx = len(message)
-
-        raw_command_component = message[idx:end_idx].strip()
-
-        if end_idx != len(message):
-            idx = end_idx + 1
-            raw_parameters_component = message[idx::]
-
-        parsed_message['command'] = self._parse_irc_command(raw_command_component)
+        end_idx = message.find(':', idx)
+        if end_idx == -1:
+            raw_command_component = message[idx:]
+        else:
+            raw_command_component = message[idx:end_idx]
+            raw_parameters_component = message[end_idx + 1:]
 
-        if parsed_message['command'] is None:
+        command = self._parse_irc_command(raw_command_component)
+        if command is None:
             return None
 
-        if raw_tags_component is not None:
-            parsed_message['tags'] = self._parse_irc_tags(raw_tags_component)
-
-        parsed_message['source'] = self._parse_irc_source(raw_source_component)
-        parsed_message['parameters'] = raw_parameters_component
-        if parsed_message['command']['command'] == 'PRIVMSG':
-            ch = parsed_message['command'].get('channel', '#')[1::]
-            used_prefix = self._channel_command_prefix.get(ch, self._prefix)
-            if raw_parameters_component is not None and raw_parameters_component.startswith(used_prefix):
-                parsed_message['command'] = self._parse_irc_parameters(raw_parameters_component, parsed_message['command'], used_prefix)
+        if command['command'] == 'PRIVMSG' and raw_parameters_component is not None:
+            used_prefix = self._channel_command_prefix.get(command['channel'][1:], self._prefix)
+            if raw_parameters_component.startswith(used_prefix):
+                command = self._parse_irc_parameters(raw_parameters_component, command, used_prefix)
 
-        return parsed_message
+        return {
+            'tags': self._parse_irc_tags(raw_tags_component) if raw_tags_component is not None else {},
+            'source': self._parse_irc_source(raw_source_component),
+            'command': command,
+            'parameters': raw_parameters_component
+        }
 
     @staticmethod
     def _parse_irc_parameters(raw_parameters_component: str, command, prefix):
-        command_parts = raw_parameters_component[len(prefix)::].strip()
-        try:
-            params_idx = command_parts.index(' ')
-        except ValueError:
-            command['bot_command'] = command_parts
-            return command
-        command['bot_command'] = command_parts[:params_idx]
-        command['bot_command_params'] = command_parts[params_idx:].strip()
+        command_parts = raw_parameters_component[len(prefix):].strip()
+        bot_command, _, params = command_parts.partition(' ')
+        command['bot_command'] = bot_command
+        if params:
+            command['bot_command_params'] = params.strip()
         return command
 
     @staticmethod
     def _parse_irc_source(raw_source_component: str):
         if raw_source_component is None:
             return None
-        source_parts = raw_source_component.split('!')
-        return {
-            'nick': source_parts[0] if len(source_parts) == 2 else None,
-            'host': source_parts[1] if len(source_parts) == 2 else source_parts[0]
-        }
+        nick, sep, host = raw_source_component.partition('!')
+        if not sep:
+            return {'nick': None, 'host': nick}
+        return {'nick': nick, 'host': host}
 
     @staticmethod
     def _parse_irc_tags(raw_tags_component: str):
-        tags_to_ignore = ('client-nonce', 'flags')
-        parsed_tags = {}
-
-        tags = raw_tags_component.split(';')
-
-        for tag in tags:
-            parsed_tag = tag.split('=')
-            tag_value = None if parsed_tag[1] == '' else parsed_tag[1]
-            if parsed_tag[0] in ('badges', 'badge-info', 'source-badges', 'source-badge-info'):
-                if tag_value is not None:
-                    d = {}
-                    badges = tag_value.split(',')
-                    for pair in badges:
-                        badge_parts = pair.split('/', 1)
-                        d[badge_parts[0]] = badge_parts[1]
-                    parsed_tags[parsed_tag[0]] = d
-                else:
-                    parsed_tags[parsed_tag[0]] = None
-            elif parsed_tag[0] == 'emotes':
-                if tag_value is not None:
-                    d = {}
-                    emotes = tag_value.split('/')
-                    for emote in emotes:
-                        emote_parts = emote.split(':')
-                        text_positions = []
-                        positions = emote_parts[1].split(',')
-                        for position in positions:
-                            pos_parts = position.split('-')
-                            text_positions.append({
-                                'start_position': pos_parts[0],
-                                'end_position': pos_parts[1]
-                            })
-                        d[emote_parts[0]] = text_positions
-                    parsed_tags[parsed_tag[0]] = d
-                else:
-                    parsed_tags[parsed_tag[0]] = None
-            elif parsed_tag[0] == 'emote-sets':
-                parsed_tags[parsed_tag[0]] = tag_value.split(',')
-            else:
-                if parsed_tag[0] not in tags_to_ignore:
-                    parsed_tags[parsed_tag[0]] = tag_value
-        return parsed_tags
+        return _IRCTags(raw_tags_component)
 
     def _parse_irc_command(self, raw_command_component: str):
-        command_parts = raw_command_component.split(' ')
-
-        if command_parts[0] in ('JOIN', 'PART', 'NOTICE', 'CLEARCHAT', 'HOSTTARGET', 'PRIVMSG',
-                                'USERSTATE', 'ROOMSTATE', '001', 'USERNOTICE', 'CLEARMSG', 'WHISPER'):
-            parsed_command = {
-                'command': command_parts[0],
-                'channel': command_parts[1]
+        raw_command_component = raw_command_component.strip()
+        command, _, rest = raw_command_component.partition(' ')
+
+        if command in _IRC_CHANNEL_COMMANDS:
+            channel = rest.partition(' ')[0]
+            if not channel:
+                self.logger.warning(f'{command} without channel: {raw_command_component}')
+                return None
+            return {
+                'command': command,
+                'channel': channel
             }
-        elif command_parts[0] in ('PING', 'GLOBALUSERSTATE', 'RECONNECT'):
-            parsed_command = {
-                'command': command_parts[0]
+        if command in ('PING', 'GLOBALUSERSTATE', 'RECONNECT', '353'):
+            return {
+                'command': command
             }
-        elif command_parts[0] == 'CAP':
-            parsed_command = {
-                'command': command_parts[0],
-                'is_cap_request_enabled': command_parts[2] == 'ACK'
+        if command == 'CAP':
+            command_parts = rest.split(' ')
+            return {
+                'command': command,
+                'is_cap_request_enabled': len(command_parts) > 1 and command_parts[1] == 'ACK'
             }
-        elif command_parts[0] == '421':
+        if command == '421':
             # unsupported command in parts 2
-            self.logger.warning(f'Unsupported IRC command: {command_parts[0]}')
-            return None
-        elif command_parts[0] == '353':
-            parsed_command = {
-                'command': command_parts[0]
-            }
-        elif command_parts[0] in ('002', '003', '004', '366', '372', '375', '376'):
-            self.logger.debug(f'numeric message: {command_parts[0]}\n{raw_command_component}')
-            return None
+            self.logger.warning(f'Unsupported IRC command: {command}')
+        elif command in ('002', '003', '004', '366', '372', '375', '376'):
+            self.logger.debug(f'numeric message: {command}\n{raw_command_component}')
         else:
             # unexpected command
-            self.logger.warning(f'Unexpected command: {command_parts[0]}')
-            return None
-
-        return parsed_command
+            self.logger.warning(f'Unexpected command: {command}')
+        return None
 
     ##################################################################################################################################################
     # general web socket tools
@@ -846,25 +1198,36 @@ class Chat:
         f.result()
 
     async def _stop(self):
-        await self.__connection.close()
+        for connection in self._connections:
+            if connection.websocket is not None:
+                await connection.websocket.close()
         await self._session.close()
+        # close the API session used by callbacks running within this thread
+        await self.twitch._close_session()
         # wait for ssl to close as per aiohttp docs...
         await asyncio.sleep(0.25)
         # clean up bot state
-        self.__connection = None
+        self._connections = []
         self._session = None
         self.room_cache = {}
         self._room_join_locks = []
         self._room_leave_locks = []
         self._closing = True
+        # end all running message iterations
+        self._feed_message_queues(None)
+        self._message_queues = []
+        self._update_dispatch_filter()
 
-    async def __connect(self, is_startup=False):
+    async def __connect(self, connection: _ChatConnection, is_startup=False):
         if is_startup:
-            self.logger.debug('connecting...')
+            self.logger.debug(f'connecting connection {connection.index}...')
         else:
-            self.logger.debug('reconnecting...')
-        if self.__connection is not None and not self.__connection.closed:
-            await self.__connection.close()
+            self.logger.debug(f'reconnecting connection {connection.index}...')
+        if connection.ready is None:
+            connection.ready = asyncio.Event()
+        connection.ready.clear()
+        if not connection.closed:
+            await connection.websocket.close()
         retry = 0
         need_retry = True
         if self._session is None:
@@ -872,7 +1235,7 @@ class Chat:
         while need_retry and retry < len(self.reconnect_delay_steps):
             need_retry = False
             try:
-                self.__connection = await self._session.ws_connect(self.connection_url)
+                connection.websocket = await self._session.ws_connect(self.connection_url)
             except Exception:
                 self.logger.warning(f'connection attempt failed, retry in {self.reconnect_delay_steps[retry]}s...')
                 await asyncio.sleep(self.reconnect_delay_steps[retry])
@@ -892,26 +1255,119 @@ class Chat:
         asyncio.set_event_loop(self.__socket_loop)
 
         # startup
-        self.__socket_loop.run_until_complete(self.__connect(is_startup=True))
+        connection = self.__new_connection()
+        self.__socket_loop.run_until_complete(self.__connect(connection, is_startup=True))
 
+        connection.task = asyncio.ensure_future(self.__task_receive(connection), loop=self.__socket_loop)
         self.__tasks = [
-            asyncio.ensure_future(self.__task_receive(), loop=self.__socket_loop),
-            asyncio.ensure_future(self.__task_startup(), loop=self.__socket_loop)
+            connection.task,
+            asyncio.ensure_future(self.__task_startup(connection), loop=self.__socket_loop)
         ]
         # keep loop alive
         self.__socket_loop.run_until_complete(self._keep_loop_alive())
 
-    async def _send_message(self, message: str):
+    def __new_connection(self) -> _ChatConnection:
+        connection = _ChatConnection(self._next_connection_index)
+        self._next_connection_index += 1
+        self._connections.append(connection)
+        return connection
+
+    async def __start_connection(self, connection: _ChatConnection):
+        try:
+            await self.__connect(connection, is_startup=True)
+            connection.task = asyncio.ensure_future(self.__task_receive(connection))
+            await self.__task_startup(connection)
+            await asyncio.wait_for(connection.ready.wait(), timeout=self.join_timeout)
+        except BaseException:
+            if connection.task is not None:
+                connection.task.cancel()
+            if connection.websocket is not None:
+                await connection.websocket.close()
+            raise
+
+    async def _open_connection(self) -> _ChatConnection:
+        """Adds a new connection to the pool and waits for it to be ready"""
+        connection = self.__new_connection()
+        try:
+            if asyncio.get_running_loop() is self.__socket_loop:
+                await self.__start_connection(connection)
+            else:
+                # connections are always served by the socket loop
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.__start_connection(connection), self.__socket_loop))
+        except BaseException:
+            if connection in self._connections:
+                self._connections.remove(connection)
+            raise
+        return connection
+
+    def _connections_needed(self, room_count: int) -> int:
+        """Returns how many connections have to be opened to join the given number of new rooms"""
+        free = self.max_connections - len(self._connections)
+        if free <= 0 or room_count == 0:
+            return 0
+        ready = [c for c in self._connections if c.is_ready()]
+        if self.max_rooms_per_connection is None:
+            # no limit: spread the rooms, every connection that is not empty yet gets company
+            empty = len([c for c in ready if len(c.rooms) == 0])
+            return min(free, max(0, room_count - empty))
+        # fill the existing connections up to the limit first
+        space = sum(max(0, self.max_rooms_per_connection - len(c.rooms)) for c in ready)
+        overflow = room_count - space
+        if overflow <= 0:
+            return 0
+        return min(free, -(-overflow // self.max_rooms_per_connection))
+
+    async def _open_connections(self, count: int):
+        """Opens the given number of connections at the same time"""
+        if count <= 0:
+            return
+        results = await asyncio.gather(*[self._open_connection() for _ in range(count)], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                self.logger.error('failed to open additional chat connection', exc_info=result)
+
+    def _pick_connection(self) -> Optional[_ChatConnection]:
+        """Returns the connection a new room should be joined through, None if all connections are full"""
+        candidates = [c for c in self._connections
+                      if c.is_ready() and (self.max_rooms_per_connection is None or len(c.rooms) < self.max_rooms_per_connection)]
+        return min(candidates, key=lambda c: len(c.rooms)) if len(candidates) > 0 else None
+
+    def _get_connection(self, room: Optional[str] = None) -> Optional[_ChatConnection]:
+        """Returns the connection the given room was joined through, falls back to the first connection"""
+        if room is not None:
+            for connection in self._connections:
+                if room in connection.rooms:
+                    return connection
+        return self._connections[0] if len(self._connections) > 0 else None
+
+    def _connection_lost(self, connection: _ChatConnection):
+        if connection not in self._connections:
+            return
+        if len(self._connections) == 1:
+            # nothing is left to move the rooms to, the bot can not send or receive anymore
+            self._ready = False
+            return
+        self._connections.remove(connection)
+        rooms = list(connection.rooms)
+        connection.rooms.clear()
+        if len(rooms) > 0:
+            self.logger.warning(f'moving {len(rooms)} chat rooms of lost connection {connection.index} to the remaining connections')
+            t = asyncio.ensure_future(self.join_room(rooms))
+            t.add_done_callback(self._task_callback)
+
+    async def _send_message(self, message: str, connection: Optional[_ChatConnection] = None):
+        if connection is None:
+            connection = self._get_connection()
         self.logger.debug(f'> "{message}"')
-        await self.__connection.send_str(message)
+        await connection.websocket.send_str(message)
 
-    async def __task_receive(self):
+    async def __task_receive(self, connection: _ChatConnection):
         receive_timeout = None if self.no_message_reset_time is None else self.no_message_reset_time * 60
         try:
             handlers: Dict[str, Callable] = {
-                'PING': self._handle_ping,
+                'PING': partial(self._handle_ping, connection=connection),
                 'PRIVMSG': self._handle_msg,
-                '001': self._handle_ready,
+                '001': partial(self._handle_ready, connection=connection),
                 'ROOMSTATE': self._handle_room_state,
                 'JOIN': self._handle_join,
                 'USERNOTICE': self._handle_user_notice,
@@ -921,87 +1377,154 @@ class Chat:
                 'NOTICE': self._handle_notice,
                 'CLEARCHAT': self._handle_clear_chat,
                 'WHISPER': self._handle_whisper,
-                'RECONNECT': self._handle_reconnect,
+                'RECONNECT': partial(self._handle_reconnect, connection=connection),
                 'USERSTATE': self._handle_user_state
             }
-            while not self.__connection.closed:
+            while not connection.closed:
+                websocket = connection.websocket
                 try:  # At minimum we should receive a PING request just under every 5 minutes
-                    message = await self.__connection.receive(timeout=receive_timeout)
+                    message = await websocket.receive(timeout=receive_timeout)
                 except asyncio.TimeoutError:
                     self.logger.warning(f"Reached timeout for websocket receive, will attempt a reconnect")
                     if self.__running:
                         try:
-                            await self._handle_base_reconnect()
+                            await self._handle_base_reconnect(connection)
                         except TwitchBackendException:
                             self.logger.exception('Connection to chat websocket lost and unable to reestablish connection!')
+                            self._connection_lost(connection)
                             break
                     else:
                         break
                 if message.type == aiohttp.WSMsgType.TEXT:
                     messages = message.data.split('\r\n')
+                    # local to this receive loop, other connections handle their frames at the same time
+                    batch = [] if self.batch_dispatch else None
                     for m in messages:
                         if len(m) == 0:
                             continue
                         self.logger.debug(f'< {m}')
+                        if self._skip_irc_message(m):
+                            continue
                         parsed = self._parse_irc_message(m)
                         # a message we don't know or don't care about
                         if parsed is None:
                             continue
                         handler = handlers.get(parsed['command']['command'])
-                        if handler is not None:
+                        if handler is None:
+                            continue
+                        if batch is None or parsed['command']['command'] in _IRC_TASK_COMMANDS:
                             asyncio.ensure_future(handler(parsed))
+                            continue
+                        # only set while the handler runs inline, so tasks created by this loop never inherit the batch
+                        token = _CHAT_BATCH.set(batch)
+                        try:
+                            await handler(parsed)
+                        except Exception:
+                            self.logger.exception(f'Error while handling {parsed["command"]["command"]}')
+                        finally:
+                            _CHAT_BATCH.reset(token)
+                    if batch:
+                        t = asyncio.ensure_future(self._run_batch(batch), loop=self._callback_loop)
+                        t.add_done_callback(self._task_callback)
                 elif message.type == aiohttp.WSMsgType.CLOSED:
                     self.logger.debug('websocket is closing')
+                    if connection.reconnecting or websocket is not connection.websocket:
+                        # a RECONNECT request closed the websocket and replaces it
+                        while connection.reconnecting:
+                            await asyncio.sleep(0.01)
+                        continue
                     if self.__running:
                         try:
-                            await self._handle_base_reconnect()
+                            await self._handle_base_reconnect(connection)
                         except TwitchBackendException:
                             self.logger.exception('Connection to chat websocket lost and unable to reestablish connection!')
+                            self._connection_lost(connection)
                             break
                     else:
                         break
                 elif message.type == aiohttp.WSMsgType.ERROR:
-                    self.logger.warning('error in websocket: ' + str(self.__connection.exception()))
+                    self.logger.warning('error in websocket: ' + str(connection.websocket.exception()))
                     break
         except CancelledError:
             # we are closing down!
             # print('we are closing down!')
             return
 
-    async def _handle_base_reconnect(self):
-        await self.__connect(is_startup=False)
-        await self.__task_startup()
+    def _emit(self, event: ChatEvent, data):
+        for handler in self._event_handler.get(event, []):
+            self._schedule(handler, data)
+
+    def _schedule(self, handler: Callable[[Any], Awaitable[None]], data):
+        batch = _CHAT_BATCH.get()
+        if batch is not None:
+            batch.append((handler, data))
+            return
+        t = asyncio.ensure_future(handler(data), loop=self._callback_loop)
+        t.add_done_callback(self._task_callback)
+
+    async def _run_batch(self, batch: List[Tuple[Callable[[Any], Awaitable[None]], Any]]):
+        for handler, data in batch:
+            try:
+                await handler(data)
+            except Exception as e:
+                self.logger.exception('Error while running callback', exc_info=e)
+
+    def _feed_message_queues(self, message: Optional['ChatMessage']):
+        for entry in list(self._message_queues):
+            loop, queue = entry
+            if loop is self.__socket_loop:
+                self._put_message(queue, message)
+                continue
+            try:
+                loop.call_soon_threadsafe(self._put_message, queue, message)
+            except RuntimeError:
+                # the loop of the consumer was closed without ending the iteration
+                self._message_queues.remove(entry)
+                self._update_dispatch_filter()
+
+    @staticmethod
+    def _put_message(queue: asyncio.Queue, message: Optional['ChatMessage']):
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+    async def _handle_base_reconnect(self, connection: Optional[_ChatConnection] = None):
+        if connection is None:
+            connection = self._get_connection()
+        connection.reconnecting = True
+        try:
+            await self.__connect(connection, is_startup=False)
+            await self.__task_startup(connection)
+        finally:
+            connection.reconnecting = False
 
     # noinspection PyUnusedLocal
-    async def _handle_reconnect(self, parsed: dict):
+    async def _handle_reconnect(self, parsed: dict, connection: Optional[_ChatConnection] = None):
         self.logger.info('got reconnect request...')
-        await self._handle_base_reconnect()
+        try:
+            await self._handle_base_reconnect(connection)
+        except TwitchBackendException:
+            self.logger.exception('Connection to chat websocket lost and unable to reestablish connection!')
+            self._connection_lost(connection if connection is not None else self._get_connection())
+            return
         self.logger.info('reconnect completed')
 
     async def _handle_whisper(self, parsed: dict):
         e = WhisperEvent(self, parsed)
-        for handler in self._event_handler.get(ChatEvent.WHISPER, []):
-            t = asyncio.ensure_future(handler(e), loop=self._callback_loop)
-            t.add_done_callback(self._task_callback)
+        self._emit(ChatEvent.WHISPER, e)
 
     async def _handle_clear_chat(self, parsed: dict):
         e = ClearChatEvent(self, parsed)
-        for handler in self._event_handler.get(ChatEvent.CHAT_CLEARED, []):
-            t = asyncio.ensure_future(handler(e), loop=self._callback_loop)
-            t.add_done_callback(self._task_callback)
+        self._emit(ChatEvent.CHAT_CLEARED, e)
 
     async def _handle_notice(self, parsed: dict):
         e = NoticeEvent(self, parsed)
-        for handler in self._event_handler.get(ChatEvent.NOTICE, []):
-            t = asyncio.ensure_future(handler(e), loop=self._callback_loop)
-            t.add_done_callback(self._task_callback)
+        self._emit(ChatEvent.NOTICE, e)
         self.logger.debug(f'got NOTICE for channel {parsed["command"]["channel"]}: {parsed["tags"].get("msg-id")}')
 
     async def _handle_clear_msg(self, parsed: dict):
         ev = MessageDeletedEvent(self, parsed)
-        for handler in self._event_handler.get(ChatEvent.MESSAGE_DELETE, []):
-            t = asyncio.ensure_future(handler(ev), loop=self._callback_loop)
-            t.add_done_callback(self._task_callback)
+        self._emit(ChatEvent.MESSAGE_DELETE, ev)
 
     async def _handle_cap_reply(self, parsed: dict):
         self.logger.debug(f'got CAP reply, granted caps: {parsed["parameters"]}')
@@ -1016,14 +1539,10 @@ class Chat:
             self._room_join_locks.remove(ch)
         if nick == self.username:
             e = JoinedEvent(self, ch, nick)
-            for handler in self._event_handler.get(ChatEvent.JOINED, []):
-                t = asyncio.ensure_future(handler(e), loop=self._callback_loop)
-                t.add_done_callback(self._task_callback)
+            self._emit(ChatEvent.JOINED, e)
         else:
             e = JoinEvent(self, ch, nick)
-            for handler in self._event_handler.get(ChatEvent.JOIN, []):
-                t = asyncio.ensure_future(handler(e), loop=self._callback_loop)
-                t.add_done_callback(self._task_callback)
+            self._emit(ChatEvent.JOIN, e)
 
     async def _handle_part(self, parsed: dict):
         ch = parsed['command']['channel'][1:]
@@ -1031,28 +1550,22 @@ class Chat:
         if usr == self.username:
             if ch in self._room_leave_locks:
                 self._room_leave_locks.remove(ch)
+            for connection in self._connections:
+                connection.rooms.discard(ch)
             room = self.room_cache.pop(ch, None)
             e = LeftEvent(self, ch, room, usr)
-            for handler in self._event_handler.get(ChatEvent.LEFT, []):
-                t = asyncio.ensure_future(handler(e), loop=self._callback_loop)
-                t.add_done_callback(self._task_callback)
+            self._emit(ChatEvent.LEFT, e)
         else:
             room = self.room_cache.get(ch)
             e = LeftEvent(self, ch, room, usr)
-            for handler in self._event_handler.get(ChatEvent.USER_LEFT, []):
-                t = asyncio.ensure_future(handler(e), loop=self._callback_loop)
-                t.add_done_callback(self._task_callback)
+            self._emit(ChatEvent.USER_LEFT, e)
 
     async def _handle_user_notice(self, parsed: dict):
         if parsed['tags'].get('msg-id') == 'raid':
-            handlers = self._event_handler.get(ChatEvent.RAID, [])
-            for handler in handlers:
-                asyncio.ensure_future(handler(parsed))
+            self._emit(ChatEvent.RAID, _plain_parsed(parsed))
         elif parsed['tags'].get('msg-id') in ('sub', 'resub', 'subgift'):
             sub = ChatSub(self, parsed)
-            for handler in self._event_handler.get(ChatEvent.SUB, []):
-                t = asyncio.ensure_future(handler(sub), loop=self._callback_loop)
-                t.add_done_callback(self._task_callback)
+            self._emit(ChatEvent.SUB, sub)
 
     async def _handle_room_state(self, parsed: dict):
         self.logger.debug('got room state event')
@@ -1071,9 +1584,7 @@ class Chat:
             prev = dataclasses.replace(prev)
         self.room_cache[state.name] = state
         dat = RoomStateChangeEvent(self, prev, state)
-        for handler in self._event_handler.get(ChatEvent.ROOM_STATE_CHANGE, []):
-            t = asyncio.ensure_future(handler(dat), loop=self._callback_loop)
-            t.add_done_callback(self._task_callback)
+        self._emit(ChatEvent.ROOM_STATE_CHANGE, dat)
 
     async def _handle_user_state(self, parsed: dict):
         self.logger.debug('got user state event')
@@ -1083,67 +1594,91 @@ class Chat:
         self._mod_status_cache[parsed['command']['channel'][1:]] = 'mod' if parsed['tags']['mod'] == '1' or is_broadcaster else 'user'
         self._subscriber_status_cache[parsed['command']['channel'][1:]] = 'sub' if parsed['tags']['subscriber'] == '1' else 'non-sub'
 
-    async def _handle_ping(self, parsed: dict):
+    async def _handle_ping(self, parsed: dict, connection: Optional[_ChatConnection] = None):
         self.logger.debug('got PING')
-        await self._send_message('PONG ' + parsed['parameters'])
+        await self._send_message('PONG ' + parsed['parameters'], connection)
 
     # noinspection PyUnusedLocal
-    async def _handle_ready(self, parsed: dict):
+    async def _handle_ready(self, parsed: dict, connection: Optional[_ChatConnection] = None):
         self.logger.debug('got ready event')
+        if connection is None:
+            connection = self._get_connection()
+        # rooms of a reconnected connection are placed again, spreading them over the least used connections
+        rejoin = list(connection.rooms)
+        connection.rooms.clear()
+        connection.ready.set()
+        if connection is not self._get_connection():
+            if len(rejoin) > 0:
+                _failed = await self.join_room(rejoin)
+                if len(_failed) > 0:
+                    self.logger.warning(f'failed to rejoin the following channel after reconnect: {", ".join(_failed)}')
+            return
         dat = EventData(self)
         was_ready = self._ready
         self._ready = True
-        if self._join_target is not None and len(self._join_target) > 0:
-            _failed = await self.join_room(self._join_target)
+        target = rejoin if was_ready else self._join_target
+        if target is not None and len(target) > 0:
+            _failed = await self.join_room(target)
             if len(_failed) > 0:
                 self.logger.warning(f'failed to join the following channel of the initial following list: {", ".join(_failed)}')
             else:
                 self.logger.info('done joining initial channels')
         if not was_ready:
-            for h in self._event_handler.get(ChatEvent.READY, []):
-                t = asyncio.ensure_future(h(dat), loop=self._callback_loop)
-                t.add_done_callback(self._task_callback)
+            self._emit(ChatEvent.READY, dat)
+
+    async def _can_execute_command(self, command: ChatCommand, name: str) -> bool:
+        for mid in self._command_middleware + self._command_specific_middleware.get(name, []):
+            if not await mid.can_execute(command):
+                if mid.execute_blocked_handler is not None:
+                    await mid.execute_blocked_handler(command)
+                elif self.default_command_execution_blocked_handler is not None:
+                    await self.default_command_execution_blocked_handler(command)
+                return False
+        return True
+
+    async def _run_command(self, handler: COMMAND_CALLBACK_TYPE, name: str, command: ChatCommand, inline: bool = False):
+        if not await self._can_execute_command(command, name):
+            return
+        if inline:
+            try:
+                await handler(command)
+            except Exception as e:
+                self.logger.exception('Error while running callback', exc_info=e)
+        else:
+            t = asyncio.ensure_future(handler(command), loop=self._callback_loop)
+            t.add_done_callback(self._task_callback)
+        for mid in self._command_middleware + self._command_specific_middleware.get(name, []):
+            await mid.was_executed(command)
 
     async def _handle_msg(self, parsed: dict):
         if self.no_shared_chat_messages and "source-room-id" in parsed["tags"]:
             if parsed["tags"]["source-room-id"] != parsed["tags"].get("room-id"):
                 return
 
-        async def _can_execute_command(_com: ChatCommand, _name: str) -> bool:
-            for mid in self._command_middleware + self._command_specific_middleware.get(_name, []):
-                if not await mid.can_execute(command):
-                    if mid.execute_blocked_handler is not None:
-                        await mid.execute_blocked_handler(_com)
-                    elif self.default_command_execution_blocked_handler is not None:
-                        await self.default_command_execution_blocked_handler(_com)
-                    return False
-            return True
-
         self.logger.debug('got new message, call handler')
         if parsed['command'].get('bot_command') is not None:
             command_name = parsed['command'].get('bot_command').lower()
             handler = self._command_handler.get(command_name)
             if handler is not None:
                 command = ChatCommand(self, parsed)
-                # check middleware
-                if await _can_execute_command(command, command_name):
-                    t = asyncio.ensure_future(handler(command), loop=self._callback_loop)
-                    t.add_done_callback(self._task_callback)
-                    for _mid in self._command_middleware + self._command_specific_middleware.get(command_name, []):
-                        await _mid.was_executed(command)
+                batch = _CHAT_BATCH.get()
+                if batch is not None:
+                    # middleware might take a while, run it together with the listeners of this frame
+                    batch.append((partial(self._run_command, handler, command_name, inline=True), command))
+                else:
+                    await self._run_command(handler, command_name, command)
             else:
                 if self.log_no_registered_command_handler:
                     self.logger.info(f'no handler registered for command "{command_name}"')
-        handler = self._event_handler.get(ChatEvent.MESSAGE, [])
         message = ChatMessage(self, parsed)
-        for h in handler:
-            t = asyncio.ensure_future(h(message), loop=self._callback_loop)
-            t.add_done_callback(self._task_callback)
-
-    async def __task_startup(self):
-        await self._send_message('CAP REQ :twitch.tv/membership twitch.tv/tags twitch.tv/commands')
-        await self._send_message(f'PASS oauth:{await self.twitch.get_refreshed_user_auth_token()}')
-        await self._send_message(f'NICK {self.username}')
+        self._emit(ChatEvent.MESSAGE, message)
+        if len(self._message_queues) > 0:
+            self._feed_message_queues(message)
+
+    async def __task_startup(self, connection: _ChatConnection):
+        await self._send_message('CAP REQ :twitch.tv/membership twitch.tv/tags twitch.tv/commands', connection)
+        await self._send_message(f'PASS oauth:{await self.twitch.get_refreshed_user_auth_token()}', connection)
+        await self._send_message(f'NICK {self.username}', connection)
         self.__startup_complete = True
 
     def _get_message_bucket(self, channel) -> RateLimitBucket:
@@ -1171,6 +1706,7 @@ class Chat:
         if prefix is None or prefix[0] in ('/', '.'):
             raise ValueError('Prefix starting with / or . are reserved for twitch internal use')
         self._prefix = prefix
+        self._update_dispatch_filter()
 
     def set_channel_prefix(self, prefix: str, channel: Union[CHATROOM_TYPE, List[CHATROOM_TYPE]]):
         """Sets a command prefix for the given channel or channels
@@ -1189,6 +1725,7 @@ class Chat:
             if isinstance(ch, ChatRoom):
                 ch = ch.name
             self._channel_command_prefix[ch] = prefix
+        self._update_dispatch_filter()
 
     def reset_channel_prefix(self, channel: Union[CHATROOM_TYPE, List[CHATROOM_TYPE]]):
         """Resets the custom command prefix set by :const:`~twitchAPI.chat.Chat.set_channel_prefix()` back to the global one.
@@ -1201,6 +1738,7 @@ class Chat:
             if isinstance(ch, ChatRoom):
                 ch = ch.name
             self._channel_command_prefix.pop(ch, None)
+        self._update_dispatch_filter()
 
     def register_command(self, name: str, handler: COMMAND_CALLBACK_TYPE, command_middleware: Optional[List['BaseCommandMiddleware']] = None) -> bool:
         """Register a command
@@ -1217,6 +1755,7 @@ class Chat:
         self._command_handler[name] = handler
         if command_middleware is not None:
             self._command_specific_middleware[name] = command_middleware
+        self._update_dispatch_filter()
         return True
 
     def unregister_command(self, name: str) -> bool:
@@ -1229,6 +1768,7 @@ class Chat:
         if self._command_handler.get(name) is None:
             return False
         self._command_handler.pop(name, None)
+        self._update_dispatch_filter()
         return True
 
     def register_event(self, event: ChatEvent, handler: EVENT_CALLBACK_TYPE):
@@ -1243,6 +1783,7 @@ class Chat:
             self._event_handler[event] = [handler]
         else:
             self._event_handler[event].append(handler)
+        self._update_dispatch_filter()
 
     def unregister_event(self, event: ChatEvent, handler: EVENT_CALLBACK_TYPE) -> bool:
         """Unregister a handler from a event
@@ -1254,13 +1795,47 @@ class Chat:
         if self._event_handler.get(event) is None or handler not in self._event_handler.get(event):
             return False
         self._event_handler[event].remove(handler)
+        self._update_dispatch_filter()
         return True
 
+    async def messages(self, max_size: int = 0) -> AsyncGenerator[ChatMessage, None]:
+        """Iterate over all chat messages received from now on.
+
+        The messages are delivered in the event loop this is called from, without creating a task per message.
+
+        Example:
+
+        .. code-block:: python
+
+            async for msg in chat.messages():
+                print(msg.text)
+
+        The iteration ends once the chat is stopped.
+
+        :param max_size: The maximum number of messages waiting to be consumed, the oldest message is discarded if exceeded.
+            :code:`0` means no limit. |default|:code:`0`
+        """
+        entry = (asyncio.get_running_loop(), asyncio.Queue(maxsize=max_size))
+        self._message_queues.append(entry)
+        self._update_dispatch_filter()
+        try:
+            while True:
+                message = await entry[1].get()
+                if message is None:
+                    # the chat was stopped
+                    return
+                yield message
+        finally:
+            if entry in self._message_queues:
+                self._message_queues.remove(entry)
+            self._update_dispatch_filter()
+
     def is_connected(self) -> bool:
         """Returns your current connection status."""
-        if self.__connection is None:
+        connection = self._get_connection()
+        if connection is None:
             return False
-        return not self.__connection.closed
+        return not connection.closed
 
     def is_ready(self) -> bool:
         """Returns True if the chat bot is ready to join channels and/or receive events"""
@@ -1318,29 +1893,48 @@ class Chat:
         if isinstance(chat_rooms, str):
             chat_rooms = [chat_rooms]
         target = [c[1:].lower() if c[0] == '#' else c.lower() for c in chat_rooms]
+        # all connections are full
+        no_connection = []
+        placement: Dict[_ChatConnection, List[str]] = {}
+        new_rooms = set(r for r in target if not any(r in c.rooms for c in self._connections))
+        await self._open_connections(self._connections_needed(len(new_rooms)))
         for r in target:
-            self._room_join_locks.append(r)
-        if len(target) > self._join_bucket.left():
-            # we want to join more than the current bucket has left, join slowly one after another
-            # TODO we could join the current remaining bucket size in blocks
-            for r in target:
-                await self._join_bucket.put()
-                await self._send_message(f'JOIN #{r}')
-        else:
-            # enough space in the current bucket left, join all at once
-            await self._join_bucket.put(len(target))
-            await self._send_message(f'JOIN {",".join([f"#{x}" for x in target])}')
+            connection = self._get_connection(r)
+            if connection is None or r not in connection.rooms:
+                connection = self._pick_connection()
+                if connection is None:
+                    no_connection.append(r)
+                    continue
+                connection.rooms.add(r)
+            placement.setdefault(connection, []).append(r)
+        for connection, rooms in placement.items():
+            for r in rooms:
+                self._room_join_locks.append(r)
+            if len(rooms) > self._join_bucket.left():
+                # we want to join more than the current bucket has left, join slowly one after another
+                # TODO we could join the current remaining bucket size in blocks
+                for r in rooms:
+                    await self._join_bucket.put()
+                    await self._send_message(f'JOIN #{r}', connection)
+            else:
+                # enough space in the current bucket left, join all at once
+                await self._join_bucket.put(len(rooms))
+                await self._send_message(f'JOIN {",".join([f"#{x}" for x in rooms])}', connection)
         # wait for us to join all rooms
         timeout = datetime.datetime.now() + datetime.timedelta(seconds=self.join_timeout)
         while any([r in self._room_join_locks for r in target]) and timeout > datetime.datetime.now():
             await asyncio.sleep(0.01)
         failed_to_join = [r for r in self._room_join_locks if r in target]
-        self._join_target.extend([x for x in target if x not in failed_to_join])
+        self._join_target.extend([x for x in target if x not in failed_to_join and x not in no_connection])
         # deduplicate join target
         self._join_target = list(set(self._join_target))
         for r in failed_to_join:
             self._room_join_locks.remove(r)
-        return failed_to_join
+            for connection in placement.keys():
+                connection.rooms.discard(r)
+        if len(no_connection) > 0:
+            self.logger.warning(f'no chat connection left to join the following channel: {", ".join(no_connection)}')
+        return failed_to_join + no_connection
 
     async def send_raw_irc_message(self, message: str):
         """Send a raw IRC message
@@ -1350,12 +1944,27 @@ class Chat:
         """
         if not self.is_ready():
             raise ValueError('can\'t send message: bot not ready')
-        while not self.is_connected():
-            await asyncio.sleep(0.1)
+        await self._wait_for_connection()
         if message is None or len(message) == 0:
             raise ValueError('message must be a non empty string')
         await self._send_message(message)
 
+    async def _wait_for_connection(self, room: Optional[str] = None) -> _ChatConnection:
+        """Waits until the connection of the given room is open
+
+        :raises ValueError: if the bot is stopped or loses its last connection while waiting"""
+        connection = self._get_connection(room)
+        while connection is None or connection.closed:
+            if self._closing or not self._ready:
+                raise ValueError('can\'t send message: bot not ready')
+            await asyncio.sleep(0.1)
+            connection = self._get_connection(room)
+        return connection
+
+    async def _send_room_message(self, room: str, message: str):
+        connection = await self._wait_for_connection(room)
+        await self._send_message(message, connection)
+
     async def send_message(self, room: CHATROOM_TYPE, text: str):
         """Send a message to the given channel
 
@@ -1369,8 +1978,7 @@ class Chat:
         """
         if not self.is_ready():
             raise ValueError('can\'t send message: bot not ready')
-        while not self.is_connected():
-            await asyncio.sleep(0.1)
+        await self._wait_for_connection()
         if isinstance(room, ChatRoom):
             room = room.name
         if room is None or len(room) == 0:
@@ -1381,7 +1989,7 @@ class Chat:
             room = f'#{room}'.lower()
         bucket = self._get_message_bucket(room[1:])
         await bucket.put()
-        await self._send_message(f'PRIVMSG {room} :{text}')
+        await self._send_room_message(room[1:], f'PRIVMSG {room} :{text}')
 
     async def leave_room(self, chat_rooms: Union[List[str], str]):
         """leave one or more chat rooms\n
@@ -1390,11 +1998,13 @@ class Chat:
         :param chat_rooms: The room or rooms you want to leave"""
         if isinstance(chat_rooms, str):
             chat_rooms = [chat_rooms]
-        room_str = ','.join([f'#{c}'.lower() if c[0] != '#' else c.lower() for c in chat_rooms])
         target = [c[1:].lower() if c[0] == '#' else c.lower() for c in chat_rooms]
+        placement: Dict[_ChatConnection, List[str]] = {}
         for r in target:
             self._room_leave_locks.append(r)
-        await self._send_message(f'PART {room_str}')
+            placement.setdefault(self._get_connection(r), []).append(r)
+        for connection, rooms in placement.items():
+            await self._send_message(f'PART {",".join([f"#{x}" for x in rooms])}', connection)
         for x in target:
             if x in self._join_target:
                 self._join_target.remove(x)
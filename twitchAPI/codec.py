@@ -0,0 +1,138 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""
+JSON Codecs
+-----------
+
+All Helix responses, EventSub websocket messages and EventSub webhook bodies are JSON encoded.
+For applications handling a lot of these, decoding them can become one of the largest CPU costs.
+
+The codec used for this can be set via :const:`~twitchAPI.twitch.Twitch.json_codec` and
+:const:`~twitchAPI.eventsub.base.EventSubBase.json_codec`.
+By default, the fastest available codec is picked: `orjson <https://pypi.org/project/orjson/>`__ if it is installed,
+otherwise `msgspec <https://pypi.org/project/msgspec/>`__ if it is installed and the :code:`json` module of the standard library otherwise.
+
+Both optional codecs can be installed using pip:
+
+.. code-block:: bash
+
+    pip install orjson
+
+************
+Code Example
+************
+
+.. code-block:: python
+
+    from twitchAPI.twitch import Twitch
+    from twitchAPI.codec import get_json_codec
+
+    twitch = await Twitch(APP_ID, APP_SECRET)
+    # force the standard library codec
+    twitch.json_codec = get_json_codec('json')
+
+You can also use your own codec by subclassing :const:`~twitchAPI.codec.JSONCodec`.
+
+*******************
+Class Documentation
+*******************"""
+import json
+from typing import Any, Union, Dict, Type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+__all__ = ['JSONCodec', 'OrjsonCodec', 'MsgspecCodec', 'get_json_codec']
+
+
+class JSONCodec:
+    """JSON codec using the :code:`json` module of the standard library.
+
+    Subclass this to implement your own codec."""
+
+    name: str = 'json'
+    """The name of the codec, as used by :const:`~twitchAPI.codec.get_json_codec()`"""
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes a JSON document
+
+        :param data: the JSON document
+        :raises ValueError: if data is not a valid JSON document
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """Encodes obj as a JSON document
+
+        :param obj: the object to encode
+        """
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec using `orjson <https://pypi.org/project/orjson/>`__"""
+
+    name: str = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError('orjson is not installed')
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec using `msgspec <https://pypi.org/project/msgspec/>`__"""
+
+    name: str = 'msgspec'
+
+    def __init__(self):
+        if msgspec is None:
+            raise RuntimeError('msgspec is not installed')
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> str:
+        return msgspec.json.encode(obj).decode('utf-8')
+
+
+_CODECS: Dict[str, Type[JSONCodec]] = {
+    'json': JSONCodec,
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec
+}
+
+
+def get_json_codec(name: str = 'auto') -> JSONCodec:
+    """Returns a JSON codec by name
+
+    :param name: one of :code:`auto`, :code:`orjson`, :code:`msgspec` or :code:`json`.
+                :code:`auto` picks the fastest installed codec. |default| :code:`auto`
+    :raises ValueError: if name is not a known codec
+    :raises RuntimeError: if the requested codec is not installed
+    """
+    if name == 'auto':
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return JSONCodec()
+    codec = _CODECS.get(name)
+    if codec is None:
+        raise ValueError(f'unknown json codec {name}')
+    return codec()
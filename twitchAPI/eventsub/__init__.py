@@ -26,6 +26,9 @@ EventSub is available with different types of transports, used for different app
    * - :doc:`twitchAPI.eventsub.websocket`
      - Client / Single User
      - User Authentication
+   * - :doc:`twitchAPI.eventsub.conduit`
+     - Server / Very many subscriptions spread over multiple processes
+     - App Authentication
 
 
 .. _eventsub-available-topics:
@@ -32,15 +32,17 @@ from twitchAPI.object.eventsub import (ChannelPollBeginEvent, ChannelUpdateEvent
                                        ChannelSharedChatBeginEvent, ChannelSharedChatUpdateEvent, ChannelSharedChatEndEvent, ChannelBitsUseEvent,
                                        ChannelPointsAutomaticRewardRedemptionAdd2Event)
 from twitchAPI.helper import remove_none_values
-from twitchAPI.type import TwitchAPIException, AuthType
+from twitchAPI.type import TwitchAPIException, AuthType, OverflowPolicy
 import asyncio
 from logging import getLogger, Logger
 from twitchAPI.twitch import Twitch
+from twitchAPI.codec import JSONCodec
+from twitchAPI.eventsub.dispatch import DispatchQueue
 from abc import ABC, abstractmethod
 
-from typing import Union, Callable, Optional, Awaitable
+from typing import Union, Callable, Optional, Awaitable, Any
 
-__all__ = ['EventSubBase']
+__all__ = ['EventSubBase', 'EventSubSessionBase']
 
 
 class EventSubBase(ABC):
@@ -57,6 +59,8 @@ class EventSubBase(ABC):
         self.logger: Logger = getLogger(logger_name)
         """The logger used for EventSub related log messages"""
         self._callbacks = {}
+        self.json_codec: JSONCodec = twitch.json_codec
+        """The codec used to decode incoming messages. |default| the :const:`~twitchAPI.twitch.Twitch.json_codec` of twitch"""
 
     @abstractmethod
     def start(self):
@@ -75,10 +79,6 @@ class EventSubBase(ABC):
         :rtype: None
         """
 
-    @abstractmethod
-    def _get_transport(self) -> dict:
-        pass
-
     # ==================================================================================================================
     # HELPER
     # ==================================================================================================================
@@ -2011,3 +2011,66 @@ class EventSubBase(ABC):
             'broadcaster_user_id': broadcaster_user_id,
         }
         return await self._subscribe('channel.bits.use', '1', param, callback, ChannelBitsUseEvent)
+
+
+class EventSubSessionBase(EventSubBase, ABC):
+    """Base class of the EventSub clients which receive the notifications of their subscriptions through their own transport session.
+
+    Clients spreading their subscriptions over multiple sessions, like :const:`~twitchAPI.eventsub.websocket.ShardedEventSubWebsocket`
+    and :const:`~twitchAPI.eventsub.conduit.EventSubConduit`, only derive from :const:`~twitchAPI.eventsub.base.EventSubBase`."""
+
+    def __init__(self,
+                 twitch: Twitch,
+                 logger_name: str):
+        """
+        :param twitch: a app authenticated instance of :const:`~twitchAPI.twitch.Twitch`
+        :param logger_name: the name of the logger to be used
+        """
+        super().__init__(twitch, logger_name)
+        self.dispatch_queue: Optional[DispatchQueue] = None
+        """The queue notifications are passed through before their callbacks are called.
+        If None, a callback task is started right away for each notification. Set using
+        :const:`~twitchAPI.eventsub.base.EventSubSessionBase.enable_dispatch_queue()` |default| :code:`None`"""
+
+    @abstractmethod
+    def _get_transport(self) -> dict:
+        pass
+
+    def enable_dispatch_queue(self,
+                              max_size: int = 1000,
+                              concurrency: int = 10,
+                              overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                              spill_path: Optional[str] = None) -> DispatchQueue:
+        """Passes all notifications through a bounded queue instead of starting a callback task for each one right away.
+
+        See :doc:`/modules/twitchAPI.eventsub.dispatch` for details.
+
+        :param max_size: the maximum number of notifications held in memory |default| :code:`1000`
+        :param concurrency: the maximum number of callbacks running at the same time |default| :code:`10`
+        :param overflow_policy: what to do with new notifications once the queue is full |default| :const:`~twitchAPI.type.OverflowPolicy.BLOCK`
+        :param spill_path: the file used with :const:`~twitchAPI.type.OverflowPolicy.SPILL_TO_DISK`.
+                    A temporary file is used if None |default| :code:`None`
+        :return: the queue, use it to read the queue depth and latency gauges
+        """
+        if self.dispatch_queue is not None:
+            self.dispatch_queue.close()
+        self.dispatch_queue = DispatchQueue(self._dispatch_notification, max_size, concurrency, overflow_policy, spill_path,
+                                            json_codec=self.json_codec, logger=self.logger)
+        return self.dispatch_queue
+
+    async def _dispatch_notification(self, payload: Any):
+        # the data of a notification or, with worker processes of EventSubWebhook, its already built event object
+        if isinstance(payload, dict):
+            sub_id = payload.get('subscription', {}).get('id')
+        else:
+            sub_id = payload.subscription.id
+        callback = self._callbacks.get(sub_id)
+        if callback is None:
+            self.logger.error(f'received event for unknown subscription with ID {sub_id}')
+            return
+        coro = callback['callback'](callback['event'](**payload) if isinstance(payload, dict) else payload)
+        callback_loop = getattr(self, '_callback_loop', None)
+        if callback_loop is None or callback_loop is asyncio.get_running_loop():
+            await coro
+        else:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, callback_loop))
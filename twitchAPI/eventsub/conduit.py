@@ -0,0 +1,387 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""
+EventSub Conduit
+----------------
+
+.. note:: EventSub Conduits are targeted at programs which have to subscribe to a very large number of topics
+    and want to spread receiving the notifications over multiple processes or machines.\n
+    For smaller projects, look at :doc:`/modules/twitchAPI.eventsub.webhook` or :doc:`/modules/twitchAPI.eventsub.websocket`
+
+A conduit is a transport managed by Twitch which load balances the notifications of all subscriptions made on it over a number of shards.
+Each shard is either a EventSub websocket session or a EventSub webhook endpoint.
+
+All processes using the same conduit share the same subscriptions, so each of them can use the :code:`listen_` functions as usual.
+If a subscription was already created by another process, it is reused instead.
+Each process then adds one or more local shards which receive a part of all notifications.
+
+Conduits and subscriptions made on them require App Authentication.
+
+**********************
+Conduits and Shard IDs
+**********************
+
+Use :const:`~twitchAPI.eventsub.conduit.EventSubConduit.setup()` to create a new conduit or to change the number of shards of an existing one.
+Shard IDs are the numbers from :code:`0` to :code:`shard_count - 1` as strings, each of them should only be used by one process at a time.
+
+************
+Code Example
+************
+
+.. code-block:: python
+
+    from twitchAPI.twitch import Twitch
+    from twitchAPI.eventsub.conduit import EventSubConduit
+    from twitchAPI.object.eventsub import StreamOnlineEvent
+    import asyncio
+
+    APP_ID = 'your_app_id'
+    APP_SECRET = 'your_app_secret'
+    CONDUIT_ID = 'your_conduit_id'
+    SHARD_ID = '0'
+
+
+    async def on_online(data: StreamOnlineEvent):
+        print(f'{data.event.broadcaster_user_name} is live!')
+
+
+    async def run():
+        twitch = await Twitch(APP_ID, APP_SECRET)
+        conduit = EventSubConduit(twitch, conduit_id=CONDUIT_ID)
+        await conduit.setup()
+        conduit.start()
+        # this process receives the notifications sent to shard 0
+        await conduit.add_websocket_shard(SHARD_ID)
+        await conduit.listen_stream_online('12345', on_online)
+        try:
+            input('press Enter to shut down...')
+        finally:
+            await conduit.stop()
+            await twitch.close()
+
+
+    asyncio.run(run())
+
+*******************
+Class Documentation
+*******************"""
+import asyncio
+from functools import partial
+from ssl import SSLContext
+from typing import Optional, Callable, Awaitable, Dict, Union
+
+from .base import EventSubBase
+from .webhook import EventSubWebhook
+from .websocket import EventSubWebsocket
+from ..twitch import Twitch
+from ..helper import done_task_callback
+from ..object.api import Conduit
+from ..type import AuthType, TwitchBackendException, EventSubSubscriptionConflict, EventSubSubscriptionError, TwitchAuthorizationException, \
+    TwitchResourceNotFound
+
+__all__ = ['EventSubConduit']
+
+
+class _ConduitWebsocketShard(EventSubWebsocket):
+    """A websocket session receiving the notifications of one conduit shard"""
+
+    def __init__(self, conduit: 'EventSubConduit', shard_id: str, connection_url: Optional[str]):
+        super().__init__(conduit._twitch,
+                         connection_url=connection_url,
+                         callback_loop=conduit._callback_loop,
+                         message_deduplication_history_length=conduit._message_deduplication_history_length)
+        self._conduit: 'EventSubConduit' = conduit
+        self.shard_id: str = shard_id
+        # the subscriptions belong to the conduit
+        self._callbacks = conduit._callbacks
+        self.json_codec = conduit.json_codec
+        self._assign_error: Optional[Exception] = None
+
+    def _target_token(self) -> AuthType:
+        return AuthType.APP
+
+    async def _handle_welcome(self, data: dict):
+        session_id = data.get('payload', {}).get('session', {}).get('id')
+        self._assign_error = None
+        try:
+            await self._conduit._assign_shard(self.shard_id, {'method': 'websocket', 'session_id': session_id})
+        except Exception as e:
+            self.logger.exception(f'failed to assign session {session_id} to conduit shard {self.shard_id}')
+            self._assign_error = e
+        await super()._handle_welcome(data)
+
+    async def _resubscribe(self):
+        # subscriptions are made on the conduit and survive the session
+        pass
+
+    async def _handle_revocation(self, data: dict):
+        await self._conduit._handle_revocation(data.get('payload', {}))
+
+
+class _ConduitWebhookShard(EventSubWebhook):
+    """A webhook endpoint receiving the notifications of one conduit shard"""
+
+    def __init__(self,
+                 conduit: 'EventSubConduit',
+                 shard_id: str,
+                 callback_url: str,
+                 port: int,
+                 ssl_context: Optional[SSLContext],
+                 host_binding: str):
+        super().__init__(callback_url, port, conduit._twitch,
+                         ssl_context=ssl_context,
+                         host_binding=host_binding,
+                         callback_loop=conduit._callback_loop,
+                         revocation_handler=conduit.revokation_handler,
+                         message_deduplication_history_length=conduit._message_deduplication_history_length)
+        self._conduit: 'EventSubConduit' = conduit
+        self.shard_id: str = shard_id
+        # the subscriptions belong to the conduit and outlive this shard
+        self._callbacks = conduit._callbacks
+        self.unsubscribe_on_stop = False
+        self.json_codec = conduit.json_codec
+
+    async def _handle_challenge_message(self, data: dict) -> str:
+        self.logger.debug(f'received challenge for conduit shard {self.shard_id}')
+        return data.get('challenge')
+
+
+class EventSubConduit(EventSubBase):
+    """EventSub client using a Twitch managed conduit as transport, see :doc:`/modules/twitchAPI.eventsub.conduit`"""
+
+    def __init__(self,
+                 twitch: Twitch,
+                 conduit_id: Optional[str] = None,
+                 subscription_url: Optional[str] = None,
+                 callback_loop: Optional[asyncio.AbstractEventLoop] = None,
+                 revocation_handler: Optional[Callable[[dict], Awaitable[None]]] = None,
+                 message_deduplication_history_length: int = 50):
+        """
+        :param twitch: a app authenticated instance of :const:`~twitchAPI.twitch.Twitch`
+        :param conduit_id: The ID of the conduit to use. A new conduit is created by :const:`~twitchAPI.eventsub.conduit.EventSubConduit.setup()`
+            if this is None. |default| :code:`None`
+        :param subscription_url: Alternative subscription URL, useful for development with the twitch-cli
+        :param callback_loop: The asyncio eventloop to be used for callbacks. \n
+            Set this if you or a library you use cares about which asyncio event loop is running the callbacks.
+            Defaults to the one used by each shard.
+        :param revocation_handler: Optional handler for when subscriptions get revoked. |default| :code:`None`
+        :param message_deduplication_history_length: The amount of messages being considered for the duplicate message deduplication
+            by each shard. |default| :code:`50`
+        """
+        super().__init__(twitch, 'twitchAPI.eventsub.conduit')
+        self.conduit_id: Optional[str] = conduit_id
+        """The ID of the used conduit"""
+        self.subscription_url: Optional[str] = subscription_url
+        """Alternative subscription URL, useful for development with the twitch-cli"""
+        if self.subscription_url is not None and self.subscription_url[-1] != '/':
+            self.subscription_url += '/'
+        self.revokation_handler: Optional[Callable[[dict], Awaitable[None]]] = revocation_handler
+        """Optional handler for when subscriptions get revoked."""
+        self.shards: Dict[str, Union[EventSubWebsocket, EventSubWebhook]] = {}
+        """The shards of the conduit run by this process, by shard ID"""
+        self._callback_loop: Optional[asyncio.AbstractEventLoop] = callback_loop
+        self._message_deduplication_history_length: int = message_deduplication_history_length
+        self._running: bool = False
+        self._task_callback = partial(done_task_callback, self.logger)
+
+    async def setup(self, shard_count: Optional[int] = None) -> Conduit:
+        """Creates a new conduit if no conduit ID was given, otherwise changes the number of shards of the conduit if shard_count is given.
+
+        :param shard_count: The number of shards of the conduit. Defaults to 1 for new conduits. |default| :code:`None`
+        :raises ~twitchAPI.type.TwitchResourceNotFound: if the conduit was not found
+        :return: the used conduit
+        """
+        if self.conduit_id is None:
+            conduit = await self._twitch.create_conduit(shard_count if shard_count is not None else 1)
+            self.conduit_id = conduit.id
+            self.logger.debug(f'created conduit {conduit.id} with {conduit.shard_count} shards')
+            return conduit
+        if shard_count is not None:
+            return await self._twitch.update_conduit(self.conduit_id, shard_count)
+        for conduit in await self._twitch.get_conduits():
+            if conduit.id == self.conduit_id:
+                return conduit
+        raise TwitchResourceNotFound(f'conduit {self.conduit_id} not found')
+
+    def start(self):
+        """Starts the EventSub client, shards can be added afterwards
+
+        :rtype: None
+        :raises RuntimeError: if EventSub is already running or no conduit is set
+        """
+        if self._running:
+            raise RuntimeError('EventSubConduit is already started!')
+        if self.conduit_id is None:
+            raise RuntimeError('no conduit set, call setup() first')
+        self._running = True
+
+    async def stop(self):
+        """Stops the EventSub client and all local shards.
+
+        The subscriptions of the conduit are kept, since other processes might still use them.
+
+        :rtype: None
+        :raises RuntimeError: if EventSub is not running
+        """
+        if not self._running:
+            raise RuntimeError('EventSubConduit is not running')
+        self._running = False
+        shards = list(self.shards.values())
+        self.shards = {}
+        for shard in shards:
+            await shard.stop()
+
+    def _check_new_shard(self, shard_id: str):
+        if not self._running:
+            raise RuntimeError('EventSubConduit is not running')
+        if shard_id in self.shards:
+            raise ValueError(f'shard {shard_id} is already running in this process')
+
+    async def add_websocket_shard(self, shard_id: str, connection_url: Optional[str] = None) -> EventSubWebsocket:
+        """Opens a new EventSub websocket session and assigns it to the given shard of the conduit.
+
+        The session is assigned again whenever it has to reconnect.
+
+        :param shard_id: the ID of the shard
+        :param connection_url: Alternative connection URL, useful for development with the twitch-cli |default| :code:`None`
+        :raises RuntimeError: if EventSub is not running
+        :raises ValueError: if the shard is already running in this process
+        :raises ~twitchAPI.type.EventSubSubscriptionError: if the shard could not be assigned
+        :return: the websocket client of the shard
+        """
+        self._check_new_shard(shard_id)
+        shard = _ConduitWebsocketShard(self, shard_id, connection_url)
+        self.shards[shard_id] = shard
+        await asyncio.get_running_loop().run_in_executor(None, shard.start)
+        if shard._assign_error is not None:
+            await self.remove_shard(shard_id)
+            raise shard._assign_error
+        return shard
+
+    async def add_webhook_shard(self,
+                                shard_id: str,
+                                callback_url: str,
+                                port: int,
+                                ssl_context: Optional[SSLContext] = None,
+                                host_binding: str = '0.0.0.0') -> EventSubWebhook:
+        """Starts a new EventSub webhook endpoint and assigns it to the given shard of the conduit.
+
+        :param shard_id: the ID of the shard
+        :param callback_url: The full URL of the webhook.
+        :param port: the port on which this webhook should run
+        :param ssl_context: optional ssl context to be used |default| :code:`None`
+        :param host_binding: the host to bind the internal server to |default| :code:`0.0.0.0`
+        :raises RuntimeError: if EventSub is not running
+        :raises ValueError: if the shard is already running in this process
+        :raises ~twitchAPI.type.EventSubSubscriptionError: if the shard could not be assigned
+        :return: the webhook client of the shard
+        """
+        self._check_new_shard(shard_id)
+        shard = _ConduitWebhookShard(self, shard_id, callback_url, port, ssl_context, host_binding)
+        self.shards[shard_id] = shard
+        await asyncio.get_running_loop().run_in_executor(None, shard.start)
+        try:
+            await self._assign_shard(shard_id, shard._get_transport())
+        except Exception:
+            await self.remove_shard(shard_id)
+            raise
+        return shard
+
+    async def remove_shard(self, shard_id: str):
+        """Stops the local shard with the given ID.
+
+        Twitch considers the shard disconnected until it gets assigned again, e.g. by another process.
+
+        :param shard_id: the ID of the shard
+        :raises KeyError: if the shard is not running in this process
+        """
+        shard = self.shards.pop(shard_id)
+        await shard.stop()
+
+    async def _assign_shard(self, shard_id: str, transport: dict):
+        self.logger.debug(f'assigning {transport["method"]} transport to conduit shard {shard_id}')
+        result = await self._twitch.update_conduit_shards(self.conduit_id, [{'id': shard_id, 'transport': transport}])
+        if result.errors:
+            raise EventSubSubscriptionError(f'failed to assign conduit shard {shard_id}: {result.errors[0].message}')
+
+    def _get_transport(self) -> dict:
+        return {
+            'method': 'conduit',
+            'conduit_id': self.conduit_id
+        }
+
+    async def _build_request_header(self) -> dict:
+        token = await self._twitch.get_refreshed_app_token()
+        if token is None:
+            raise TwitchAuthorizationException('no Authorization set!')
+        return {
+            'Client-ID': self._twitch.app_id,
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {token}'
+        }
+
+    def _target_token(self) -> AuthType:
+        return AuthType.APP
+
+    async def _find_subscription(self, sub_type: str, sub_version: str, condition: dict) -> Optional[str]:
+        # Twitch only allows one filter, a user of the condition narrows the list down the most
+        user_id = next((value for key, value in condition.items() if key.endswith('user_id') and value), None)
+        if user_id is not None:
+            subs = await self._twitch.get_eventsub_subscriptions(user_id=user_id)
+        else:
+            subs = await self._twitch.get_eventsub_subscriptions(sub_type=sub_type)
+        async for sub in subs:
+            if sub.type != sub_type or sub.version != sub_version or sub.transport.get('conduit_id') != self.conduit_id:
+                continue
+            if all(sub.condition.get(key) == value for key, value in condition.items()):
+                return sub.id
+        return None
+
+    async def _subscribe(self, sub_type: str, sub_version: str, condition: dict, callback, event, is_batching_enabled: Optional[bool] = None) -> str:
+        """"Subscribe to Twitch Topic"""
+        if not asyncio.iscoroutinefunction(callback):
+            raise ValueError('callback needs to be a async function which takes one parameter')
+        if self.conduit_id is None:
+            raise RuntimeError('no conduit set, call setup() first')
+        self.logger.debug(f'subscribe to {sub_type} version {sub_version} with condition {condition}')
+        data = {
+            'type': sub_type,
+            'version': sub_version,
+            'condition': condition,
+            'transport': self._get_transport()
+        }
+        if is_batching_enabled is not None:
+            data['is_batching_enabled'] = is_batching_enabled
+        session = await self._twitch._get_session()
+        sub_base = self.subscription_url if self.subscription_url is not None else self._twitch.base_url
+        r_data = await self._api_post_request(session, sub_base + 'eventsub/subscriptions', data=data)
+        result = await r_data.json(loads=self.json_codec.loads)
+        error = result.get('error')
+        if r_data.status == 500:
+            raise TwitchBackendException(error)
+        if error is not None:
+            if error.lower() != 'conflict':
+                raise EventSubSubscriptionError(result.get('message'))
+            # another process already subscribed to this topic on the conduit, just listen to it as well
+            sub_id = await self._find_subscription(sub_type, sub_version, condition)
+            if sub_id is None:
+                raise EventSubSubscriptionConflict(result.get('message', ''))
+        else:
+            sub_id = result['data'][0]['id']
+        self.logger.debug(f'subscription for {sub_type} version {sub_version} with condition {condition} has id {sub_id}')
+        self._add_callback(sub_id, callback, event)
+        self._callbacks[sub_id]['active'] = True
+        return sub_id
+
+    async def _unsubscribe_hook(self, topic_id: str) -> bool:
+        return True
+
+    async def _handle_revocation(self, payload: dict):
+        sub_id: str = payload.get('subscription', {}).get('id')
+        self.logger.debug(f'got revocation of subscription {sub_id} for reason {payload.get("subscription", {}).get("status")}')
+        if self._callbacks.pop(sub_id, None) is None:
+            self.logger.warning(f'unknown subscription {sub_id} got revoked. ignore')
+            return
+        if self.revokation_handler is not None:
+            loop = self._callback_loop if self._callback_loop is not None else asyncio.get_running_loop()
+            t = loop.create_task(self.revokation_handler(payload))
+            t.add_done_callback(self._task_callback)
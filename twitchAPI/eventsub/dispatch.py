@@ -0,0 +1,312 @@
+#  Copyright (c) 2024. Lena "Teekeks" During <info@teawork.de>
+"""
+Dispatch Queue
+--------------
+
+By default, every EventSub notification starts a new task running your callback right away.
+If your callbacks are slower than the rate notifications arrive at, e.g. during big events, these tasks pile up without any limit.
+
+A :const:`~twitchAPI.eventsub.dispatch.DispatchQueue` sits between receiving notifications and calling the callbacks.
+It runs a fixed number of callbacks at the same time and holds up to a configurable number of notifications.
+What happens to new notifications once it is full is controlled by :const:`~twitchAPI.type.OverflowPolicy`.
+
+Enable it using :const:`~twitchAPI.eventsub.base.EventSubSessionBase.enable_dispatch_queue()`.
+It is available for :const:`~twitchAPI.eventsub.websocket.EventSubWebsocket` and :const:`~twitchAPI.eventsub.webhook.EventSubWebhook`.
+
+************
+Code Example
+************
+
+.. code-block:: python
+
+    from twitchAPI.type import OverflowPolicy
+
+    eventsub = EventSubWebsocket(twitch)
+    queue = eventsub.enable_dispatch_queue(max_size=5000, concurrency=20, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    eventsub.start()
+    # ...
+    print(queue.stats())
+
+*******************
+Class Documentation
+*******************"""
+import asyncio
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger, getLogger
+from typing import Callable, Awaitable, Optional, Any, Dict, List, Tuple, IO, Union
+
+from ..codec import JSONCodec, get_json_codec
+from ..type import OverflowPolicy
+
+__all__ = ['DispatchQueue']
+
+
+class DispatchQueue:
+    """Bounded queue between receiving notifications and running their callbacks"""
+
+    def __init__(self,
+                 handler: Callable[[Any], Awaitable[None]],
+                 max_size: int = 1000,
+                 concurrency: int = 10,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 spill_path: Optional[str] = None,
+                 json_codec: Optional[JSONCodec] = None,
+                 logger: Optional[Logger] = None):
+        """
+        :param handler: called with each queued payload
+        :param max_size: the maximum number of payloads held in memory |default| :code:`1000`
+        :param concurrency: the maximum number of handlers running at the same time |default| :code:`10`
+        :param overflow_policy: what to do with new payloads once the queue is full |default| :const:`~twitchAPI.type.OverflowPolicy.BLOCK`
+        :param spill_path: the file used with :const:`~twitchAPI.type.OverflowPolicy.SPILL_TO_DISK`.
+                    A temporary file is used if None |default| :code:`None`
+        :param json_codec: the codec used to write payloads to disk |default| :code:`get_json_codec()`
+        :param logger: the logger used to log errors of the handler |default| :code:`None`
+        """
+        if max_size < 1:
+            raise ValueError('max_size has to be at least 1')
+        if concurrency < 1:
+            raise ValueError('concurrency has to be at least 1')
+        self._handler: Callable[[Any], Awaitable[None]] = handler
+        self.max_size: int = max_size
+        """the maximum number of payloads held in memory"""
+        self.concurrency: int = concurrency
+        """the maximum number of handlers running at the same time"""
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        """what to do with new payloads once the queue is full"""
+        self.spill_path: Optional[str] = spill_path
+        """the file used with :const:`~twitchAPI.type.OverflowPolicy.SPILL_TO_DISK`"""
+        self._json_codec: JSONCodec = json_codec if json_codec is not None else get_json_codec()
+        self._logger: Logger = logger if logger is not None else getLogger('twitchAPI.eventsub.dispatch')
+        self._items: 'deque[Tuple[float, Any]]' = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
+        self._not_empty: Optional[asyncio.Event] = None
+        self._not_full: Optional[asyncio.Event] = None
+        self._spill_file: Optional[IO[bytes]] = None
+        self._spill_file_path: Optional[str] = None
+        self._spill_offset: int = 0
+        self._spill_count: int = 0
+        self._loading: bool = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: int = 0
+        self._latency_sum: float = 0.0
+        self.processed: int = 0
+        """Number of payloads handled"""
+        self.dropped: int = 0
+        """Number of payloads discarded because the queue was full or they could not be read back from disk"""
+        self.spilled: int = 0
+        """Number of payloads written to disk because the queue was full"""
+        self.max_latency: float = 0.0
+        """The longest time in seconds a payload waited in the queue before being handled"""
+
+    @property
+    def depth(self) -> int:
+        """Number of payloads waiting to be handled, including the ones written to disk"""
+        return len(self._items) + self._spill_count
+
+    @property
+    def in_flight(self) -> int:
+        """Number of handlers currently running"""
+        return self._in_flight
+
+    @property
+    def average_latency(self) -> float:
+        """The average time in seconds payloads waited in the queue before being handled"""
+        return self._latency_sum / self.processed if self.processed > 0 else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the current queue depth, the latency gauges and counters"""
+        return {
+            'depth': self.depth,
+            'spilled_depth': self._spill_count,
+            'in_flight': self._in_flight,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'spilled': self.spilled,
+            'average_latency': self.average_latency,
+            'max_latency': self.max_latency
+        }
+
+    def reset_stats(self):
+        """Resets the counters and latency gauges"""
+        self.processed = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.max_latency = 0.0
+        self._latency_sum = 0.0
+
+    def _ensure_started(self):
+        if self._loop is not None:
+            return
+        # the events and workers have to be created within the event loop they are used in
+        self._loop = asyncio.get_running_loop()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._workers = [asyncio.ensure_future(self._work()) for _ in range(self.concurrency)]
+
+    def put_nowait(self, payload: Any) -> bool:
+        """Adds a payload to the queue without waiting, applying the overflow policy if the queue is full.
+
+        All payloads have to be put from the same event loop.
+
+        :param payload: the payload to pass to the handler, has to be json serializable for
+                    :const:`~twitchAPI.type.OverflowPolicy.SPILL_TO_DISK`
+        :return: False if the queue is full and the overflow policy is :const:`~twitchAPI.type.OverflowPolicy.BLOCK`, True otherwise
+        """
+        self._ensure_started()
+        return self._put((time.monotonic(), payload))
+
+    async def put(self, payload: Any):
+        """Adds a payload to the queue, applying the overflow policy if the queue is full.
+
+        With :const:`~twitchAPI.type.OverflowPolicy.BLOCK` this waits until there is space in the queue again.
+        All payloads have to be put from the same event loop.
+
+        :param payload: the payload to pass to the handler, has to be json serializable for
+                    :const:`~twitchAPI.type.OverflowPolicy.SPILL_TO_DISK`
+        """
+        self._ensure_started()
+        item = (time.monotonic(), payload)
+        while not self._put(item):
+            self._not_full.clear()
+            await self._not_full.wait()
+
+    def _put(self, item: Tuple[float, Any]) -> bool:
+        if self._spill_count > 0:
+            # keep the order, older payloads are still on disk
+            self._spill(item)
+            return True
+        if len(self._items) >= self.max_size:
+            if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                self._items.popleft()
+                self.dropped += 1
+            elif self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return True
+            elif self.overflow_policy == OverflowPolicy.SPILL_TO_DISK:
+                self._spill(item)
+                return True
+            else:
+                return False
+        self._items.append(item)
+        self._not_empty.set()
+        return True
+
+    def _spill(self, item: Tuple[float, Any]):
+        # all file access runs on the single spill thread, in the order it was submitted in
+        self._spill_executor().submit(self._write_spilled, self._json_codec.dumps(item))
+        self._spill_count += 1
+        self.spilled += 1
+        self._not_empty.set()
+
+    def _spill_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='twitchapi_dispatch_spill')
+        return self._executor
+
+    def _write_spilled(self, line: Union[str, bytes]):
+        try:
+            if self._spill_file is None:
+                if self.spill_path is None:
+                    fd, self._spill_file_path = tempfile.mkstemp(prefix='twitchapi_dispatch_', suffix='.jsonl')
+                    self._spill_file = os.fdopen(fd, 'w+b')
+                else:
+                    self._spill_file = open(self.spill_path, 'w+b')
+            self._spill_file.seek(0, os.SEEK_END)
+            self._spill_file.write((line.encode('utf-8') if isinstance(line, str) else line) + b'\n')
+        except Exception as e:
+            self._logger.exception('failed to write payload to disk', exc_info=e)
+
+    def _read_spilled(self, num: int, remaining: int) -> Tuple[List[Tuple[float, Any]], int]:
+        """reads the next num payloads, returns them together with the number of payloads that could not be read"""
+        self._spill_file.seek(self._spill_offset)
+        items = []
+        lost = 0
+        for _ in range(num):
+            try:
+                timestamp, payload = self._json_codec.loads(self._spill_file.readline())
+            except ValueError:
+                # a failed write left a broken or no line behind
+                lost += 1
+                continue
+            items.append((timestamp, payload))
+        if remaining == 0:
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+            self._spill_offset = 0
+        else:
+            self._spill_offset = self._spill_file.tell()
+        return items, lost
+
+    def _close_spilled(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+            if self._spill_file_path is not None:
+                os.remove(self._spill_file_path)
+                self._spill_file_path = None
+        self._spill_offset = 0
+
+    async def _load_spilled(self):
+        num = min(self._spill_count, self.max_size)
+        self._loading = True
+        try:
+            # writes submitted while reading run after the read, so the file can be truncated if nothing older is left
+            remaining = self._spill_count - num
+            items, lost = await asyncio.get_running_loop().run_in_executor(self._spill_executor(), self._read_spilled, num, remaining)
+        except Exception as e:
+            self._logger.exception('failed to read payloads from disk', exc_info=e)
+            items, lost = [], num
+        finally:
+            self._loading = False
+        self._spill_count -= num
+        if lost > 0:
+            self._logger.error(f'dropped {lost} payloads that could not be read back from disk')
+            self.dropped += lost
+        self._items.extend(items)
+        self._not_empty.set()
+
+    async def _get(self) -> Tuple[float, Any]:
+        while len(self._items) == 0:
+            if self._spill_count > 0 and not self._loading:
+                await self._load_spilled()
+            else:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+    async def _work(self):
+        while True:
+            enqueued, payload = await self._get()
+            latency = time.monotonic() - enqueued
+            self._latency_sum += latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+            self._in_flight += 1
+            try:
+                await self._handler(payload)
+            except Exception as e:
+                self._logger.exception('Error while running callback', exc_info=e)
+            finally:
+                self._in_flight -= 1
+                self.processed += 1
+
+    def close(self):
+        """Stops handling payloads. Payloads still in the queue are discarded."""
+        if self._loop is not None and not self._loop.is_closed():
+            for worker in self._workers:
+                self._loop.call_soon_threadsafe(worker.cancel)
+        self._workers = []
+        self._loop = None
+        self._items.clear()
+        self._spill_count = 0
+        if self._executor is not None:
+            self._executor.submit(self._close_spilled)
+            self._executor.shutdown(wait=False)
+            self._executor = None
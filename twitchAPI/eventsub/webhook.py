@@ -33,6 +33,47 @@ Look at :ref:`eventsub-available-topics` to find the topics you are interested i
 The function you hand in as callback will be called whenever that event happens with the event data as a parameter,
 the type of that parameter is also listed in the link above.
 
+.. _eventsub-webhook-workers:
+
+*************************
+Multiple Worker Processes
+*************************
+
+A single process can only receive so many notifications per second.
+Set :code:`worker_processes` in the constructor to receive notifications with multiple processes instead.
+Each worker process binds to the same port using :code:`SO_REUSEPORT`, handles the HTTP requests, verifies the signatures,
+drops duplicates and decodes the notifications it receives. Duplicates are detected across all workers using a history of message ids
+in shared memory. The event object of a notification is built by the worker using the subscription type of the notification, every
+subscription made through this client registers its type with the workers.
+The workers hand the event objects over to the process that started EventSub in batches, which calls your callbacks,
+so subscriptions are still managed in one place.
+
+:code:`benchmarks/bench_webhook_workers.py` in the repository measures the notifications per second and the CPU time the main
+process spends per notification for a given number of workers. On a machine with a single CPU core, it printed:
+
+.. code-block:: text
+
+    1 worker(s): 2393 notifications/s, 184 µs CPU time of the main process per notification
+    2 worker(s): 1620 notifications/s, 58 µs CPU time of the main process per notification
+    4 worker(s): 1595 notifications/s, 62 µs CPU time of the main process per notification
+
+The main process spends about a third of the CPU time per notification with worker processes, so with a free CPU core for every worker
+it can keep up with about three times as many notifications per second. Without free CPU cores, as in the run above,
+all processes compete for the same core and multiple workers are slower than a single process.
+
+.. note:: This requires an operating system which supports :code:`SO_REUSEPORT` (e.g. Linux) and can not be combined with a ssl context.
+    The worker processes are started using the :code:`spawn` method, so make sure your script only starts EventSub
+    inside a :code:`if __name__ == '__main__':` block. Changes to :const:`~twitchAPI.eventsub.webhook.EventSubWebhook.secret`
+    have to be made before calling :const:`~twitchAPI.eventsub.webhook.EventSubWebhook.start()`.
+    Class level settings changed at runtime, like :const:`~twitchAPI.object.base.TwitchObject.lazy_decoding`, do not apply to the
+    event objects built by the workers.
+    With :const:`~twitchAPI.type.OverflowPolicy.SPILL_TO_DISK`, the workers hand over the decoded data of the notifications instead,
+    since event objects can not be written to disk.
+
+.. code-block:: python
+
+    eventsub = EventSubWebhook(EVENTSUB_URL, 8080, twitch, worker_processes=4)
+
 ************
 Code Example
 ************
@@ -99,29 +140,223 @@ Code Example
 import asyncio
 import hashlib
 import hmac
+import multiprocessing
+import queue
+import socket
 import threading
 from functools import partial
-from json import JSONDecodeError
 from random import choice
 from string import ascii_lowercase
 from ssl import SSLContext
 from time import sleep
-from typing import Optional, Union, Callable, Awaitable
+from typing import Optional, Union, Callable, Awaitable, Tuple, List, Dict, Any
 import datetime
 from collections import deque
+from logging import getLogger, Logger
 
-from aiohttp import web, ClientSession
+from aiohttp import web
 
-from twitchAPI.eventsub.base import EventSubBase
+from twitchAPI.eventsub.base import EventSubSessionBase
+from twitchAPI.eventsub.dispatch import DispatchQueue
 from ..twitch import Twitch
 from ..helper import done_task_callback
+from ..codec import JSONCodec
 from ..type import TwitchBackendException, EventSubSubscriptionConflict, EventSubSubscriptionError, EventSubSubscriptionTimeout, \
-    TwitchAuthorizationException, AuthType
+    TwitchAuthorizationException, AuthType, OverflowPolicy
 
 __all__ = ['EventSubWebhook']
 
 
-class EventSubWebhook(EventSubBase):
+def _verify_signature(secret: str, message_id: str, timestamp: str, body: bytes, signature: str) -> bool:
+    hmac_message = message_id.encode('utf-8') + timestamp.encode('utf-8') + body
+    sig = 'sha256=' + hmac.new(secret.encode('utf-8'), msg=hmac_message, digestmod=hashlib.sha256).hexdigest()
+    return hmac.compare_digest(sig.encode('utf-8'), signature.encode('utf-8'))
+
+
+async def _verify_message(request: 'web.Request', secret: str, logger: Logger) -> Union['web.Response', Tuple[dict, bytes]]:
+    """Verifies the signature of a incoming message.
+
+    Returns the metadata and raw body of the message or the response to send if the message should be discarded"""
+    headers = request.headers
+    msg_id = headers.get('Twitch-Eventsub-Message-Id')
+    msg_type = headers.get('Twitch-Eventsub-Message-Type')
+    timestamp = headers.get('Twitch-Eventsub-Message-Timestamp')
+    signature = headers.get('Twitch-Eventsub-Message-Signature')
+    if msg_id is None or msg_type is None or timestamp is None or signature is None:
+        logger.warning('got request without EventSub message headers! Discarding message')
+        return web.Response(status=403)
+    # verify the signature over the raw body before spending any time on decoding
+    body = await request.read()
+    if not _verify_signature(secret, msg_id, timestamp, body, signature):
+        logger.warning('message signature is not matching! Discarding message')
+        return web.Response(status=403)
+    return {
+        'message_id': msg_id,
+        'message_type': msg_type,
+        'message_timestamp': timestamp,
+        'subscription_type': headers.get('Twitch-Eventsub-Subscription-Type'),
+        'subscription_version': headers.get('Twitch-Eventsub-Subscription-Version'),
+    }, body
+
+
+def _remember_message_id(msg_id_history: deque, msg_id: str) -> bool:
+    """Adds the id to the history, returns False if it already was in there"""
+    if msg_id in msg_id_history:
+        return False
+    msg_id_history.append(msg_id)
+    return True
+
+
+class _SharedMessageIdHistory:
+    """The ids of the most recent messages, shared between the worker processes so that each message is only handled once.
+
+    Only a 64 bit hash of each id is kept in shared memory."""
+
+    def __init__(self, ctx: 'multiprocessing.context.BaseContext', maxlen: int):
+        self._ids = ctx.RawArray('Q', maxlen)
+        self._next = ctx.RawValue('L', 0)
+        self._lock = ctx.Lock()
+
+    def add(self, msg_id: str) -> bool:
+        """Adds the id to the history, returns False if it already was in there"""
+        if len(self._ids) == 0:
+            return True
+        # 0 marks a free slot
+        key = int.from_bytes(hashlib.blake2b(msg_id.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+        with self._lock:
+            if key in self._ids[:]:
+                return False
+            self._ids[self._next.value] = key
+            self._next.value = (self._next.value + 1) % len(self._ids)
+        return True
+
+
+def _decode_message(metadata: dict,
+                    body: bytes,
+                    json_codec: JSONCodec,
+                    remember_message_id: Callable[[str], bool],
+                    logger: Logger) -> Union[int, dict]:
+    """Decodes the body of a verified message and drops duplicates.
+
+    Returns the data of the message or the status code to answer with if the message should be discarded"""
+    try:
+        data: dict = json_codec.loads(body)
+    except ValueError:
+        logger.error('got request with malformed body! Discarding message')
+        return 400
+    # only remember messages that could be read, a redelivery of a rejected one is not a duplicate
+    msg_id = metadata['message_id']
+    if metadata['message_type'].lower() != 'webhook_callback_verification' and not remember_message_id(msg_id):
+        logger.warning(f'got message with duplicate id {msg_id}! Discarding message')
+        return 200
+    return data
+
+
+async def _read_message(request: 'web.Request',
+                        secret: str,
+                        json_codec: JSONCodec,
+                        remember_message_id: Callable[[str], bool],
+                        logger: Logger) -> Union['web.Response', Tuple[dict, dict]]:
+    """Verifies and decodes a incoming message.
+
+    Returns the metadata and data of the message or the response to send if the message should be discarded"""
+    result = await _verify_message(request, secret, logger)
+    if isinstance(result, web.Response):
+        return result
+    metadata, body = result
+    data = _decode_message(metadata, body, json_codec, remember_message_id, logger)
+    if isinstance(data, int):
+        return web.Response(status=data)
+    return metadata, data
+
+
+def _run_worker(host: str,
+                port: int,
+                secret: str,
+                json_codec: JSONCodec,
+                message_queue: 'multiprocessing.Queue',
+                ready: 'multiprocessing.synchronize.Barrier',
+                stop_event: 'multiprocessing.synchronize.Event',
+                logger_name: str,
+                msg_id_history: _SharedMessageIdHistory,
+                event_types: Dict[Tuple[str, str], type],
+                build_events: bool,
+                updates: 'multiprocessing.connection.Connection'):
+    """Entry point of the worker processes started by :const:`~twitchAPI.eventsub.webhook.EventSubWebhook` if worker_processes is above 1.
+
+    Hands batches of :code:`(message type, subscription id, payload)` to the main process. The payload of a notification is its
+    event object if its subscription type is in event_types and build_events is set, otherwise the data of the message."""
+    logger = getLogger(logger_name)
+    outbox = []
+
+    def apply_updates():
+        # event types of new subscriptions and changes of build_events, sent by the main process
+        nonlocal build_events
+        while updates.poll():
+            key, value = updates.recv()
+            if key is None:
+                build_events = value
+            else:
+                event_types[key] = value
+
+    def flush():
+        # everything handled within one iteration of the event loop is passed on at once
+        message_queue.put(list(outbox))
+        outbox.clear()
+
+    def hand_over(message: Tuple[str, Optional[str], Any]):
+        if len(outbox) == 0:
+            asyncio.get_running_loop().call_soon(flush)
+        outbox.append(message)
+
+    async def handle_callback(request: 'web.Request'):
+        result = await _read_message(request, secret, json_codec, msg_id_history.add, logger)
+        if isinstance(result, web.Response):
+            return result
+        metadata, data = result
+        message_type = metadata['message_type'].lower()
+        sub_id = data.get('subscription', {}).get('id')
+        if message_type == 'webhook_callback_verification':
+            hand_over((message_type, sub_id, data))
+            return web.Response(text=data.get('challenge'))
+        if message_type == 'notification':
+            data['metadata'] = metadata
+            event = event_types.get((metadata['subscription_type'], metadata['subscription_version'])) if build_events else None
+            if event is not None:
+                try:
+                    data = event(**data)
+                except Exception as e:
+                    # the main process tries again and reports the error together with the subscription
+                    logger.exception('failed to build event object', exc_info=e)
+        hand_over((message_type, sub_id, data))
+        return web.Response(status=200)
+
+    async def handle_default(_request: 'web.Request'):
+        return web.Response(text="pyTwitchAPI EventSub")
+
+    async def run():
+        app = web.Application()
+        app.add_routes([web.post('/callback', handle_callback),
+                        web.get('/', handle_default)])
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port, reuse_port=True).start()
+        except BaseException:
+            ready.abort()
+            await runner.cleanup()
+            raise
+        asyncio.get_running_loop().add_reader(updates.fileno(), apply_updates)
+        ready.wait()
+        while not stop_event.is_set():
+            await asyncio.sleep(0.1)
+        await runner.shutdown()
+        await runner.cleanup()
+
+    asyncio.run(run())
+
+
+class EventSubWebhook(EventSubSessionBase):
 
     def __init__(self,
                  callback_url: str,
@@ -132,7 +367,8 @@ class EventSubWebhook(EventSubBase):
                  subscription_url: Optional[str] = None,
                  callback_loop: Optional[asyncio.AbstractEventLoop] = None,
                  revocation_handler: Optional[Callable[[dict], Awaitable[None]]] = None,
-                 message_deduplication_history_length: int = 50):
+                 message_deduplication_history_length: int = 50,
+                 worker_processes: int = 1):
         """
         :param callback_url: The full URL of the webhook.
         :param port: the port on which this webhook should run
@@ -145,6 +381,10 @@ class EventSubWebhook(EventSubBase):
             Defaults to the one used by EventSub Webhook.
         :param revocation_handler: Optional handler for when subscriptions get revoked. |default| :code:`None`
         :param message_deduplication_history_length: The amount of messages being considered for the duplicate message deduplication. |default| :code:`50`
+        :param worker_processes: The number of processes receiving notifications. If above 1, that many worker processes get started
+            which share the port via :code:`SO_REUSEPORT`, see :ref:`eventsub-webhook-workers`. |default| :code:`1`
+        :raises ValueError: if worker_processes is above 1 and a ssl context is given
+        :raises RuntimeError: if worker_processes is above 1 and the operating system does not support :code:`SO_REUSEPORT`
         """
         super().__init__(twitch, 'twitchAPI.eventsub.webhook')
         self.callback_url: str = callback_url
@@ -170,6 +410,7 @@ class EventSubWebhook(EventSubBase):
         self.revokation_handler: Optional[Callable[[dict], Awaitable[None]]] = revocation_handler
         """Optional handler for when subscriptions get revoked."""
         self._startup_complete = False
+        self._startup_error: Optional[BaseException] = None
         self.unsubscribe_on_stop: bool = True
         """Unsubscribe all currently active Webhooks on calling :const:`~twitchAPI.eventsub.EventSub.stop()` |default| :code:`True`"""
 
@@ -184,6 +425,50 @@ class EventSubWebhook(EventSubBase):
             raise RuntimeError('HTTPS is required for authenticated webhook.\n'
                                + 'Either use non authenticated webhook or use a HTTPS proxy!')
         self._msg_id_history: deque = deque(maxlen=message_deduplication_history_length)
+        self._worker_processes: int = worker_processes
+        if worker_processes > 1:
+            if ssl_context is not None:
+                raise ValueError('worker_processes can not be combined with a ssl context')
+            if not hasattr(socket, 'SO_REUSEPORT'):
+                raise RuntimeError('worker_processes requires SO_REUSEPORT which is not supported on this platform')
+        self.__workers: List['multiprocessing.process.BaseProcess'] = []
+        self.__worker_queue: Optional['multiprocessing.Queue'] = None
+        self.__worker_stop: Optional['multiprocessing.synchronize.Event'] = None
+        self.__worker_reader: Optional['threading.Thread'] = None
+        self.__worker_updates: List['multiprocessing.connection.Connection'] = []
+        # the worker processes build the event objects of notifications by their subscription type
+        self.__event_types: Dict[Tuple[str, str], type] = {}
+        self.__build_events: bool = True
+        self.__worker_lock = threading.Lock()
+
+    def enable_dispatch_queue(self,
+                              max_size: int = 1000,
+                              concurrency: int = 10,
+                              overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                              spill_path: Optional[str] = None) -> DispatchQueue:
+        """Passes all notifications through a bounded queue instead of starting a callback task for each one right away.
+
+        See :doc:`/modules/twitchAPI.eventsub.dispatch` for details.
+        With :const:`~twitchAPI.type.OverflowPolicy.BLOCK`, notifications arriving while the queue is full are answered with status 503
+        so that Twitch sends them again later.
+
+        :param max_size: the maximum number of notifications held in memory |default| :code:`1000`
+        :param concurrency: the maximum number of callbacks running at the same time |default| :code:`10`
+        :param overflow_policy: what to do with new notifications once the queue is full |default| :const:`~twitchAPI.type.OverflowPolicy.BLOCK`
+        :param spill_path: the file used with :const:`~twitchAPI.type.OverflowPolicy.SPILL_TO_DISK`.
+                    A temporary file is used if None |default| :code:`None`
+        :raises ValueError: if worker_processes is above 1 and overflow_policy is :const:`~twitchAPI.type.OverflowPolicy.BLOCK`,
+                    the workers already answered the notifications before they reach the queue
+        :return: the queue, use it to read the queue depth and latency gauges
+        """
+        if self._worker_processes > 1 and overflow_policy == OverflowPolicy.BLOCK:
+            raise ValueError('OverflowPolicy.BLOCK can not be combined with worker_processes')
+        dispatch_queue = super().enable_dispatch_queue(max_size, concurrency, overflow_policy, spill_path)
+        # event objects can not be written to disk, the workers have to hand over the data of notifications instead
+        with self.__worker_lock:
+            self.__build_events = overflow_policy != OverflowPolicy.SPILL_TO_DISK
+            self.__update_workers(None, self.__build_events)
+        return dispatch_queue
 
     async def _unsubscribe_hook(self, topic_id: str) -> bool:
         return True
@@ -194,19 +479,133 @@ class EventSubWebhook(EventSubBase):
                              web.get('/', self.__handle_default)])
         return web.AppRunner(hook_app)
 
-    def __run_hook(self, runner: 'web.AppRunner'):
-        self.__hook_runner = runner
+    def __run_hook(self, runner: Optional['web.AppRunner']):
         self.__hook_loop = asyncio.new_event_loop()
         if self._callback_loop is None:
             self._callback_loop = self.__hook_loop
         asyncio.set_event_loop(self.__hook_loop)
-        self.__hook_loop.run_until_complete(runner.setup())
-        site = web.TCPSite(runner, str(self._host), self._port, ssl_context=self.__ssl_context)
-        self.__hook_loop.run_until_complete(site.start())
+        if runner is None:
+            try:
+                self.__start_workers()
+            except BaseException as e:
+                self._startup_error = e
+                self._startup_complete = True
+                self.__hook_loop.close()
+                return
+        else:
+            self.__hook_runner = runner
+            self.__hook_loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, str(self._host), self._port, ssl_context=self.__ssl_context)
+            self.__hook_loop.run_until_complete(site.start())
         self.logger.info('started twitch API event sub on port ' + str(self._port))
         self._startup_complete = True
         self.__hook_loop.run_until_complete(self._keep_loop_alive())
 
+    def _register_event_type(self, sub_type: str, sub_version: str, event: type):
+        """Lets the worker processes build the event objects of notifications of the given subscription type"""
+        with self.__worker_lock:
+            if self.__event_types.get((sub_type, sub_version)) is event:
+                return
+            self.__event_types[(sub_type, sub_version)] = event
+            self.__update_workers((sub_type, sub_version), event)
+
+    def __update_workers(self, key: Optional[Tuple[str, str]], value: Any):
+        # has to be called while holding the worker lock
+        for connection in self.__worker_updates:
+            try:
+                connection.send((key, value))
+            except (OSError, ValueError):
+                # the worker is gone, it gets the current state once started again
+                pass
+
+    def __start_workers(self):
+        # spawn, since forking a process with running threads and event loops is not safe
+        ctx = multiprocessing.get_context('spawn')
+        self.__worker_queue = ctx.Queue()
+        self.__worker_stop = ctx.Event()
+        ready = ctx.Barrier(self._worker_processes + 1)
+        msg_id_history = _SharedMessageIdHistory(ctx, self._msg_id_history.maxlen)
+        with self.__worker_lock:
+            self.__workers = []
+            for _ in range(self._worker_processes):
+                updates, self_updates = ctx.Pipe(duplex=False)
+                self.__worker_updates.append(self_updates)
+                self.__workers.append(ctx.Process(target=_run_worker,
+                                                  args=(str(self._host), self._port, self.secret, self.json_codec, self.__worker_queue,
+                                                        ready, self.__worker_stop, self.logger.name, msg_id_history,
+                                                        dict(self.__event_types), self.__build_events, updates),
+                                                  daemon=True))
+            for worker in self.__workers:
+                worker.start()
+        self.__worker_reader = threading.Thread(target=self.__read_worker_queue, args=(self.__worker_queue,), daemon=True)
+        self.__worker_reader.start()
+        try:
+            ready.wait(timeout=30)
+        except threading.BrokenBarrierError:
+            self.logger.error('worker processes failed to start')
+            self.__worker_stop.set()
+            self.__join_workers(timeout=0)
+            raise
+        self.logger.debug(f'started {self._worker_processes} worker processes')
+
+    async def __stop_workers(self):
+        if self.__worker_stop is not None:
+            self.__worker_stop.set()
+        # joining processes and threads blocks
+        await asyncio.get_running_loop().run_in_executor(None, self.__join_workers)
+
+    def __join_workers(self, timeout: float = 5):
+        for worker in self.__workers:
+            worker.join(timeout=timeout)
+            if worker.is_alive():
+                worker.terminate()
+        if self.__worker_queue is not None:
+            # wakes up the reader thread
+            self.__worker_queue.put(None)
+        if self.__worker_reader is not None:
+            self.__worker_reader.join()
+        with self.__worker_lock:
+            for connection in self.__worker_updates:
+                connection.close()
+            self.__worker_updates = []
+        self.__workers = []
+        self.__worker_queue = None
+        self.__worker_stop = None
+        self.__worker_reader = None
+
+    def __read_worker_queue(self, message_queue: 'multiprocessing.Queue'):
+        while True:
+            batches = [message_queue.get()]
+            # hand over everything that already arrived at once, so the event loop is only woken up once
+            try:
+                while batches[-1] is not None and len(batches) < 100:
+                    batches.append(message_queue.get_nowait())
+            except queue.Empty:
+                pass
+            stop = batches[-1] is None
+            if stop:
+                batches.pop()
+            if len(batches) > 0:
+                self.__hook_loop.call_soon_threadsafe(self.__handle_worker_messages, [m for batch in batches for m in batch])
+            if stop:
+                return
+
+    def __handle_worker_messages(self, messages: List[Tuple[str, Optional[str], Any]]):
+        # the workers already verified, decoded and deduplicated these
+        for message_type, sub_id, payload in messages:
+            try:
+                if message_type == 'notification':
+                    self._dispatch_event(sub_id, payload)
+                elif message_type == 'webhook_callback_verification':
+                    # might wait for the subscription to be registered, that should not hold back the other messages
+                    t = asyncio.ensure_future(self._handle_challenge_message(payload))
+                    t.add_done_callback(self._task_callback)
+                elif message_type == 'revocation':
+                    t = asyncio.ensure_future(self._handle_revokation(payload))
+                    t.add_done_callback(self._task_callback)
+            except Exception as e:
+                self.logger.exception('Error while dispatching message', exc_info=e)
+
     async def _keep_loop_alive(self):
         while not self._closing:
             await asyncio.sleep(0.1)
@@ -215,17 +614,23 @@ class EventSubWebhook(EventSubBase):
         """Starts the EventSub client
 
         :rtype: None
-        :raises RuntimeError: if EventSub is already running
+        :raises RuntimeError: if EventSub is already running or the worker processes could not be started
         """
         if self.__running:
             raise RuntimeError('already started')
-        self.__hook_thread = threading.Thread(target=self.__run_hook, args=(self.__build_runner(),))
+        self._startup_error = None
+        runner = self.__build_runner() if self._worker_processes <= 1 else None
+        self.__hook_thread = threading.Thread(target=self.__run_hook, args=(runner,))
         self.__running = True
         self._startup_complete = False
         self._closing = False
         self.__hook_thread.start()
         while not self._startup_complete:
             sleep(0.1)
+        if self._startup_error is not None:
+            self.__hook_thread.join()
+            self.__running = False
+            raise RuntimeError('failed to start the worker processes') from self._startup_error
 
     async def stop(self):
         """Stops the EventSub client
@@ -238,10 +643,14 @@ class EventSubWebhook(EventSubBase):
         if not self.__running:
             raise RuntimeError('EventSubWebhook is not running')
         self.logger.debug('shutting down eventsub')
-        if self.__hook_runner is not None and self.unsubscribe_on_stop:
+        if (self.__hook_runner is not None or len(self.__workers) > 0) and self.unsubscribe_on_stop:
             await self.unsubscribe_all_known()
         # ensure all client sessions are closed
         await asyncio.sleep(0.25)
+        await self.__stop_workers()
+        if self.dispatch_queue is not None:
+            # its handlers run in the loop that is stopped next
+            self.dispatch_queue.close()
         self._closing = True
         # cleanly shut down the runner
         if self.__hook_runner is not None:
@@ -282,10 +691,10 @@ class EventSubWebhook(EventSubBase):
         if is_batching_enabled is not None:
             data['is_batching_enabled'] = is_batching_enabled
 
-        async with ClientSession(timeout=self._twitch.session_timeout) as session:
-            sub_base = self.subscription_url if self.subscription_url is not None else self._twitch.base_url
-            r_data = await self._api_post_request(session, sub_base + 'eventsub/subscriptions', data=data)
-            result = await r_data.json()
+        session = await self._twitch._get_session()
+        sub_base = self.subscription_url if self.subscription_url is not None else self._twitch.base_url
+        r_data = await self._api_post_request(session, sub_base + 'eventsub/subscriptions', data=data)
+        result = await r_data.json(loads=self.json_codec.loads)
         error = result.get('error')
         if r_data.status == 500:
             raise TwitchBackendException(error)
@@ -296,6 +705,7 @@ class EventSubWebhook(EventSubBase):
         sub_id = result['data'][0]['id']
         self.logger.debug(f'subscription for {sub_type} version {sub_version} with condition {condition} has id {sub_id}')
         self._add_callback(sub_id, callback, event)
+        self._register_event_type(sub_type, sub_version, event)
         if self.wait_for_subscription_confirm:
             timeout = datetime.datetime.utcnow() + datetime.timedelta(
                 seconds=self.wait_for_subscription_confirm_timeout)
@@ -310,27 +720,16 @@ class EventSubWebhook(EventSubBase):
     def _target_token(self) -> AuthType:
         return AuthType.APP
 
-    async def _verify_signature(self, request: 'web.Request') -> bool:
-        expected = request.headers['Twitch-Eventsub-Message-Signature']
-        hmac_message = request.headers['Twitch-Eventsub-Message-Id'] + \
-            request.headers['Twitch-Eventsub-Message-Timestamp'] + await request.text()
-        sig = 'sha256=' + hmac.new(bytes(self.secret, 'utf-8'),
-                                   msg=bytes(hmac_message, 'utf-8'),
-                                   digestmod=hashlib.sha256).hexdigest().lower()
-        return sig == expected
-
     # noinspection PyUnusedLocal
     @staticmethod
     async def __handle_default(request: 'web.Request'):
         return web.Response(text="pyTwitchAPI EventSub")
 
-    async def __handle_challenge(self, request: 'web.Request', data: dict):
-        self.logger.debug(f'received challenge for subscription {data.get("subscription", {}).get("id")}')
-        if not await self._verify_signature(request):
-            self.logger.warning('message signature is not matching! Discarding message')
-            return web.Response(status=403)
-        await self._activate_callback(data.get('subscription', {}).get('id'))
-        return web.Response(text=data.get('challenge'))
+    async def _handle_challenge_message(self, data: dict) -> str:
+        sub_id = data.get('subscription', {}).get('id')
+        self.logger.debug(f'received challenge for subscription {sub_id}')
+        await self._activate_callback(sub_id)
+        return data.get('challenge')
 
     async def _handle_revokation(self, data):
         sub_id: str = data.get('subscription', {}).get('id')
@@ -343,40 +742,43 @@ class EventSubWebhook(EventSubBase):
             t = self._callback_loop.create_task(self.revokation_handler(data)) #type: ignore
             t.add_done_callback(self._task_callback)
 
-    async def __handle_callback(self, request: 'web.Request'):
-        try:
-            data: dict = await request.json()
-        except JSONDecodeError:
-            self.logger.error('got request with malformed body! Discarding message')
-            return web.Response(status=400)
-        if data.get('challenge') is not None:
-            return await self.__handle_challenge(request, data)
-        sub_id = data.get('subscription', {}).get('id')
+    async def _dispatch_message(self, metadata: dict, data: dict) -> bool:
+        """Returns False if the message could not be queued and should be delivered again later"""
+        if metadata['message_type'].lower() == 'revocation':
+            await self._handle_revokation(data)
+            return True
+        data['metadata'] = metadata
+        return self._dispatch_event(data.get('subscription', {}).get('id'), data)
+
+    def _dispatch_event(self, sub_id: Optional[str], payload: Any) -> bool:
+        """Calls the callback of the subscription with the data of a notification including its metadata
+        or with the event object a worker process built from it.
+
+        Returns False if the notification could not be queued and should be delivered again later"""
         callback = self._callbacks.get(sub_id)
         if callback is None:
             self.logger.error(f'received event for unknown subscription with ID {sub_id}')
-        else:
-            if not await self._verify_signature(request):
-                self.logger.warning('message signature is not matching! Discarding message')
-                return web.Response(status=403)
-            msg_type = request.headers['Twitch-Eventsub-Message-Type']
-            if msg_type.lower() == 'revocation':
-                await self._handle_revokation(data)
-            else:
-                msg_id = request.headers.get('Twitch-Eventsub-Message-Id')
-                if msg_id is not None and msg_id in self._msg_id_history:
-                    self.logger.warning(f'got message with duplicate id {msg_id}! Discarding message')
-                else:
-                    self._msg_id_history.append(msg_id)
-                    data['metadata'] = {
-                        'message_id': msg_id,
-                        'message_type': msg_type,
-                        'message_timestamp': request.headers['Twitch-Eventsub-Message-Timestamp'],
-                        'subscription_type': request.headers['Twitch-Eventsub-Subscription-Type'],
-                        'subscription_version': request.headers['Twitch-Eventsub-Subscription-Version'],
-                    }
-                    dat = callback['event'](**data)
-                    if self._callback_loop is not None:
-                        t = self._callback_loop.create_task(callback['callback'](dat))
-                        t.add_done_callback(self._task_callback)
+            return True
+        if self.dispatch_queue is not None:
+            # waiting for free space would hold back the response to Twitch, let Twitch retry instead
+            return self.dispatch_queue.put_nowait(payload)
+        dat = callback['event'](**payload) if isinstance(payload, dict) else payload
+        if self._callback_loop is not None:
+            t = self._callback_loop.create_task(callback['callback'](dat))
+            t.add_done_callback(self._task_callback)
+        return True
+
+    async def __handle_callback(self, request: 'web.Request'):
+        result = await _read_message(request, self.secret, self.json_codec, partial(_remember_message_id, self._msg_id_history), self.logger)
+        if isinstance(result, web.Response):
+            return result
+        metadata, data = result
+        if metadata['message_type'].lower() == 'webhook_callback_verification':
+            return web.Response(text=await self._handle_challenge_message(data))
+        if not await self._dispatch_message(metadata, data):
+            self.logger.warning(f'dispatch queue is full, asking Twitch to resend message {metadata["message_id"]}')
+            # the resent message has the same id
+            if metadata['message_id'] in self._msg_id_history:
+                self._msg_id_history.remove(metadata['message_id'])
+            return web.Response(status=503)
         return web.Response(status=200)
@@ -21,6 +21,26 @@ Look at :ref:`eventsub-available-topics` to find the topics you are interested i
 The function you hand in as callback will be called whenever that event happens with the event data as a parameter,
 the type of that parameter is also listed in the link above.
 
+.. _eventsub-websocket-sharding:
+
+********
+Sharding
+********
+
+A single websocket session can only hold a limited number of subscriptions.
+:const:`~twitchAPI.eventsub.websocket.ShardedEventSubWebsocket` offers the same :code:`listen_` functions, but opens additional
+websocket sessions (shards) as needed and places each new subscription on the least used one.
+
+Subscriptions which could not be recreated on a shard after it reconnected, as well as all subscriptions of a shard which lost its connection
+for good, are moved to the other shards. Shards which no longer hold any subscriptions (e.g. after revocations) are closed again.
+
+.. code-block:: python
+
+    eventsub = ShardedEventSubWebsocket(twitch, max_subscriptions_per_shard=300, max_shards=3)
+    eventsub.start()
+    for user in users:
+        await eventsub.listen_stream_online(user.id, on_online)
+
 ************
 Code Example
 ************
@@ -78,8 +98,8 @@ Code Example
     asyncio.run(run())
 """
 import asyncio
+import concurrent.futures
 import datetime
-import json
 import threading
 from asyncio import CancelledError
 from dataclasses import dataclass
@@ -88,13 +108,13 @@ from time import sleep
 from typing import Optional, List, Dict, Callable, Awaitable
 
 import aiohttp
-from aiohttp import ClientSession, WSMessage, ClientWebSocketResponse
+from aiohttp import WSMessage, ClientWebSocketResponse
 from collections import deque
 
-from .base import EventSubBase
+from .base import EventSubBase, EventSubSessionBase
 
 
-__all__ = ['EventSubWebsocket']
+__all__ = ['EventSubWebsocket', 'ShardedEventSubWebsocket']
 
 from twitchAPI.twitch import Twitch
 from ..helper import TWITCH_EVENT_SUB_WEBSOCKET_URL, done_task_callback
@@ -125,7 +145,7 @@ class Reconnect:
     connection: ClientWebSocketResponse
 
 
-class EventSubWebsocket(EventSubBase):
+class EventSubWebsocket(EventSubSessionBase):
     _reconnect: Optional[Reconnect] = None
     
     def __init__(self,
@@ -177,13 +197,13 @@ class EventSubWebsocket(EventSubBase):
         """Starts the EventSub client
 
         :raises RuntimeError: If EventSub is already running
-        :raises ~twitchAPI.type.UnauthorizedException: If Twitch instance is missing user authentication
+        :raises ~twitchAPI.type.UnauthorizedException: If Twitch instance is missing the required authentication
         """
         self.logger.debug('starting websocket EventSub...')
         if self._running:
             raise RuntimeError('EventSubWebsocket is already started!')
-        if not self._twitch.has_required_auth(AuthType.USER, []):
-            raise UnauthorizedException('Twitch needs user authentication')
+        if not self._twitch.has_required_auth(self._target_token(), []):
+            raise UnauthorizedException(f'Twitch needs {"app" if self._target_token() == AuthType.APP else "user"} authentication')
         self._startup_complete = False
         self._ready = False
         self._closing = False
@@ -209,6 +229,8 @@ class EventSubWebsocket(EventSubBase):
         if self._socket_loop is not None:
             f = asyncio.run_coroutine_threadsafe(self._stop(), self._socket_loop)
             f.result()
+        if self.dispatch_queue is not None:
+            self.dispatch_queue.close()
 
     def _get_transport(self) -> dict:
         return {
@@ -228,10 +250,10 @@ class EventSubWebsocket(EventSubBase):
         }
         if is_batching_enabled is not None:
             data['is_batching_enabled'] = is_batching_enabled
-        async with ClientSession(timeout=self._twitch.session_timeout) as session:
-            sub_base = self.subscription_url if self.subscription_url is not None else self._twitch.base_url
-            r_data = await self._api_post_request(session, sub_base + 'eventsub/subscriptions', data=data)
-            result = await r_data.json()
+        session = await self._twitch._get_session()
+        sub_base = self.subscription_url if self.subscription_url is not None else self._twitch.base_url
+        r_data = await self._api_post_request(session, sub_base + 'eventsub/subscriptions', data=data)
+        result = await r_data.json(loads=self.json_codec.loads)
         error = result.get('error')
         if r_data.status == 500:
             raise TwitchBackendException(error)
@@ -299,6 +321,8 @@ class EventSubWebsocket(EventSubBase):
     async def _stop(self):
         await self._connection.close()
         await self._session.close()
+        # close the API session used by resubscribes from within this thread
+        await self._twitch._close_session()
         await asyncio.sleep(0.25)
         self._connection = None
         self._session = None
@@ -336,11 +360,15 @@ class EventSubWebsocket(EventSubBase):
                     continue
                 message: WSMessage = await self._connection.receive()
                 if message.type == aiohttp.WSMsgType.TEXT:
-                    data = json.loads(message.data)
+                    data = self.json_codec.loads(message.data)
                     _type = data.get('metadata', {}).get('message_type')
                     _handler = handler.get(_type)
                     if _handler is not None:
-                        asyncio.ensure_future(_handler(data))
+                        if _handler == self._handle_notification and self.dispatch_queue is not None:
+                            # lets the dispatch queue slow down reading from the socket
+                            await _handler(data)
+                        else:
+                            asyncio.ensure_future(_handler(data))
                     # debug
                     else:
                         self.logger.warning(f'got message for unknown message_type: {_type}, ignoring...')
@@ -457,7 +485,7 @@ class EventSubWebsocket(EventSubBase):
             self.logger.warning(f"Reconnect socket got an unknown message {message}")
             await reconnect.connection.close()
             return
-        data = message.json()
+        data = message.json(loads=self.json_codec.loads)
         message_type = data.get('metadata', {}).get('message_type')
         if message_type != "session_welcome":
             self.logger.warning(f"Reconnect socket got a non session_welcome first message {data}")
@@ -494,7 +522,278 @@ class EventSubWebsocket(EventSubBase):
             msg_id = _payload['metadata'].get('message_id')
             if msg_id is not None and msg_id in self._msg_id_history:
                 self.logger.warning(f'got message with duplicate id {msg_id}! Discarding message')
+            elif self.dispatch_queue is not None:
+                await self.dispatch_queue.put(_payload)
             else:
                 t = self._callback_loop.create_task(callback['callback'](callback['event'](**_payload)))
                 t.add_done_callback(self._task_callback)
 
+
+class _WebsocketShard(EventSubWebsocket):
+    """A single websocket session of :const:`~twitchAPI.eventsub.websocket.ShardedEventSubWebsocket`"""
+
+    def __init__(self, manager: 'ShardedEventSubWebsocket', *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._manager: 'ShardedEventSubWebsocket' = manager
+        self._started: concurrent.futures.Future = concurrent.futures.Future()
+
+    def _run_start(self):
+        try:
+            self.start()
+            self._started.set_result(True)
+        except BaseException as e:
+            self._started.set_exception(e)
+
+    def _run_socket(self):
+        try:
+            super()._run_socket()
+        finally:
+            # a shard is never started again, so its loop can be closed once it stopped
+            loop = self._socket_loop
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def _connect(self, is_startup: bool = False):
+        try:
+            await super()._connect(is_startup)
+        except TwitchBackendException:
+            if not is_startup:
+                asyncio.ensure_future(self._manager._handle_shard_failure(self))
+            raise
+
+    async def _resubscribe(self):
+        self.logger.debug('resubscribe to all active subscriptions of this websocket shard...')
+        subs = self._active_subscriptions
+        self._active_subscriptions = {}
+        failed = []
+        for sub_id, sub in subs.items():
+            # the subscriptions of the old session are gone, successful ones get a new id
+            self._callbacks.pop(sub_id, None)
+            try:
+                await self._subscribe(**sub)
+            except Exception:
+                self.logger.exception('exception while resubscribing')
+                failed.append(sub)
+        if len(failed) > 0:
+            await self._manager._place_subscriptions(failed, exclude=self)
+            await self._manager._release_if_empty(self)
+        self.logger.debug('done resubscribing!')
+
+    async def _handle_revocation(self, data: dict):
+        await super()._handle_revocation(data)
+        await self._manager._release_if_empty(self)
+
+    async def _shutdown(self):
+        self._running = False
+        await self._stop()
+        for task in self._tasks:
+            task.cancel()
+
+
+class ShardedEventSubWebsocket(EventSubBase):
+    """EventSub websocket client spreading its subscriptions over multiple websocket sessions, see :ref:`eventsub-websocket-sharding`"""
+
+    def __init__(self,
+                 twitch: Twitch,
+                 connection_url: Optional[str] = None,
+                 subscription_url: Optional[str] = None,
+                 callback_loop: Optional[asyncio.AbstractEventLoop] = None,
+                 revocation_handler: Optional[Callable[[dict], Awaitable[None]]] = None,
+                 message_deduplication_history_length: int = 50,
+                 max_subscriptions_per_shard: int = 300,
+                 max_shards: int = 3):
+        """
+        :param twitch: The Twitch instance to be used
+        :param connection_url: Alternative connection URL, useful for development with the twitch-cli
+        :param subscription_url: Alternative subscription URL, useful for development with the twitch-cli
+        :param callback_loop: The asyncio eventloop to be used for callbacks. \n
+            Set this if you or a library you use cares about which asyncio event loop is running the callbacks.
+            Defaults to the one used by each shard.
+        :param revocation_handler: Optional handler for when subscriptions get revoked. |default| :code:`None`
+        :param message_deduplication_history_length: The amount of messages being considered for the duplicate message deduplication. |default| :code:`50`
+        :param max_subscriptions_per_shard: The maximum number of subscriptions placed on one websocket session. |default| :code:`300`
+        :param max_shards: The maximum number of websocket sessions opened at the same time. |default| :code:`3`
+        """
+        super().__init__(twitch, 'twitchAPI.eventsub.websocket')
+        self.max_subscriptions_per_shard: int = max_subscriptions_per_shard
+        """The maximum number of subscriptions placed on one websocket session. |default| :code:`300`"""
+        self.max_shards: int = max_shards
+        """The maximum number of websocket sessions opened at the same time. |default| :code:`3`"""
+        self.shards: List[EventSubWebsocket] = []
+        """The currently open websocket sessions"""
+        self._shard_args = {
+            'connection_url': connection_url,
+            'subscription_url': subscription_url,
+            'callback_loop': callback_loop,
+            'revocation_handler': revocation_handler,
+            'message_deduplication_history_length': message_deduplication_history_length
+        }
+        self._running: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        self._reserved: Dict[EventSubWebsocket, int] = {}
+
+    @property
+    def active_sessions(self) -> List[Optional[Session]]:
+        """The sessions of all shards"""
+        return [shard.active_session for shard in self.shards]
+
+    def start(self):
+        """Starts the EventSub client with a single shard, further shards are opened as needed.
+
+        :raises RuntimeError: If EventSub is already running
+        :raises ~twitchAPI.type.UnauthorizedException: If Twitch instance is missing user authentication
+        """
+        if self._running:
+            raise RuntimeError('ShardedEventSubWebsocket is already started!')
+        if not self._twitch.has_required_auth(AuthType.USER, []):
+            raise UnauthorizedException('Twitch needs user authentication')
+        self._running = True
+        with self._lock:
+            shard = self._new_shard()
+        shard._started.result()
+
+    async def stop(self):
+        """Stops the EventSub client and all of its shards
+
+        :raises RuntimeError: If EventSub is not running
+        """
+        if not self._running:
+            raise RuntimeError('ShardedEventSubWebsocket is not running')
+        self._running = False
+        with self._lock:
+            shards = self.shards
+            self.shards = []
+        for shard in shards:
+            if shard._running:
+                await shard.stop()
+
+    async def _build_request_header(self) -> dict:
+        token = await self._twitch.get_refreshed_user_auth_token()
+        if token is None:
+            raise TwitchAuthorizationException('no Authorization set!')
+        return {
+            'Client-ID': self._twitch.app_id,
+            'Content-Type': 'application/json',
+            'Authorization': f'Bearer {token}'
+        }
+
+    def _target_token(self) -> AuthType:
+        return AuthType.USER
+
+    def _new_shard(self) -> '_WebsocketShard':
+        # has to be called while holding self._lock
+        shard = _WebsocketShard(self, self._twitch, **self._shard_args)
+        shard.json_codec = self.json_codec
+        self.shards.append(shard)
+        self.logger.debug(f'opening websocket shard {len(self.shards)}')
+        threading.Thread(target=shard._run_start, daemon=True).start()
+        return shard
+
+    def _load(self, shard: EventSubWebsocket) -> int:
+        return len(shard._active_subscriptions) + self._reserved.get(shard, 0)
+
+    def _reserve_shard(self, exclude: Optional[EventSubWebsocket] = None) -> '_WebsocketShard':
+        with self._lock:
+            candidates = [s for s in self.shards if s is not exclude and self._load(s) < self.max_subscriptions_per_shard]
+            if len(candidates) > 0:
+                shard = min(candidates, key=self._load)
+            elif len(self.shards) < self.max_shards:
+                shard = self._new_shard()
+            else:
+                raise EventSubSubscriptionError('all websocket shards are full')
+            self._reserved[shard] = self._reserved.get(shard, 0) + 1
+        return shard
+
+    async def _subscribe_on_shard(self,
+                                  exclude: Optional[EventSubWebsocket],
+                                  sub_type: str,
+                                  sub_version: str,
+                                  condition: dict,
+                                  callback,
+                                  event,
+                                  is_batching_enabled: Optional[bool] = None) -> str:
+        shard = self._reserve_shard(exclude)
+        try:
+            await asyncio.wrap_future(shard._started)
+            return await shard._subscribe(sub_type, sub_version, condition, callback, event, is_batching_enabled)
+        finally:
+            with self._lock:
+                self._reserved[shard] -= 1
+                if self._reserved[shard] == 0:
+                    self._reserved.pop(shard)
+
+    async def _subscribe(self, sub_type: str, sub_version: str, condition: dict, callback, event, is_batching_enabled: Optional[bool] = None) -> str:
+        if not self._running:
+            raise RuntimeError('ShardedEventSubWebsocket is not running')
+        return await self._subscribe_on_shard(None, sub_type, sub_version, condition, callback, event, is_batching_enabled)
+
+    async def _place_subscriptions(self, subs: List[dict], exclude: Optional[EventSubWebsocket] = None):
+        for sub in subs:
+            try:
+                await self._subscribe_on_shard(exclude, **sub)
+            except Exception:
+                self.logger.exception(f'failed to move subscription for {sub["sub_type"]} with condition {sub["condition"]} to another shard')
+
+    @staticmethod
+    async def _close_shard(shard: '_WebsocketShard'):
+        if shard._socket_loop is None or shard._socket_loop.is_closed():
+            return
+        if shard._socket_loop is asyncio.get_running_loop():
+            await shard._shutdown()
+        else:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(shard._shutdown(), shard._socket_loop))
+
+    async def _handle_shard_failure(self, shard: '_WebsocketShard'):
+        with self._lock:
+            if shard not in self.shards:
+                return
+            self.shards.remove(shard)
+        subs = list(shard._active_subscriptions.values())
+        shard._active_subscriptions = {}
+        self.logger.warning(f'websocket shard lost its connection, moving {len(subs)} subscriptions to other shards')
+        if self._running:
+            await self._place_subscriptions(subs, exclude=shard)
+        await self._close_shard(shard)
+
+    async def _release_if_empty(self, shard: '_WebsocketShard'):
+        with self._lock:
+            if len(self.shards) <= 1 or shard not in self.shards or self._load(shard) > 0:
+                return
+            self.shards.remove(shard)
+        self.logger.debug('closing websocket shard without subscriptions')
+        await self._close_shard(shard)
+
+    def _find_shard(self, topic_id: str) -> Optional[EventSubWebsocket]:
+        for shard in self.shards:
+            if topic_id in shard._active_subscriptions:
+                return shard
+        return None
+
+    async def _unsubscribe_hook(self, topic_id: str) -> bool:
+        shard = self._find_shard(topic_id)
+        if shard is None:
+            return True
+        shard._callbacks.pop(topic_id, None)
+        await shard._unsubscribe_hook(topic_id)
+        await self._release_if_empty(shard)
+        return True
+
+    async def unsubscribe_all(self):
+        """Unsubscribe from all subscriptions"""
+        await super().unsubscribe_all()
+        for shard in list(self.shards):
+            shard._callbacks.clear()
+            shard._active_subscriptions.clear()
+            await self._release_if_empty(shard)
+
+    async def unsubscribe_all_known(self):
+        """Unsubscribe from all subscriptions known to this client."""
+        for shard in list(self.shards):
+            await shard.unsubscribe_all_known()
+            shard._active_subscriptions.clear()
+            await self._release_if_empty(shard)
+        self._callbacks.clear()
@@ -5,6 +5,7 @@ Helper functions
 import asyncio
 import datetime
 import logging
+import threading
 import time
 import urllib.parse
 import uuid
@@ -12,13 +13,15 @@ from logging import Logger
 from typing import AsyncGenerator, TypeVar
 from enum import Enum
 
+from dateutil import parser as du_parser
+
 from .type import AuthScope
 
-from typing import Union, List, Type, Optional, overload
+from typing import Union, List, Type, Optional, Mapping, overload, Callable, Awaitable
 
 __all__ = ['first', 'limit', 'TWITCH_API_BASE_URL', 'TWITCH_AUTH_BASE_URL', 'TWITCH_CHAT_URL', 'TWITCH_EVENT_SUB_WEBSOCKET_URL',
            'build_url', 'get_uuid', 'build_scope', 'fields_to_enum', 'make_enum',
-           'enum_value_or_none', 'datetime_to_str', 'remove_none_values', 'ResultType', 'RateLimitBucket', 'RATE_LIMIT_SIZES', 'done_task_callback']
+           'enum_value_or_none', 'datetime_to_str', 'parse_iso_datetime', 'remove_none_values', 'copy_json', 'ResultType', 'RateLimitBucket', 'RATE_LIMIT_SIZES', 'HelixRateLimitBucket', 'PaginationCheckpoint', 'done_task_callback']
 
 T = TypeVar('T')
 
@@ -167,6 +170,32 @@ def datetime_to_str(dt: Optional[datetime.datetime]) -> Optional[str]:
     return dt.astimezone().isoformat() if dt is not None else None
 
 
+def parse_iso_datetime(val: str) -> datetime.datetime:
+    """Parses a ISO-8601 formatted timestamp as used by the Twitch API.
+
+    The shapes used by Twitch (optional fractions of up to nanosecond precision, :code:`Z` or numeric offsets) are parsed via
+    :code:`datetime.fromisoformat()`, anything else falls back to the considerably slower :code:`dateutil.parser.isoparse()`.
+    Fractions with more than 6 digits get truncated to microseconds.
+
+    :param val: the timestamp to parse
+    :raises ValueError: if val is not a valid ISO-8601 timestamp"""
+    try:
+        s = val
+        if s[-1] in 'Zz':
+            s = s[:-1] + '+00:00'
+        if len(s) > 20 and s[19] == '.':
+            # the fraction ends at the first non digit, the offset might be in basic (+0000) or extended (+00:00) format
+            end = 20
+            while end < len(s) and s[end] in '0123456789':
+                end += 1
+            frac = s[20:end]
+            if len(frac) != 6:
+                s = s[:20] + (frac + '000000')[:6] + s[end:]
+        return datetime.datetime.fromisoformat(s)
+    except (ValueError, IndexError):
+        return du_parser.isoparse(val)
+
+
 def remove_none_values(d: dict) -> dict:
     """Removes items where the value is None from the dict.
     This returns a new dict and does not manipulate the one given.
@@ -175,6 +204,18 @@ def remove_none_values(d: dict) -> dict:
     return {k: v for k, v in d.items() if v is not None}
 
 
+def copy_json(data: T) -> T:
+    """Returns a deep copy of decoded json data.
+    Faster than :code:`copy.deepcopy()` since only dicts and lists get copied, everything else is immutable.
+
+    :param data: the decoded json data"""
+    if isinstance(data, dict):
+        return {k: copy_json(v) for k, v in data.items()}  # type: ignore
+    if isinstance(data, list):
+        return [copy_json(v) for v in data]  # type: ignore
+    return data
+
+
 async def first(gen: AsyncGenerator[T, None]) -> Optional[T]:
     """Returns the first value of the given AsyncGenerator
 
@@ -215,6 +256,54 @@ async def limit(gen: AsyncGenerator[T, None], num: int) -> AsyncGenerator[T, Non
         yield y
 
 
+class PaginationCheckpoint:
+    """Keeps track of the position of a paginated API call so that it can be resumed later, e.g. after a crash.
+
+    Use it with :const:`~twitchAPI.twitch.Twitch.pagination_checkpoint()`. The cursor gets updated each time a page was fully consumed,
+    entries of a page that was only partially consumed will be returned again on resume.
+
+    Example:
+
+    .. code-block:: python
+
+        def save(cursor):
+            with open('cursor.txt', 'w') as f:
+                f.write(cursor or '')
+
+        checkpoint = PaginationCheckpoint(cursor=load_saved_cursor(), sink=save)
+        with twitch.pagination_checkpoint(checkpoint):
+            async for video in twitch.get_videos(user_id='1234'):
+                process(video)
+    """
+
+    def __init__(self,
+                 cursor: Optional[str] = None,
+                 sink: Optional[Callable[[Optional[str]], Union[None, Awaitable[None]]]] = None):
+        """
+        :param cursor: the cursor to resume from, None starts at the beginning |default| :code:`None`
+        :param sink: called with the new cursor each time a page was fully consumed, can be a coroutine function.
+                    The cursor is None once all pages where consumed. |default| :code:`None`
+        """
+        self.cursor: Optional[str] = cursor
+        """The cursor of the next page that was not consumed yet"""
+        self.sink: Optional[Callable[[Optional[str]], Union[None, Awaitable[None]]]] = sink
+        """called with the new cursor each time a page was fully consumed"""
+        self.done: bool = False
+        """True once all pages where consumed"""
+
+    async def update(self, cursor: Optional[str]):
+        """Sets the cursor after a page was fully consumed and calls the sink
+
+        :param cursor: the cursor of the next page, None if there is none
+        """
+        self.cursor = cursor
+        self.done = cursor is None
+        if self.sink is not None:
+            result = self.sink(cursor)
+            if asyncio.iscoroutine(result):
+                await result
+
+
 class RateLimitBucket:
     """Handler used for chat rate limiting"""
 
@@ -272,6 +361,96 @@ class RateLimitBucket:
                 await asyncio.sleep(delta + 0.05)
 
 
+class HelixRateLimitBucket:
+    """Client side token bucket used for Helix rate limiting.
+
+    Requests have to acquire a point from the bucket before they are sent, waiting requests are admitted in order.
+    The bucket refills continuously and gets corrected by the :code:`Ratelimit-*` headers of every response.
+    A negative amount of points means that requests are queued."""
+
+    def __init__(self,
+                 limit: int = 800,
+                 period: float = 60.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+
+        :param limit: the number of points in a full bucket, updated from the :code:`Ratelimit-Limit` header |default| :code:`800`
+        :param period: time in seconds it takes for a empty bucket to refill |default| :code:`60`
+        :param logger: the logger to be used. If None the default logger is used
+        """
+        self.limit: int = limit
+        self.period: float = period
+        self.tokens: float = float(limit)
+        self.in_flight: int = 0
+        self.logger = logger
+        self._last_refill: float = time.monotonic()
+        # the bucket might be shared between the event loops of multiple threads
+        self._lock: threading.Lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(float(self.limit), self.tokens + (now - self._last_refill) * self.limit / self.period)
+        self._last_refill = now
+
+    async def acquire(self):
+        """Takes one point from the bucket, waits till it is available if the bucket is empty"""
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            self.in_flight += 1
+            delay = -self.tokens * self.period / self.limit
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # the request will never be sent, hand its point back to the queued ones
+                with self._lock:
+                    self.tokens = min(float(self.limit), self.tokens + 1)
+                self.release()
+                raise
+
+    def release(self):
+        """Marks a request admitted by :const:`~twitchAPI.helper.HelixRateLimitBucket.acquire()` as done without rate limit information"""
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+
+    def update(self, headers: Mapping[str, str], rate_limited: bool = False):
+        """Marks a request as done and corrects the bucket with the rate limit headers of its response
+
+        :param headers: the response headers
+        :param rate_limited: if the request got rejected with status code 429 |default| :code:`False`
+        """
+        self.release()
+        try:
+            limit = int(headers['Ratelimit-Limit'])
+            remaining = int(headers['Ratelimit-Remaining'])
+        except (KeyError, ValueError):
+            limit, remaining = self.limit, 0 if rate_limited else None
+        with self._lock:
+            if limit > 0:
+                self.limit = limit
+            self._refill()
+            if remaining is not None:
+                # requests still in flight are most likely not counted yet by the server
+                self.tokens = min(self.tokens, float(remaining - self.in_flight))
+            if rate_limited or remaining == 0:
+                try:
+                    reset = float(headers['Ratelimit-Reset']) - time.time()
+                except (KeyError, ValueError):
+                    reset = None
+                if reset is not None and reset > 0:
+                    # points only come back at the reset time, delay the queue accordingly
+                    self.tokens = min(self.tokens, 1 - reset * self.limit / self.period - self.in_flight)
+        if rate_limited:
+            self._warn('reached Helix rate limit, throttling requests')
+
+    def _warn(self, msg):
+        if self.logger is not None:
+            self.logger.warning(msg)
+        else:
+            logging.warning(msg)
+
+
 RATE_LIMIT_SIZES = {
     'user': 20,
     'mod': 100
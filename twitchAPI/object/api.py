@@ -26,7 +26,8 @@ __all__ = ['TwitchUser', 'TwitchUserFollow', 'TwitchUserFollowResult', 'DateRang
            'StreamVacation', 'ChannelStreamSchedule', 'ChannelVIP', 'UserChatColor', 'Chatter', 'GetChattersResponse', 'ShieldModeStatus',
            'CharityAmount', 'CharityCampaign', 'CharityCampaignDonation', 'AutoModSettings', 'ChannelFollower', 'ChannelFollowersResult',
            'FollowedChannel', 'FollowedChannelsResult', 'ContentClassificationLabel', 'AdSchedule', 'AdSnoozeResponse', 'SendMessageResponse',
-           'ChannelModerator', 'UserEmotesResponse', 'WarnResponse', 'SharedChatParticipant', 'SharedChatSession']
+           'ChannelModerator', 'UserEmotesResponse', 'WarnResponse', 'SharedChatParticipant', 'SharedChatSession',
+           'Conduit', 'ConduitShard', 'GetConduitShardsResult', 'ConduitShardError', 'UpdateConduitShardsResult']
 
 
 class TwitchUser(TwitchObject):
@@ -884,3 +885,39 @@ class SharedChatSession(TwitchObject):
     """The UTC timestamp when the session was created."""
     updated_at: datetime
     """The UTC timestamp when the session was last updated."""
+
+
+class Conduit(TwitchObject):
+    id: str
+    """The ID of the conduit."""
+    shard_count: int
+    """The number of shards associated with the conduit."""
+
+
+class ConduitShard(TwitchObject):
+    id: str
+    """The ID of the shard."""
+    status: str
+    """The status of the shard, e.g. :code:`enabled` or :code:`websocket_disconnected`."""
+    transport: Dict[str, str]
+    """The transport details used to send the notifications to this shard."""
+
+
+class GetConduitShardsResult(AsyncIterTwitchObject[ConduitShard]):
+    data: List[ConduitShard]
+
+
+class ConduitShardError(TwitchObject):
+    id: str
+    """The ID of the shard which could not be updated."""
+    message: str
+    """The error that occurred while updating the shard."""
+    code: str
+    """Error codes used to represent a specific error condition while attempting to update shards."""
+
+
+class UpdateConduitShardsResult(TwitchObject):
+    data: List[ConduitShard]
+    """The shards which where successfully updated."""
+    errors: List[ConduitShardError]
+    """The shards which could not be updated."""
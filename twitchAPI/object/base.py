@@ -2,22 +2,103 @@
 """
 Base Objects used by the Library
 --------------------------------
+
+Compact Objects
+===============
+
+By default, every :const:`~twitchAPI.object.base.TwitchObject` stores its fields in a per instance :code:`__dict__`.
+If you keep a lot of these objects in memory, you can set the environment variable :code:`TWITCHAPI_COMPACT_OBJECTS=1` before importing
+the library. All object classes are then generated with :code:`__slots__` instead, attribute access, :code:`to_dict()` and :code:`repr()` behave the same.
+
+Measured with :code:`tracemalloc` on CPython 3.11 for 100,000 objects using :code:`benchmarks/bench_object_memory.py` from the repository:
+
+.. list-table::
+   :header-rows: 1
+
+   * - Object
+     - Default
+     - Compact
+   * - :const:`~twitchAPI.object.api.ChannelFollower` (4 fields)
+     - 16.0 MB
+     - 12.8 MB
+   * - :const:`~twitchAPI.object.api.Chatter` (3 fields)
+     - 10.4 MB
+     - 7.2 MB
+   * - :const:`~twitchAPI.object.api.Stream` (15 fields)
+     - 40.8 MB
+     - 36.0 MB
+
+.. note:: Compact objects can not get attributes assigned that are not one of their annotated fields.
+
+Lazy Decoding
+=============
+
+By default, all fields of a object get decoded when it is created, including parsing of timestamps and building nested objects.
+If you only read a few fields of large payloads, you can enable lazy decoding:
+
+.. code-block:: python
+
+    from twitchAPI.object.base import TwitchObject
+
+    # for all objects
+    TwitchObject.lazy_decoding = True
+    # or just for specific ones
+    ChannelChatMessageEvent.lazy_decoding = True
+
+Objects then keep the raw data and decode each field on first access. The decoded value is cached and its raw data dropped,
+so a object holds no more than a eagerly decoded one once all of its fields were read.
 """
+import os
+from array import array
 from datetime import datetime
 from enum import Enum
-from typing import TypeVar, Union, Generic, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import TypeVar, Union, Generic, Optional, Callable, Any, Dict, List, Mapping
 
-from aiohttp import ClientSession
-from dateutil import parser as du_parser
-
-from twitchAPI.helper import build_url
+from twitchAPI.helper import parse_iso_datetime
+from twitchAPI.type import DecodingMode
 
 T = TypeVar('T')
 
 __all__ = ['TwitchObject', 'IterTwitchObject', 'AsyncIterTwitchObject']
 
+_ANNOTATIONS: Dict[type, dict] = {}
+"""merged annotations of each TwitchObject class"""
+_DECODER_PLANS: Dict[type, Dict[str, Callable[[Any], Any]]] = {}
+"""field names and their converters for each TwitchObject class"""
+_SIMPLE_TYPES = (str, int, float, bool)
+_ARRAY_TYPECODES = {int: 'q', float: 'd', bool: 'b'}
+COMPACT_OBJECTS: bool = os.environ.get('TWITCHAPI_COMPACT_OBJECTS', '').lower() not in ('', '0', 'false', 'no')
+"""If objects are generated with :code:`__slots__`, set via the :code:`TWITCHAPI_COMPACT_OBJECTS` environment variable"""
+
+
+def _convert_datetime(val: Union[str, int]) -> Optional[datetime]:
+    if isinstance(val, int):
+        # assume unix timestamp
+        return None if val == 0 else datetime.fromtimestamp(val)
+    # assume ISO8601 string
+    return parse_iso_datetime(val) if len(val) > 0 else None
+
+
+class _TwitchObjectMeta(type):
+    """generates __slots__ from the annotations of each class if compact objects are enabled"""
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        if COMPACT_OBJECTS and '__slots__' not in namespace:
+            inherited = set()
+            for base in bases:
+                for c in base.__mro__:
+                    inherited.update(c.__dict__.get('__slots__', ()))
+            slots = [n for n in namespace.get('__annotations__', {}).keys() if n not in inherited]
+            # class level default values would conflict with the slots, they are served by __getattr__ instead
+            defaults = {n: namespace.pop(n) for n in slots if n in namespace}
+            namespace['__slots__'] = tuple(slots)
+            namespace['_slot_defaults'] = defaults
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
 
-class TwitchObject:
+
+class TwitchObject(metaclass=_TwitchObjectMeta):
     """
     A lot of API calls return a child of this in some way (either directly or via generator).
     You can always use the :const:`~twitchAPI.object.TwitchObject.to_dict()` method to turn that object to a dictionary.
@@ -28,17 +109,73 @@ class TwitchObject:
 
         blocked_term = await twitch.add_blocked_term('broadcaster_id', 'moderator_id', 'bad_word')
         print(blocked_term.id)"""
+    # without compact objects the raw data of lazy objects is kept in __dict__ instead
+    __slots__ = ('_lazy_raw',) if COMPACT_OBJECTS else ()
+
+    lazy_decoding = False
+    """If set to True, fields are only decoded on first access. Can be set for all objects or per class |default| :code:`False`"""
+
+    def __getattr__(self, name):
+        # only called for fields that are not set yet: lazy fields or unset fields of compact objects
+        if name == '_lazy_raw':
+            raise AttributeError(name)
+        try:
+            raw = object.__getattribute__(self, '_lazy_raw')
+        except AttributeError:
+            raw = None
+        if raw is not None and name in raw:
+            # only the decoded value is kept
+            val = raw.pop(name)
+            if len(raw) == 0:
+                del self._lazy_raw
+            val = None if val is None else self._get_decoder_plan()[name](val)
+            setattr(self, name, val)
+            return val
+        for c in type(self).__mro__:
+            defaults = c.__dict__.get('_slot_defaults')
+            if defaults is not None and name in defaults:
+                return defaults[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setstate__(self, state):
+        # without this, unpickling looks up __setstate__ through __getattr__ for every restored object
+        if isinstance(state, tuple):
+            # compact objects are pickled as (__dict__, __slots__) values
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for name, val in state.items():
+            setattr(self, name, val)
+
+    def _field_names(self) -> List[str]:
+        """names of all attributes set on this instance"""
+        try:
+            names = list(object.__getattribute__(self, '__dict__').keys())
+        except AttributeError:
+            names = []
+        try:
+            raw = object.__getattribute__(self, '_lazy_raw')
+        except AttributeError:
+            raw = None
+        if COMPACT_OBJECTS or raw is not None:
+            for name in self._get_annotations().keys():
+                if name in names:
+                    continue
+                if raw is None or name not in raw:
+                    if not COMPACT_OBJECTS:
+                        continue
+                    try:
+                        object.__getattribute__(self, name)
+                    except AttributeError:
+                        continue
+                names.append(name)
+        return names
+
     @staticmethod
     def _val_by_instance(instance, val):
         if val is None:
             return None
         origin = instance.__origin__ if hasattr(instance, '__origin__') else None
         if instance == datetime:
-            if isinstance(val, int):
-                # assume unix timestamp
-                return None if val == 0 else datetime.fromtimestamp(val)
-            # assume ISO8601 string
-            return du_parser.isoparse(val) if len(val) > 0 else None
+            return _convert_datetime(val)
         elif origin is list:
             c = instance.__args__[0]
             return [TwitchObject._val_by_instance(c, x) for x in val]
@@ -77,19 +214,83 @@ class TwitchObject:
             c1 = instance.__args__[0]
             return TwitchObject._dict_val_by_instance(c1, val, include_none_values)
         elif issubclass(instance, TwitchObject):
+            if isinstance(val, Mapping):
+                # not decoded raw data
+                return dict(val)
             return val.to_dict(include_none_values)
         elif isinstance(val, Enum):
             return val.value
         return instance(val)
 
+    @staticmethod
+    def _build_converter(instance) -> Callable[[Any], Any]:
+        """builds a function that does the same as _val_by_instance for a non None value of the given type"""
+        try:
+            origin = instance.__origin__ if hasattr(instance, '__origin__') else None
+            if instance == datetime:
+                return _convert_datetime
+            elif origin is list:
+                c = TwitchObject._build_converter(instance.__args__[0])
+                return lambda val: [None if x is None else c(x) for x in val]
+            elif origin is dict:
+                c1 = TwitchObject._build_converter(instance.__args__[0])
+                c2 = TwitchObject._build_converter(instance.__args__[1])
+                return lambda val: {None if x1 is None else c1(x1): None if x2 is None else c2(x2) for x1, x2 in val.items()}
+            elif origin == Union:
+                return TwitchObject._build_converter(instance.__args__[0])
+            elif issubclass(instance, TwitchObject):
+                return lambda val: instance(**val)
+            elif instance in _SIMPLE_TYPES:
+                return lambda val: val if type(val) is instance else instance(val)
+            return instance
+        except TypeError:
+            # not something we know how to handle ahead of time, let _val_by_instance deal with it on use
+            return partial(TwitchObject._val_by_instance, instance)
+
+    @classmethod
+    def _get_decoder_plan(cls) -> Dict[str, Callable[[Any], Any]]:
+        """returns the field names and their converters of this class, the plan is build once per class on first use"""
+        plan = _DECODER_PLANS.get(cls)
+        if plan is None:
+            plan = {name: TwitchObject._build_converter(instance) for name, instance in cls._get_annotations().items()}
+            _DECODER_PLANS[cls] = plan
+        return plan
+
+    @classmethod
+    def _build_columns(cls, entries: List[dict]) -> Dict[str, Union[list, array]]:
+        """builds a dictionary of columns for the fields of this class from the given raw entries without creating instances"""
+        columns = {}
+        plan = cls._get_decoder_plan()
+        for name, instance in cls._get_annotations().items():
+            values = [e.get(name) for e in entries]
+            origin = instance.__origin__ if hasattr(instance, '__origin__') else None
+            if origin is Union:
+                instance = instance.__args__[0]
+                origin = instance.__origin__ if hasattr(instance, '__origin__') else None
+            typecode = _ARRAY_TYPECODES.get(instance)
+            if typecode is not None and None not in values:
+                try:
+                    columns[name] = array(typecode, values)
+                    continue
+                except (TypeError, OverflowError):
+                    pass
+            if origin is None and isinstance(instance, type) and not issubclass(instance, TwitchObject):
+                converter = plan[name]
+                values = [None if v is None else converter(v) for v in values]
+            columns[name] = values
+        return columns
+
     @classmethod
     def _get_annotations(cls):
-        d = {}
-        for c in cls.mro():
-            try:
-                d.update(**c.__annotations__)
-            except AttributeError:
-                pass
+        d = _ANNOTATIONS.get(cls)
+        if d is None:
+            d = {}
+            for c in cls.mro():
+                try:
+                    d.update(**c.__annotations__)
+                except AttributeError:
+                    pass
+            _ANNOTATIONS[cls] = d
         return d
 
     def to_dict(self, include_none_values: bool = False) -> dict:
@@ -99,7 +300,7 @@ class TwitchObject:
         """
         d = {}
         annotations = self._get_annotations()
-        for name, val in self.__dict__.items():
+        for name in self._field_names():
             val = None
             cls = annotations.get(name)
             try:
@@ -114,11 +315,35 @@ class TwitchObject:
         return d
 
     def __init__(self, **kwargs):
-        merged_annotations = self._get_annotations()
-        for name, cls in merged_annotations.items():
-            if name not in kwargs.keys():
+        self._decode(kwargs)
+
+    def _decode(self, data: dict, update: bool = False):
+        if self.lazy_decoding:
+            self._decode_lazy(data, update)
+            return
+        for name, converter in self._get_decoder_plan().items():
+            if name not in data:
                 continue
-            self.__setattr__(name, TwitchObject._val_by_instance(cls, kwargs.get(name)))
+            val = data[name]
+            setattr(self, name, None if val is None else converter(val))
+
+    def _decode_lazy(self, data: dict, update: bool):
+        plan = self._get_decoder_plan()
+        # fields are removed from this once decoded, so keep our own copy of the data
+        raw = {name: val for name, val in data.items() if name in plan}
+        if update:
+            # already decoded values of fields in data are outdated
+            for name in raw.keys():
+                try:
+                    delattr(self, name)
+                except AttributeError:
+                    pass
+            try:
+                raw = {**object.__getattribute__(self, '_lazy_raw'), **raw}
+            except AttributeError:
+                pass
+        if len(raw) > 0:
+            self._lazy_raw = raw
 
     def __repr__(self):
         merged_annotations = self._get_annotations()
@@ -141,9 +366,9 @@ class IterTwitchObject(TwitchObject):
               print(f'#{e.rank:02d} - {e.user_name}: {e.score}')"""
 
     def __iter__(self):
-        if not hasattr(self, 'data') or not isinstance(self.__getattribute__('data'), list):
+        if not hasattr(self, 'data') or not isinstance(getattr(self, 'data'), list):
             raise ValueError('Object is missing data attribute of type list')
-        for i in self.__getattribute__('data'):
+        for i in getattr(self, 'data'):
             yield i
 
 
@@ -159,44 +384,66 @@ class AsyncIterTwitchObject(TwitchObject, Generic[T]):
            print(schedule.broadcaster_name)
            async for segment in schedule:
                print(segment.title)"""
+    __slots__ = ('__idx', '__pages', '_data')
 
     def __init__(self, _data, **kwargs):
         super(AsyncIterTwitchObject, self).__init__(**kwargs)
         self.__idx = 0
+        self.__pages = None
         self._data = _data
 
     def __aiter__(self):
         return self
 
+    def _set_raw_items(self, items: Optional[list]):
+        """sets the not decoded entries to iterate over"""
+        if items is None:
+            return
+        if self._data.get('mode') == DecodingMode.READ_ONLY:
+            items = [MappingProxyType(x) for x in items]
+        elif self._data.get('mode') == DecodingMode.COLUMNS:
+            # a single batch for the whole page
+            item_type = self._get_annotations().get(self._data['iter_field'])
+            if hasattr(item_type, '__args__') and isinstance(item_type.__args__[0], type) and issubclass(item_type.__args__[0], TwitchObject):
+                items = [item_type.__args__[0]._build_columns(items)]
+        setattr(self, self._data['iter_field'], items)
+
     def current_cursor(self) -> Optional[str]:
         """Provides the currently used forward pagination cursor"""
         return self._data['param'].get('after')
 
     async def __anext__(self) -> T:
-        if not hasattr(self, self._data['iter_field']) or not isinstance(self.__getattribute__(self._data['iter_field']), list):
+        if not hasattr(self, self._data['iter_field']) or not isinstance(getattr(self, self._data['iter_field']), list):
             raise ValueError(f'Object is missing {self._data["iter_field"]} attribute of type list')
-        data = self.__getattribute__(self._data['iter_field'])
+        data = getattr(self, self._data['iter_field'])
         if len(data) > self.__idx:
             self.__idx += 1
             return data[self.__idx - 1]
-        # make request
-        if self._data['param']['after'] is None:
-            raise StopAsyncIteration()
-        _url = build_url(self._data['url'], self._data['param'], remove_none=True, split_lists=self._data['split'])
-        async with ClientSession() as session:
-            response = await self._data['req'](self._data['method'], session, _url, self._data['auth_t'], self._data['auth_s'], self._data['body'])
-            _data = await response.json()
+        checkpoint = self._data.get('checkpoint')
+        if checkpoint is not None and not checkpoint.done:
+            # the current page is fully consumed
+            await checkpoint.update(self._data['param']['after'])
+        # get the next page, these might already be fetched ahead
+        if self.__pages is None:
+            if self._data['param']['after'] is None:
+                raise StopAsyncIteration()
+            self.__pages = self._data['pages']()
+        try:
+            _data = await self.__pages.__anext__()
+        except StopAsyncIteration:
+            self._data['param']['after'] = None
+            raise
         _after = _data.get('pagination', {}).get('cursor')
         self._data['param']['after'] = _after
         if self._data['in_data']:
             _data = _data['data']
         # refill data
-        merged_annotations = self._get_annotations()
-        for name, cls in merged_annotations.items():
-            if name not in _data.keys():
-                continue
-            self.__setattr__(name, TwitchObject._val_by_instance(cls, _data.get(name)))
-        data = self.__getattribute__(self._data['iter_field'])
+        if self._data.get('mode', DecodingMode.OBJECT) == DecodingMode.OBJECT:
+            self._decode(_data, update=True)
+        else:
+            self._decode({k: v for k, v in _data.items() if k != self._data['iter_field']}, update=True)
+            self._set_raw_items(_data.get(self._data['iter_field']))
+        data = getattr(self, self._data['iter_field'])
         self.__idx = 1
         if len(data) == 0:
             raise StopAsyncIteration()
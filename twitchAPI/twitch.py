@@ -200,14 +200,22 @@ Class Documentation
 *******************
 """
 import asyncio
+import weakref
 import aiohttp.helpers
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from types import MappingProxyType
 from datetime import datetime
-from aiohttp import ClientSession, ClientResponse
+from aiohttp import ClientSession, ClientResponse, TCPConnector
 from aiohttp.client import ClientTimeout
 from twitchAPI.helper import (
-    TWITCH_API_BASE_URL, TWITCH_AUTH_BASE_URL, build_scope, enum_value_or_none, datetime_to_str, remove_none_values, ResultType, build_url)
+    TWITCH_API_BASE_URL, TWITCH_AUTH_BASE_URL, build_scope, enum_value_or_none, datetime_to_str, remove_none_values, ResultType, build_url,
+    HelixRateLimitBucket, PaginationCheckpoint, copy_json)
 from logging import getLogger, Logger
 from twitchAPI.object.base import TwitchObject
+from twitchAPI.cache import ResponseCache
+from twitchAPI.codec import JSONCodec, get_json_codec
 from twitchAPI.object.api import (
     TwitchUser, ExtensionAnalytic, GameAnalytics, CreatorGoal, BitsLeaderboard, ExtensionTransaction, ChatSettings, CreatedClip, Clip, 
     Game, AutoModStatus, BannedUser, BanUserResponse, BlockedTerm, Moderator, CreateStreamMarkerResponse, Stream, GetStreamMarkerResponse,
@@ -216,18 +224,86 @@ from twitchAPI.object.api import (
     CustomRewardRedemption, ChannelEditor, BlockListEntry, Poll, Prediction, RaidStartResult, ChatBadge, GetChannelEmotesResponse,
     GetEmotesResponse, GetEventSubSubscriptionResult, ChannelStreamSchedule, ChannelVIP, UserChatColor, GetChattersResponse, ShieldModeStatus,
     CharityCampaign, CharityCampaignDonation, AutoModSettings, ChannelFollowersResult, FollowedChannelsResult, ContentClassificationLabel, 
-    AdSchedule, AdSnoozeResponse, SendMessageResponse, ChannelModerator, UserEmotesResponse, WarnResponse, SharedChatSession)
+    AdSchedule, AdSnoozeResponse, SendMessageResponse, ChannelModerator, UserEmotesResponse, WarnResponse, SharedChatSession, Conduit, GetConduitShardsResult,
+    UpdateConduitShardsResult)
 from twitchAPI.type import (
     AnalyticsReportType, AuthScope, TimePeriod, SortMethod, VideoType, AuthType, CustomRewardRedemptionStatus, SortOrder,
     BlockSourceContext, BlockReason, EntitlementFulfillmentStatus, PollStatus, PredictionStatus, AutoModAction,
     AutoModCheckEntry, TwitchAPIException, InvalidTokenException, TwitchAuthorizationException,
-    UnauthorizedException, MissingScopeException, TwitchBackendException, MissingAppSecretException, TwitchResourceNotFound, ForbiddenError)
-from typing import Sequence, Union, List, Optional, Callable, AsyncGenerator, TypeVar, Awaitable, Type, Mapping, overload, Tuple
+    UnauthorizedException, MissingScopeException, TwitchBackendException, MissingAppSecretException, TwitchResourceNotFound, ForbiddenError,
+    DecodingMode)
+from typing import Sequence, Union, List, Optional, Callable, AsyncGenerator, TypeVar, Awaitable, Type, Mapping, overload, Tuple, Dict, Any
 
 __all__ = ['Twitch']
 T = TypeVar('T', bound=TwitchObject)
 
 
+class _LookupBatcher:
+    """Collects lookups made within a short time window and resolves them together with as few requests as possible"""
+
+    def __init__(self,
+                 fetch: Callable[[List[Tuple[str, str]]], Awaitable[Dict[Tuple[str, str], dict]]],
+                 window: float,
+                 max_size: int = 100):
+        self._fetch = fetch
+        self.window: float = window
+        self.max_size: int = max_size
+        # the keys of each waiting call together with the future its results are set on
+        self._pending: List[Tuple[List[Tuple[str, str]], asyncio.Future]] = []
+        self._pending_keys: set = set()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+
+    async def load(self, keys: List[Tuple[str, str]]) -> List[Optional[dict]]:
+        """returns the entry for each of the given keys or None if there was none"""
+        loop = asyncio.get_running_loop()
+        if len(self._pending_keys.union(keys)) > self.max_size:
+            self._flush()
+        fut = loop.create_future()
+        self._pending.append((keys, fut))
+        self._pending_keys.update(keys)
+        if len(self._pending_keys) >= self.max_size:
+            self._flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.window, self._flush)
+        return await fut
+
+    def _flush(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, []
+        keys, self._pending_keys = self._pending_keys, set()
+        if len(pending) == 0:
+            return
+        task = asyncio.ensure_future(self._resolve(pending, list(keys)))
+        # keep a reference, otherwise the task might get garbage collected before it is done
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, pending: List[Tuple[List[Tuple[str, str]], asyncio.Future]], keys: List[Tuple[str, str]]):
+        try:
+            result = await self._fetch(keys)
+        except Exception as e:
+            if len(pending) == 1:
+                if not pending[0][1].done():
+                    pending[0][1].set_exception(e)
+                return
+            # one invalid key (e.g. a malformed login) fails the whole request, retry each call on its own
+            # so the error only reaches the call that caused it
+            await asyncio.gather(*[self._resolve([p], p[0]) for p in pending])
+            return
+        shared = len(pending) > 1
+        for call_keys, fut in pending:
+            if not fut.done():
+                entries = [result.get(key) for key in call_keys]
+                if shared:
+                    # each call gets its own copies, keys of the same entry keep resolving to the same object
+                    copies = {id(e): copy_json(e) for e in entries}
+                    entries = [copies[id(e)] for e in entries]
+                fut.set_result(entries)
+
+
 class Twitch:
     """
     Twitch API client
@@ -276,6 +352,53 @@ class Twitch:
         self.auth_base_url: str = auth_base_url
         self._user_token_refresh_lock: bool = False
         self._app_token_refresh_lock: bool = False
+        self.session_connection_limit: int = 100
+        """Maximum number of simultaneous connections in the shared connection pool. :code:`0` means no limit |default| :code:`100`"""
+        self.session_connection_limit_per_host: int = 0
+        """Maximum number of simultaneous connections to the same host. :code:`0` means no limit |default| :code:`0`"""
+        self.session_dns_cache_ttl: int = 300
+        """Time in seconds resolved DNS entries are cached for |default| :code:`300`"""
+        self.session_keepalive_timeout: float = 30.0
+        """Time in seconds idle connections are kept alive for reuse |default| :code:`30`"""
+        self._sessions: Dict[asyncio.AbstractEventLoop, ClientSession] = {}
+        self._rate_limit_buckets: Dict[str, HelixRateLimitBucket] = {}
+        self.bulk_request_concurrency: int = 10
+        """Maximum number of requests run at the same time when a call has to be split up into multiple requests,
+        for example :const:`~twitchAPI.twitch.Twitch.get_users()` with more than 100 entries.
+        The results are still returned in the order of the requests |default| :code:`10`"""
+        self.coalesce_requests: bool = True
+        """If set to true, identical GET requests made with the same authorization while one of them is still in flight share
+        a single API call and its response |default| :code:`True`"""
+        self._inflight_requests: Dict[tuple, asyncio.Future] = {}
+        self._shared_requests: 'weakref.WeakSet[asyncio.Future]' = weakref.WeakSet()
+        self.lookup_batch_window: Optional[float] = None
+        """Time in seconds concurrent calls of :const:`~twitchAPI.twitch.Twitch.get_users()` and
+        :const:`~twitchAPI.twitch.Twitch.get_streams()` (only filtering by at most :code:`first` user_id entries) are collected for
+        before being merged into requests of up to 100 entries. :code:`0` only merges calls made within the same event loop iteration,
+        raise this if you for example look up one user per chat message. If a merged request fails, each call is retried on its own.
+        :code:`None` disables merging |default| :code:`None`"""
+        self._lookup_batchers: Dict[Tuple[str, asyncio.AbstractEventLoop], _LookupBatcher] = {}
+        self.prefetch_depth: int = 0
+        """Number of pages of paginated results that are fetched ahead while the current page is still being processed.
+        Prefetched pages count against the rate limit even if they are never used, e.g. when only reading the first result with
+        :const:`~twitchAPI.helper.first()`, so only raise this for calls that go through most of their pages.
+        :code:`0` only fetches the next page once the current one is used up |default| :code:`0`"""
+        self.response_cache: Optional[ResponseCache] = None
+        """If set, responses of slow changing endpoints are cached using this. See :doc:`/modules/twitchAPI.cache` |default| :code:`None`"""
+        self.json_codec: JSONCodec = get_json_codec()
+        """The codec used to decode and encode JSON bodies. Picks the fastest installed codec by default,
+        see :doc:`/modules/twitchAPI.codec` for details. |default| :code:`get_json_codec('auto')`"""
+        self.decoding_mode: DecodingMode = DecodingMode.OBJECT
+        """How results of API calls are returned. Use :const:`~twitchAPI.twitch.Twitch.decoding()` to only change it for some calls.
+        With any other mode than :const:`~twitchAPI.type.DecodingMode.OBJECT`, the entries of results are returned as the raw API data instead
+        of the documented objects, e.g. :const:`~twitchAPI.twitch.Twitch.get_videos()` yields dictionaries.
+        Results with pagination, e.g. of :const:`~twitchAPI.twitch.Twitch.get_channel_followers()`, are still returned as the documented
+        object, but the entries they iterate over are not decoded.
+        See :const:`~twitchAPI.type.DecodingMode` for the available modes. |default| :const:`~twitchAPI.type.DecodingMode.OBJECT`"""
+        self._decoding_mode_context: ContextVar[Optional[DecodingMode]] = ContextVar(f'twitch_decoding_mode_{id(self)}', default=None)
+        # holds the checkpoint until the first paginated call claims it
+        self._pagination_checkpoint_context: ContextVar[Optional[List[PaginationCheckpoint]]] = \
+            ContextVar(f'twitch_pagination_checkpoint_{id(self)}', default=None)
 
     def __await__(self):
         if self._authenticate_app:
@@ -283,12 +406,160 @@ class Twitch:
             yield from t
         return self
 
-    @staticmethod
-    async def close():
+    async def close(self):
         """Gracefully close the connection to the Twitch API"""
+        loop = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+        for session_loop, session in sessions.items():
+            if session.closed:
+                continue
+            if session_loop is loop:
+                await session.close()
+            elif session_loop.is_running():
+                # session belongs to a different thread (e.g. Chat or EventSub), close it over there
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), session_loop))
         # ensure that asyncio actually gracefully shut down
         await asyncio.sleep(0.25)
 
+    def _json_dumps(self, obj) -> str:
+        return self.json_codec.dumps(obj)
+
+    async def _get_session(self) -> ClientSession:
+        """Returns the shared session for the currently running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # drop sessions of event loops that are gone
+            for _loop in [_l for _l in self._sessions.keys() if _l.is_closed()]:
+                self._sessions.pop(_loop)
+            connector = TCPConnector(limit=self.session_connection_limit,
+                                     limit_per_host=self.session_connection_limit_per_host,
+                                     ttl_dns_cache=self.session_dns_cache_ttl,
+                                     keepalive_timeout=self.session_keepalive_timeout)
+            session = ClientSession(connector=connector, timeout=self.session_timeout, json_serialize=self._json_dumps)
+            self._sessions[loop] = session
+        return session
+
+    async def _close_session(self):
+        """Closes the shared session of the currently running event loop, if there is one"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    @contextmanager
+    def decoding(self, mode: DecodingMode):
+        """Context manager that changes the :const:`~twitchAPI.twitch.Twitch.decoding_mode` for all calls made within it.
+        Only affects the current task.
+
+        Example:
+
+        .. code-block:: python
+
+            with twitch.decoding(DecodingMode.RAW):
+                async for video in twitch.get_videos(user_id='1234'):
+                    print(video['title'])
+
+        :param mode: the decoding mode to use
+        """
+        token = self._decoding_mode_context.set(mode)
+        try:
+            yield
+        finally:
+            self._decoding_mode_context.reset(token)
+
+    @contextmanager
+    def pagination_checkpoint(self, checkpoint: PaginationCheckpoint):
+        """Context manager that tracks the pagination of the paginated call started within it using the given checkpoint
+        and resumes from its cursor. See :const:`~twitchAPI.helper.PaginationCheckpoint`.
+        The checkpoint is bound to the first paginated call started within the context,
+        paginated calls started while iterating over that one are not tracked.
+
+        Calls that get split up into multiple requests because of too many entries (e.g. :const:`~twitchAPI.twitch.Twitch.get_users()`)
+        do not support checkpoints.
+
+        :param checkpoint: the checkpoint to use
+        """
+        token = self._pagination_checkpoint_context.set([checkpoint])
+        try:
+            yield
+        finally:
+            self._pagination_checkpoint_context.reset(token)
+
+    def _claim_pagination_checkpoint(self) -> Optional[PaginationCheckpoint]:
+        """returns the checkpoint of the current context if no other paginated call claimed it yet"""
+        holder = self._pagination_checkpoint_context.get()
+        return holder.pop() if holder else None
+
+    def _get_decoding_mode(self) -> DecodingMode:
+        mode = self._decoding_mode_context.get()
+        return mode if mode is not None else self.decoding_mode
+
+    @staticmethod
+    def _decode_entry(return_type, entry: dict, mode: DecodingMode):
+        if mode in (DecodingMode.RAW, DecodingMode.COLUMNS):
+            return entry
+        if mode == DecodingMode.READ_ONLY:
+            return MappingProxyType(entry)
+        return return_type(**entry)
+
+    def _get_lookup_batcher(self,
+                            name: str,
+                            fetch: Callable[[List[Tuple[str, str]]], Awaitable[Dict[Tuple[str, str], dict]]]) -> _LookupBatcher:
+        """Returns the lookup batcher with the given name for the currently running event loop, creating it on first use"""
+        key = (name, asyncio.get_running_loop())
+        batcher = self._lookup_batchers.get(key)
+        if batcher is None:
+            for _key in [_k for _k in self._lookup_batchers.keys() if _k[1].is_closed()]:
+                self._lookup_batchers.pop(_key)
+            batcher = _LookupBatcher(fetch, self.lookup_batch_window or 0.0)
+            self._lookup_batchers[key] = batcher
+        batcher.window = self.lookup_batch_window or 0.0
+        return batcher
+
+    async def _load_batched(self,
+                            name: str,
+                            fetch: Callable[[List[Tuple[str, str]]], Awaitable[Dict[Tuple[str, str], dict]]],
+                            keys: List[Tuple[str, str]],
+                            url_params: dict) -> List[dict]:
+        """Looks up the given keys through the lookup batcher, returns the entries that were found.
+        Uses the response cache with the same key a not merged request with the given url params would have."""
+        cache_key = None
+        if self.response_cache is not None:
+            headers = self._generate_header(AuthType.EITHER, [])
+            endpoint, query = self._split_cache_url(build_url(self.base_url + name, url_params, remove_none=True, split_lists=True))
+            cache_key = (endpoint, query, headers.get('Authorization'))
+            cached = await self._run_cache(self.response_cache.get, *cache_key)
+            if cached is not None:
+                return cached.get('data', [])
+        entries = list({id(e): e for e in await self._get_lookup_batcher(name, fetch).load(keys) if e is not None}.values())
+        if cache_key is not None:
+            await self._run_cache(self.response_cache.set, *cache_key, {'data': entries})
+        return entries
+
+    async def _fetch_users_batch(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        param = {
+            'id': [v for f, v in keys if f == 'id'] or None,
+            'login': [v for f, v in keys if f == 'login'] or None
+        }
+        session = await self._get_session()
+        _url = build_url(self.base_url + 'users', param, remove_none=True, split_lists=True)
+        data = await self._api_request_json('GET', session, _url, AuthType.EITHER, [])
+        result = {}
+        for entry in data.get('data', []):
+            result[('id', entry['id'])] = entry
+            result[('login', entry['login'].lower())] = entry
+        return result
+
+    async def _fetch_streams_batch(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        param = {
+            'user_id': [v for _, v in keys],
+            'first': 100
+        }
+        session = await self._get_session()
+        _url = build_url(self.base_url + 'streams', param, remove_none=True, split_lists=True)
+        data = await self._api_request_json('GET', session, _url, AuthType.EITHER, [])
+        return {('user_id', entry['user_id']): entry for entry in data.get('data', [])}
+
     def _generate_header(self, auth_type: 'AuthType', required_scope: List[Union[AuthScope, List[AuthScope]]]) -> dict:
         header = {"Client-ID": self.app_id}
         if auth_type == AuthType.EITHER:
@@ -373,6 +644,7 @@ class Twitch:
                 self._user_auth_token, self._user_auth_refresh_token = await refresh_access_token(self._user_auth_refresh_token, # type: ignore
                                                                                                   self.app_id,
                                                                                                   self.app_secret, # type: ignore
+                                                                                                  session=await self._get_session(),
                                                                                                   auth_base_url=self.auth_base_url)
                 self._user_token_refresh_lock = False
                 if self.user_auth_refresh_callback is not None:
@@ -406,22 +678,24 @@ class Twitch:
             if response.status == 503:
                 # service unavailable, retry exactly once as recommended by twitch documentation
                 self.logger.debug('got 503 response -> retry once')
+                response.release()
                 return await self._api_request(method, session, url, auth_type, required_scope, data=data, retries=retries - 1)
             elif response.status == 401:
                 if self.auto_refresh_auth:
                     # unauthorized, lets try to refresh the token once
                     self.logger.debug('got 401 response -> try to refresh token')
+                    response.release()
                     await self.refresh_used_token()
                     return await self._api_request(method, session, url, auth_type, required_scope, data=data, retries=retries - 1)
                 else:
-                    msg = (await response.json()).get('message', '')
+                    msg = (await response.json(loads=self.json_codec.loads)).get('message', '')
                     self.logger.debug(f'got 401 response and can\'t refresh. Message: "{msg}"')
                     raise UnauthorizedException(msg)
         else:
             if response.status == 503:
                 raise TwitchBackendException('The Twitch API returns a server error')
             elif response.status == 401:
-                msg = (await response.json()).get('message', '')
+                msg = (await response.json(loads=self.json_codec.loads)).get('message', '')
                 self.logger.debug(f'got 401 response and can\'t refresh. Message: "{msg}"')
                 raise UnauthorizedException(msg)
 
@@ -430,25 +704,39 @@ class Twitch:
         if response.status == 400:
             msg = None
             try:
-                msg = (await response.json()).get('message')
+                msg = (await response.json(loads=self.json_codec.loads)).get('message')
             except BaseException:
                 pass
             raise TwitchAPIException('Bad Request' + ('' if msg is None else f' - {str(msg)}'))
         if response.status == 404:
             msg = None
             try:
-                msg = (await response.json()).get('message')
+                msg = (await response.json(loads=self.json_codec.loads)).get('message')
             except BaseException:
                 pass
             raise TwitchResourceNotFound(msg)
-        if response.status == 429 or str(response.headers.get('Ratelimit-Remaining', '')) == '0':
-            self.logger.warning('reached rate limit, waiting for reset')
-            import time
-            reset = int(response.headers['Ratelimit-Reset'])
-            # wait a tiny bit longer to ensure that we are definitely beyond the rate limit
-            await asyncio.sleep((reset - time.time()) + 0.1)
+        if response.status == 429:
+            # the rate limit bucket already got drained until the reset time, so the retry waits for it
+            self.logger.debug('got 429 response -> retry after rate limit reset')
+            response.release()
+            return await self._api_request(method, session, url, auth_type, required_scope, data=data, retries=retries)
         return response
 
+    def _get_rate_limit_bucket(self, headers: dict) -> HelixRateLimitBucket:
+        # Helix rate limits are tracked per client id for app tokens and per client id and user for user tokens
+        auth = headers.get('Authorization')
+        if auth is None:
+            key = ''
+        elif self._app_auth_token is not None and auth == f'Bearer {self._app_auth_token}':
+            key = 'app'
+        else:
+            key = 'user'
+        bucket = self._rate_limit_buckets.get(key)
+        if bucket is None:
+            bucket = HelixRateLimitBucket(logger=self.logger)
+            self._rate_limit_buckets[key] = bucket
+        return bucket
+
     async def _api_request(self,
                            method: str,
                            session: ClientSession,
@@ -459,10 +747,100 @@ class Twitch:
                            retries: int = 1) -> ClientResponse:
         """Make API request"""
         headers = self._generate_header(auth_type, required_scope)
+        if method != 'GET' and self.response_cache is not None:
+            # the resource might have been changed by this request
+            await self._run_cache(self.response_cache.invalidate, self._split_cache_url(url)[0])
+        bucket = self._get_rate_limit_bucket(headers)
+        await bucket.acquire()
         self.logger.debug(f'making {method} request to {url}')
-        req = await session.request(method, url, headers=headers, json=data)
+        try:
+            req = await session.request(method, url, headers=headers, json=data)
+        except BaseException:
+            bucket.release()
+            raise
+        bucket.update(req.headers, req.status == 429)
         return await self._check_request_return(session, req, method, url, auth_type, required_scope, data, retries)
 
+    async def _api_request_json(self,
+                                method: str,
+                                session: ClientSession,
+                                url: str,
+                                auth_type: 'AuthType',
+                                required_scope: List[Union[AuthScope, List[AuthScope]]],
+                                data: Optional[dict] = None,
+                                error_handler: Optional[Mapping[int, BaseException]] = None) -> dict:
+        """Make API request and return the decoded body.
+        GET requests are answered from the response cache if possible and identical GET requests in flight share one request"""
+        if method != 'GET' or data is not None:
+            return await self._request_json(method, session, url, auth_type, required_scope, data, error_handler)
+        headers = self._generate_header(auth_type, required_scope)
+        if self.response_cache is not None:
+            endpoint, query = self._split_cache_url(url)
+            cached = await self._run_cache(self.response_cache.get, endpoint, query, headers.get('Authorization'))
+            if cached is not None:
+                return cached
+        if not self.coalesce_requests:
+            result = await self._request_json(method, session, url, auth_type, required_scope, data, error_handler)
+        else:
+            result = await self._request_json_shared(session, url, headers, auth_type, required_scope, error_handler)
+        if self.response_cache is not None and 'error' not in result:
+            await self._run_cache(self.response_cache.set, endpoint, query, headers.get('Authorization'), result)
+        return result
+
+    async def _request_json_shared(self,
+                                   session: ClientSession,
+                                   url: str,
+                                   headers: dict,
+                                   auth_type: 'AuthType',
+                                   required_scope: List[Union[AuthScope, List[AuthScope]]],
+                                   error_handler: Optional[Mapping[int, BaseException]] = None) -> dict:
+        # tasks and sessions are bound to a event loop, so only requests of the same loop can be shared
+        key = (asyncio.get_running_loop(), url, headers.get('Authorization'))
+        task = self._inflight_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_json('GET', session, url, auth_type, required_scope, error_handler=error_handler))
+            self._inflight_requests[key] = task
+
+            def _done(t):
+                if self._inflight_requests.get(key) is t:
+                    self._inflight_requests.pop(key)
+            task.add_done_callback(_done)
+        else:
+            self._shared_requests.add(task)
+            self.logger.debug(f'sharing in flight GET request to {url}')
+        # one waiter getting cancelled should not cancel the request for everyone else
+        result = await asyncio.shield(task)
+        # every waiter of a shared request gets its own copy, so changing one result does not change the others
+        return copy_json(result) if task in self._shared_requests else result
+
+    async def _run_cache(self, func: Callable[..., Any], *args) -> Any:
+        """calls func of the response cache, off the event loop if its backend might block"""
+        if self.response_cache is not None and self.response_cache.backend.blocking:
+            return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
+        return func(*args)
+
+    def _split_cache_url(self, url: str) -> Tuple[str, str]:
+        """splits a request url into the endpoint relative to the base url and the query string"""
+        path, _, query = url.partition('?')
+        if path.startswith(self.base_url):
+            path = path[len(self.base_url):]
+        return path.strip('/'), query
+
+    async def _request_json(self,
+                            method: str,
+                            session: ClientSession,
+                            url: str,
+                            auth_type: 'AuthType',
+                            required_scope: List[Union[AuthScope, List[AuthScope]]],
+                            data: Optional[dict] = None,
+                            error_handler: Optional[Mapping[int, BaseException]] = None) -> dict:
+        response = await self._api_request(method, session, url, auth_type, required_scope, data=data)
+        if error_handler is not None:
+            if response.status in error_handler.keys():
+                response.release()
+                raise error_handler[response.status]
+        return await response.json(loads=self.json_codec.loads)
+
     async def _build_generator(self,
                                method: str,
                                url: str,
@@ -472,22 +850,156 @@ class Twitch:
                                return_type: Type[T],
                                body_data: Optional[dict] = None,
                                split_lists: bool = False,
-                               error_handler: Optional[Mapping[int, BaseException]] = None) -> AsyncGenerator[T, None]:
-        _after = url_params.get('after')
-        _first = True
-        async with ClientSession(timeout=self.session_timeout) as session:
-            while _first or _after is not None:
-                url_params['after'] = _after
-                _url = build_url(self.base_url + url, url_params, remove_none=True, split_lists=split_lists)
-                response = await self._api_request(method, session, _url, auth_type, auth_scope, data=body_data)
-                if error_handler is not None:
-                    if response.status in error_handler.keys():
-                        raise error_handler[response.status]
-                data = await response.json()
-                for entry in data.get('data', []):
-                    yield return_type(**entry)
-                _after = data.get('pagination', {}).get('cursor')
-                _first = False
+                               error_handler: Optional[Mapping[int, BaseException]] = None,
+                               use_checkpoint: bool = True) -> AsyncGenerator[T, None]:
+        mode = self._get_decoding_mode()
+        checkpoint = self._claim_pagination_checkpoint() if use_checkpoint else None
+        if checkpoint is not None:
+            if checkpoint.done:
+                return
+            if checkpoint.cursor is not None and url_params.get('after') is None:
+                url_params['after'] = checkpoint.cursor
+        pages = self._iter_pages(method, url, url_params, auth_type, auth_scope, body_data, split_lists, error_handler)
+        try:
+            async for data in pages:
+                if mode == DecodingMode.COLUMNS:
+                    yield return_type._build_columns(data.get('data', []))
+                else:
+                    for entry in data.get('data', []):
+                        yield self._decode_entry(return_type, entry, mode)
+                if checkpoint is not None:
+                    await checkpoint.update(data.get('pagination', {}).get('cursor'))
+        finally:
+            await pages.aclose()
+
+    async def _iter_pages(self,
+                          method: str,
+                          url: str,
+                          url_params: dict,
+                          auth_type: AuthType,
+                          auth_scope: List[Union[AuthScope, List[AuthScope]]],
+                          body_data: Optional[dict] = None,
+                          split_lists: bool = False,
+                          error_handler: Optional[Mapping[int, BaseException]] = None) -> AsyncGenerator[dict, None]:
+        """yields the decoded response of each page starting at the after cursor in url_params,
+        up to prefetch_depth pages get fetched ahead in the background"""
+        session = await self._get_session()
+
+        async def _fetch(_after: Optional[str]) -> dict:
+            _url = build_url(self.base_url + url, {**url_params, 'after': _after}, remove_none=True, split_lists=split_lists)
+            return await self._api_request_json(method, session, _url, auth_type, auth_scope, data=body_data, error_handler=error_handler)
+
+        after = url_params.get('after')
+        if self.prefetch_depth <= 0:
+            while True:
+                page = await _fetch(after)
+                yield page
+                after = page.get('pagination', {}).get('cursor')
+                if after is None:
+                    return
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch_depth)
+
+        async def _produce(_after: Optional[str]):
+            try:
+                while True:
+                    _page = await _fetch(_after)
+                    await queue.put((True, _page))
+                    _after = _page.get('pagination', {}).get('cursor')
+                    if _after is None:
+                        break
+            except Exception as e:
+                await queue.put((False, e))
+                return
+            await queue.put(None)
+
+        task = asyncio.ensure_future(_produce(after))
+        try:
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    return
+                success, page = entry
+                if not success:
+                    raise page
+                yield page
+        finally:
+            task.cancel()
+
+    @staticmethod
+    def _chunk_url_params(url_params: dict, chunk_fields: List[str], chunk_size: int = 100) -> List[dict]:
+        """splits the list entries of chunk_fields into multiple url params with at most chunk_size entries combined"""
+        entries = []
+        for field in chunk_fields:
+            val = url_params.get(field)
+            if val is None:
+                continue
+            entries.extend((field, v) for v in (val if isinstance(val, list) else [val]))
+        if len(entries) <= chunk_size:
+            return [url_params]
+        chunks = []
+        for i in range(0, len(entries), chunk_size):
+            param = dict(url_params)
+            for field in chunk_fields:
+                param[field] = None
+            for field, v in entries[i:i + chunk_size]:
+                if param[field] is None:
+                    param[field] = []
+                param[field].append(v)
+            chunks.append(param)
+        return chunks
+
+    async def _fan_out(self, sources: List[Callable[[], AsyncGenerator[T, None]]]) -> AsyncGenerator[T, None]:
+        """runs the given sources concurrently and yields their results in the order of the sources"""
+        semaphore = asyncio.Semaphore(max(1, self.bulk_request_concurrency))
+        queues: List[asyncio.Queue] = [asyncio.Queue() for _ in sources]
+
+        async def _run(source, queue: asyncio.Queue):
+            try:
+                async with semaphore:
+                    async for item in source():
+                        queue.put_nowait((True, item))
+            except Exception as e:
+                queue.put_nowait((False, e))
+            queue.put_nowait(None)
+
+        # the semaphore admits waiting sources in the order they were started in
+        tasks = [asyncio.ensure_future(_run(source, queue)) for source, queue in zip(sources, queues)]
+        try:
+            for queue in queues:
+                while True:
+                    entry = await queue.get()
+                    if entry is None:
+                        break
+                    success, item = entry
+                    if not success:
+                        raise item
+                    yield item
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _build_chunked_generator(self,
+                                       method: str,
+                                       url: str,
+                                       url_params: dict,
+                                       chunk_fields: List[str],
+                                       auth_type: AuthType,
+                                       auth_scope: List[Union[AuthScope, List[AuthScope]]],
+                                       return_type: Type[T],
+                                       split_lists: bool = True,
+                                       error_handler: Optional[Mapping[int, BaseException]] = None) -> AsyncGenerator[T, None]:
+        """same as _build_generator but splits the entries of chunk_fields into requests of up to 100 entries which are run concurrently"""
+        chunks = self._chunk_url_params(url_params, chunk_fields)
+        if len(chunks) == 1:
+            async for y in self._build_generator(method, url, chunks[0], auth_type, auth_scope, return_type,
+                                                 split_lists=split_lists, error_handler=error_handler):
+                yield y
+            return
+        sources = [partial(self._build_generator, method, url, param, auth_type, auth_scope, return_type,
+                           split_lists=split_lists, error_handler=error_handler, use_checkpoint=False) for param in chunks]
+        async for y in self._fan_out(sources):
+            yield y
 
     async def _build_iter_result(self,
                                  method: str,
@@ -500,15 +1012,22 @@ class Twitch:
                                  split_lists: bool = False,
                                  iter_field: str = 'data',
                                  in_data: bool = False):
+        checkpoint = self._claim_pagination_checkpoint()
+        if checkpoint is not None and checkpoint.cursor is not None and url_params.get('after') is None:
+            url_params['after'] = checkpoint.cursor
         _url = build_url(self.base_url + url, url_params, remove_none=True, split_lists=split_lists)
-        async with ClientSession(timeout=self.session_timeout) as session:
-            response = await self._api_request(method, session, _url, auth_type, auth_scope, data=body_data)
-            data = await response.json()
+        session = await self._get_session()
+        data = await self._api_request_json(method, session, _url, auth_type, auth_scope, data=body_data)
         url_params['after'] = data.get('pagination', {}).get('cursor')
         if in_data:
             data = data['data']
+        if checkpoint is not None and checkpoint.done:
+            # everything was already consumed, only keep the data outside of the list
+            data = {**data, iter_field: []}
+            url_params['after'] = None
+        mode = self._get_decoding_mode()
         cont_data = {
-            'req': self._api_request,
+            'pages': partial(self._iter_pages, method, url, url_params, auth_type, auth_scope, body_data, split_lists),
             'method': method,
             'url': self.base_url + url,
             'param': url_params,
@@ -517,9 +1036,15 @@ class Twitch:
             'auth_s': auth_scope,
             'body': body_data,
             'iter_field': iter_field,
-            'in_data': in_data
+            'in_data': in_data,
+            'mode': mode,
+            'checkpoint': checkpoint
         }
-        return return_type(cont_data, **data)
+        if mode == DecodingMode.OBJECT:
+            return return_type(cont_data, **data)
+        result = return_type(cont_data, **{k: v for k, v in data.items() if k != iter_field})
+        result._set_raw_items(data.get(iter_field))
+        return result
 
     @overload
     async def _build_result(self,
@@ -617,35 +1142,38 @@ class Twitch:
                             get_from_data: bool = True,
                             result_type: ResultType = ResultType.RETURN_TYPE,
                             error_handler: Optional[Mapping[int, BaseException]] = None) -> Union[T, None, int, str, Sequence[T], dict, str, Sequence[str]]:
-        async with ClientSession(timeout=self.session_timeout) as session:
-            _url = build_url(self.base_url + url, url_params, remove_none=True, split_lists=split_lists)
-            response = await self._api_request(method, session, _url, auth_type, auth_scope, data=body_data)
-            if error_handler is not None:
-                if response.status in error_handler.keys():
-                    raise error_handler[response.status]
-            if result_type == ResultType.STATUS_CODE:
-                return response.status
-            if result_type == ResultType.TEXT:
-                return await response.text()
-            if return_type is not None:
-                data = await response.json()
-                if isinstance(return_type, dict):
-                    return data
-                origin = return_type.__origin__ if hasattr(return_type, '__origin__') else None # type: ignore
-                if origin is list:
-                    c = return_type.__args__[0] # type: ignore
-                    return [x if isinstance(x, c) else c(**x) for x in data['data']]
-                if get_from_data:
-                    d = data['data']
-                    if isinstance(d, list):
-                        if len(d) == 0:
-                            return None
-                        return return_type(**d[0])
-                    else:
-                        return return_type(**d)
+        session = await self._get_session()
+        _url = build_url(self.base_url + url, url_params, remove_none=True, split_lists=split_lists)
+        if result_type == ResultType.RETURN_TYPE and return_type is not None:
+            data = await self._api_request_json(method, session, _url, auth_type, auth_scope, data=body_data, error_handler=error_handler)
+            if isinstance(return_type, dict):
+                return data
+            mode = self._get_decoding_mode()
+            origin = return_type.__origin__ if hasattr(return_type, '__origin__') else None # type: ignore
+            if origin is list:
+                c = return_type.__args__[0] # type: ignore
+                return [x if isinstance(x, c) else self._decode_entry(c, x, mode) for x in data['data']]
+            if get_from_data:
+                d = data['data']
+                if isinstance(d, list):
+                    if len(d) == 0:
+                        return None
+                    return self._decode_entry(return_type, d[0], mode)
                 else:
-                    return return_type(**data)
-            return None
+                    return self._decode_entry(return_type, d, mode)
+            else:
+                return self._decode_entry(return_type, data, mode)
+        response = await self._api_request(method, session, _url, auth_type, auth_scope, data=body_data)
+        if error_handler is not None:
+            if response.status in error_handler.keys():
+                raise error_handler[response.status]
+        if result_type == ResultType.STATUS_CODE:
+            response.release()
+            return response.status
+        if result_type == ResultType.TEXT:
+            return await response.text()
+        response.release()
+        return None
 
     async def _generate_app_token(self) -> None:
         if self.app_secret is None:
@@ -658,12 +1186,12 @@ class Twitch:
         }
         self.logger.debug('generating fresh app token')
         url = build_url(self.auth_base_url + 'token', params)
-        async with ClientSession(timeout=self.session_timeout) as session:
-            result = await session.post(url)
+        session = await self._get_session()
+        result = await session.post(url)
         if result.status != 200:
             raise TwitchAuthorizationException(f'Authentication failed with code {result.status} ({result.text})')
         try:
-            data = await result.json()
+            data = await result.json(loads=self.json_codec.loads)
             self._app_auth_token = data['access_token']
         except ValueError:
             raise TwitchAuthorizationException('Authentication response did not have a valid json body')
@@ -712,13 +1240,14 @@ class Twitch:
             raise MissingScopeException('scope was not provided')
         if validate:
             from .oauth import validate_token, refresh_access_token
-            val_result = await validate_token(token, auth_base_url=self.auth_base_url)
+            val_result = await validate_token(token, session=await self._get_session(), auth_base_url=self.auth_base_url)
             if val_result.get('status', 200) == 401 and refresh_token is not None:
                 # try to refresh once and revalidate
-                token, refresh_token = await refresh_access_token(refresh_token, self.app_id, self.app_secret, auth_base_url=self.auth_base_url) # type: ignore
+                token, refresh_token = await refresh_access_token(refresh_token, self.app_id, self.app_secret, # type: ignore
+                                                                  session=await self._get_session(), auth_base_url=self.auth_base_url)
                 if self.user_auth_refresh_callback is not None:
                     await self.user_auth_refresh_callback(token, refresh_token) # type: ignore
-                val_result = await validate_token(token, auth_base_url=self.auth_base_url)
+                val_result = await validate_token(token, session=await self._get_session(), auth_base_url=self.auth_base_url)
             if val_result.get('status', 200) == 401:
                 raise InvalidTokenException(val_result.get('message', ''))
             if 'login' not in val_result or 'user_id' not in val_result:
@@ -758,7 +1287,7 @@ class Twitch:
         if self._user_auth_token is None:
             return None
         from .oauth import validate_token
-        val_result = await validate_token(self._user_auth_token, auth_base_url=self.auth_base_url)
+        val_result = await validate_token(self._user_auth_token, session=await self._get_session(), auth_base_url=self.auth_base_url)
         if val_result.get('status', 200) != 200:
             # refresh token
             await self.refresh_used_token()
@@ -768,7 +1297,7 @@ class Twitch:
         if self._app_auth_token is None:
             return None
         from .oauth import validate_token
-        val_result = await validate_token(self._app_auth_token, auth_base_url=self.auth_base_url)
+        val_result = await validate_token(self._app_auth_token, session=await self._get_session(), auth_base_url=self.auth_base_url)
         if val_result.get('status', 200) != 200:
             await self._refresh_app_token()
         return self._app_auth_token
@@ -1110,7 +1639,8 @@ class Twitch:
 
         :param broadcaster_id: ID of the broadcaster for whom clips are returned. |default| :code:`None`
         :param game_id: ID of the game for which clips are returned. |default| :code:`None`
-        :param clip_id: ID of the clip being queried. Limit: 100. |default| :code:`None`
+        :param clip_id: ID of the clip being queried.
+                    More than 100 IDs get split up into multiple requests which are run concurrently. |default| :code:`None`
         :param is_featured: A Boolean value that determines whether the response includes featured clips. |br|
                      If :code:`True`, returns only clips that are featured. |br|
                      If :code:`False`, returns only clips that aren’t featured. |br|
@@ -1128,14 +1658,11 @@ class Twitch:
         :raises ~twitchAPI.type.UnauthorizedException: if user authentication is not set or invalid
         :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
         :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
-        :raises ValueError: if you try to query more than 100 clips in one call
         :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
         :raises ValueError: if not exactly one of clip_id, broadcaster_id or game_id is given
         :raises ValueError: if first is not in range 1 to 100
         :raises ~twitchAPI.type.TwitchResourceNotFound: if the game specified in game_id was not found
         """
-        if clip_id is not None and len(clip_id) > 100:
-            raise ValueError('A maximum of 100 clips can be queried in one call')
         if not (sum([clip_id is not None, broadcaster_id is not None, game_id is not None]) == 1):
             raise ValueError('You need to specify exactly one of clip_id, broadcaster_id or game_id')
         if first < 1 or first > 100:
@@ -1151,7 +1678,7 @@ class Twitch:
             'started_at': datetime_to_str(started_at),
             'is_featured': is_featured
         }
-        async for y in self._build_generator('GET', 'clips', param, AuthType.EITHER, [], Clip, split_lists=True):
+        async for y in self._build_chunked_generator('GET', 'clips', param, ['id'], AuthType.EITHER, [], Clip):
             yield y
 
     async def get_top_games(self,
@@ -1194,7 +1721,7 @@ class Twitch:
         """Gets game information by game ID or name.\n\n
 
         Requires User or App authentication.
-        In total, only 100 game ids and names can be fetched at once.
+        If more than 100 game ids, names and igdb ids are given combined, they get split up into multiple requests which are run concurrently.
 
         For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#get-games
 
@@ -1205,20 +1732,16 @@ class Twitch:
         :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
         :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
         :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
-        :raises ValueError: if none of game_ids, names or igdb_ids are given or if game_ids, names and igdb_ids are more than 100 entries combined.
+        :raises ValueError: if none of game_ids, names or igdb_ids are given
         """
         if game_ids is None and names is None and igdb_ids is None:
             raise ValueError('at least one of game_ids, names or igdb_ids has to be set')
-        if (len(game_ids) if game_ids is not None else 0) + \
-                (len(names) if names is not None else 0) + \
-                (len(igdb_ids) if igdb_ids is not None else 0) > 100:
-            raise ValueError('in total, only 100 game_ids, names and igdb_ids can be passed')
         param = {
             'id': game_ids,
             'name': names,
             'igdb_id': igdb_ids
         }
-        async for y in self._build_generator('GET', 'games', param, AuthType.EITHER, [], Game, split_lists=True):
+        async for y in self._build_chunked_generator('GET', 'games', param, ['id', 'name', 'igdb_id'], AuthType.EITHER, [], Game):
             yield y
 
     async def check_automod_status(self,
@@ -1601,7 +2124,9 @@ class Twitch:
                           stream_type: Optional[str] = None) -> AsyncGenerator[Stream, None]:
         """Gets information about active streams. Streams are returned sorted by number of current viewers, in
         descending order. Across multiple pages of results, there may be duplicate or missing streams, as viewers join
-        and leave streams.\n\n
+        and leave streams.\n
+        If more than 100 user_id and user_login entries are given combined, they get split up into multiple requests which are run concurrently,
+        the results are then only sorted within each request.\n\n
 
         Requires App or User authentication.\n
         For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#get-streams
@@ -1616,9 +2141,8 @@ class Twitch:
                      Minimum 1, Maximum 100 |default| :code:`20`
         :param game_id: Returns streams broadcasting a specified game ID. You can specify up to 100 IDs. |default| :code:`None`
         :param language: Stream language. You can specify up to 100 languages. |default| :code:`None`
-        :param user_id: Returns streams broadcast by one or more specified user IDs. You can specify up to 100 IDs. |default| :code:`None`
-        :param user_login: Returns streams broadcast by one or more specified user login names.
-                        You can specify up to 100 names. |default| :code:`None`
+        :param user_id: Returns streams broadcast by one or more specified user IDs. |default| :code:`None`
+        :param user_login: Returns streams broadcast by one or more specified user login names. |default| :code:`None`
         :param stream_type: The type of stream to filter the list of streams by. Possible values are :code:`all` and :code:`live`
                         |default| :code:`None`
         :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
@@ -1626,18 +2150,25 @@ class Twitch:
         :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
         :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
         :raises ValueError: if first is not in range 1 to 100 or one of the following fields have more than 100 entries:
-                        `user_id, game_id, language, user_login`
+                        `game_id, language`
         """
-        if user_id is not None and len(user_id) > 100:
-            raise ValueError('a maximum of 100 user_id entries are allowed')
-        if user_login is not None and len(user_login) > 100:
-            raise ValueError('a maximum of 100 user_login entries are allowed')
         if language is not None and len(language) > 100:
             raise ValueError('a maximum of 100 languages are allowed')
         if game_id is not None and len(game_id) > 100:
             raise ValueError('a maximum of 100 game_id entries are allowed')
         if first > 100 or first < 1:
             raise ValueError('first must be between 1 and 100')
+        # only merge lookups whose results fit into a single page, otherwise first limits the page size of a paginated request
+        if self.lookup_batch_window is not None and self._get_decoding_mode() != DecodingMode.COLUMNS and \
+                user_id is not None and 0 < len(set(user_id)) <= first and \
+                all(p is None for p in (after, before, game_id, language, user_login, stream_type)):
+            entries = await self._load_batched('streams', self._fetch_streams_batch, [('user_id', u) for u in set(user_id)],
+                                               {'first': first, 'user_id': user_id})
+            # keep the same order as the API would return them in
+            mode = self._get_decoding_mode()
+            for entry in sorted(entries, key=lambda e: e.get('viewer_count', 0), reverse=True):
+                yield self._decode_entry(Stream, entry, mode)
+            return
         param = {
             'after': after,
             'before': before,
@@ -1648,7 +2179,7 @@ class Twitch:
             'user_login': user_login,
             'type': stream_type
         }
-        async for y in self._build_generator('GET', 'streams', param, AuthType.EITHER, [], Stream, split_lists=True):
+        async for y in self._build_chunked_generator('GET', 'streams', param, ['user_id', 'user_login'], AuthType.EITHER, [], Stream):
             yield y
 
     async def get_stream_markers(self,
@@ -1818,27 +2349,33 @@ class Twitch:
         Requires App authentication if either user_ids or logins is provided, otherwise requires a User authentication.
         If you have user Authentication and want to get your email info, you also need the authentication scope
         :const:`~twitchAPI.type.AuthScope.USER_READ_EMAIL`\n
-        If you provide user_ids and/or logins, the maximum combined entries should not exceed 100.
+        If you provide more than 100 user_ids and logins combined, they get split up into multiple requests which are run concurrently.
 
         For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#get-users
 
-        :param user_ids: User ID. Multiple user IDs can be specified. Limit: 100. |default| :code:`None`
-        :param logins: User login name. Multiple login names can be specified. Limit: 100. |default| :code:`None`
+        :param user_ids: User ID. Multiple user IDs can be specified. |default| :code:`None`
+        :param logins: User login name. Multiple login names can be specified. |default| :code:`None`
         :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
         :raises ~twitchAPI.type.UnauthorizedException: if user authentication is not set or invalid
         :raises ~twitchAPI.type.MissingScopeException: if the user authentication is missing the required scope
         :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
         :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
-        :raises ValueError: if more than 100 combined user_ids and logins where provided
         """
-        if (len(user_ids) if user_ids is not None else 0) + (len(logins) if logins is not None else 0) > 100:
-            raise ValueError('the total number of entries in user_ids and logins can not be more than 100')
         url_params = {
             'id': user_ids,
             'login': logins
         }
         at = AuthType.USER if (user_ids is None or len(user_ids) == 0) and (logins is None or len(logins) == 0) else AuthType.EITHER
-        async for f in self._build_generator('GET', 'users', url_params, at, [], TwitchUser, split_lists=True):
+        keys = [('id', i) for i in (user_ids or [])] + [('login', login.lower()) for login in (logins or [])]
+        if self.lookup_batch_window is not None and self._get_decoding_mode() != DecodingMode.COLUMNS and 0 < len(keys) <= 100:
+            seen = set()
+            mode = self._get_decoding_mode()
+            for entry in await self._load_batched('users', self._fetch_users_batch, keys, url_params):
+                if entry['id'] not in seen:
+                    seen.add(entry['id'])
+                    yield self._decode_entry(TwitchUser, entry, mode)
+            return
+        async for f in self._build_chunked_generator('GET', 'users', url_params, ['id', 'login'], at, [], TwitchUser):
             yield f
 
     async def get_channel_followers(self,
@@ -2008,7 +2545,8 @@ class Twitch:
         Requires App authentication.\n
         For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#get-videos
 
-        :param ids: ID of the video being queried. Limit: 100. |default| :code:`None`
+        :param ids: ID of the video being queried.
+                    More than 100 IDs get split up into multiple requests which are run concurrently. |default| :code:`None`
         :param user_id: ID of the user who owns the video. |default| :code:`None`
         :param game_id: ID of the game the video is of. |default| :code:`None`
         :param after: Cursor for forward pagination.\n
@@ -2027,15 +2565,13 @@ class Twitch:
         :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
         :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
         :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
-        :raises ValueError: if first is not in range 1 to 100, ids has more than 100 entries or none of ids, user_id nor game_id is provided.
+        :raises ValueError: if first is not in range 1 to 100 or none of ids, user_id nor game_id is provided.
         :raises ~twitchAPI.type.TwitchResourceNotFound: if the game_id was not found or all IDs in video_id where not found
         """
         if ids is None and user_id is None and game_id is None:
             raise ValueError('you must use either ids, user_id or game_id')
         if first is not None and (first < 1 or first > 100):
             raise ValueError('first must be between 1 and 100')
-        if ids is not None and len(ids) > 100:
-            raise ValueError('ids can only have a maximum of 100 entries')
         param = {
             'id': ids,
             'user_id': user_id,
@@ -2048,7 +2584,7 @@ class Twitch:
             'sort': sort.value,
             'type': video_type.value
         }
-        async for y in self._build_generator('GET', 'videos', param, AuthType.EITHER, [], Video, split_lists=True):
+        async for y in self._build_chunked_generator('GET', 'videos', param, ['id'], AuthType.EITHER, [], Video):
             yield y
 
     async def get_channel_information(self,
@@ -2058,18 +2594,24 @@ class Twitch:
         Requires App or user authentication\n
         For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#get-channel-information
 
-        :param broadcaster_id: ID of the channel to be returned, can either be a string or a list of strings with up to 100 entries
+        :param broadcaster_id: ID of the channel to be returned, can either be a string or a list of strings.
+                    Lists with more than 100 entries get split up into multiple requests which are run concurrently.
         :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
         :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
         :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
         :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
-        :raises ValueError: if broadcaster_id is a list and does not have between 1 and 100 entries
+        :raises ValueError: if broadcaster_id is a empty list
         """
-        if isinstance(broadcaster_id, list):
-            if len(broadcaster_id) < 1 or len(broadcaster_id) > 100:
-                raise ValueError('broadcaster_id has to have between 1 and 100 entries')
-        return await self._build_result('GET', 'channels', {'broadcaster_id': broadcaster_id}, AuthType.EITHER, [], List[ChannelInformation],
-                                        split_lists=True)
+        if isinstance(broadcaster_id, list) and len(broadcaster_id) < 1:
+            raise ValueError('broadcaster_id has to have at least 1 entry')
+        chunks = self._chunk_url_params({'broadcaster_id': broadcaster_id}, ['broadcaster_id'])
+        if len(chunks) == 1:
+            return await self._build_result('GET', 'channels', chunks[0], AuthType.EITHER, [], List[ChannelInformation], split_lists=True)
+
+        async def _chunk(param: dict):
+            for entry in await self._build_result('GET', 'channels', param, AuthType.EITHER, [], List[ChannelInformation], split_lists=True):
+                yield entry
+        return [c async for c in self._fan_out([partial(_chunk, param) for param in chunks])]
 
     async def modify_channel_information(self,
                                          broadcaster_id: str,
@@ -4221,3 +4763,120 @@ class Twitch:
             'broadcaster_id': broadcaster_id
         }
         return await self._build_result('GET', 'shared_chat/session', param, AuthType.EITHER, [], SharedChatSession)
+
+    async def get_conduits(self) -> List[Conduit]:
+        """Gets the conduits for a client ID.
+
+        Requires App Authentication\n
+        For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#get-conduits
+
+        :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
+        :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
+        :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
+        :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
+        """
+        return await self._build_result('GET', 'eventsub/conduits', {}, AuthType.APP, [], List[Conduit])
+
+    async def create_conduit(self, shard_count: int) -> Conduit:
+        """Creates a new conduit.
+
+        Requires App Authentication\n
+        For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#create-conduits
+
+        :param shard_count: The number of shards to create for this conduit.
+        :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
+        :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
+        :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
+        :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
+        """
+        return await self._build_result('POST', 'eventsub/conduits', {}, AuthType.APP, [], Conduit, body_data={'shard_count': shard_count})
+
+    async def update_conduit(self, conduit_id: str, shard_count: int) -> Conduit:
+        """Updates a conduit’s shard count.
+        To delete shards, update the count to a lower number, and the shards above the count will be deleted.
+
+        Requires App Authentication\n
+        For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#update-conduits
+
+        :param conduit_id: Conduit ID.
+        :param shard_count: The new number of shards for this conduit.
+        :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
+        :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
+        :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
+        :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
+        :raises ~twitchAPI.type.TwitchResourceNotFound: if the conduit was not found
+        """
+        body = {
+            'id': conduit_id,
+            'shard_count': shard_count
+        }
+        return await self._build_result('PATCH', 'eventsub/conduits', {}, AuthType.APP, [], Conduit, body_data=body)
+
+    async def delete_conduit(self, conduit_id: str):
+        """Deletes a specified conduit.
+        Note that it may take some time for Eventsub subscriptions on a deleted conduit to show as disabled when calling
+        :const:`~twitchAPI.twitch.Twitch.get_eventsub_subscriptions()`.
+
+        Requires App Authentication\n
+        For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#delete-conduit
+
+        :param conduit_id: Conduit ID.
+        :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
+        :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
+        :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
+        :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
+        :raises ~twitchAPI.type.TwitchResourceNotFound: if the conduit was not found
+        """
+        await self._build_result('DELETE', 'eventsub/conduits', {'id': conduit_id}, AuthType.APP, [], None)
+
+    async def get_conduit_shards(self,
+                                 conduit_id: str,
+                                 status: Optional[str] = None,
+                                 after: Optional[str] = None) -> GetConduitShardsResult:
+        """Gets a lists of all shards for a conduit.
+
+        Requires App Authentication\n
+        For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#get-conduit-shards
+
+        :param conduit_id: Conduit ID.
+        :param status: Status to filter by. |default| :code:`None`
+        :param after: Cursor for forward pagination.\n
+                    Note: The library handles pagination on its own, only use this parameter if you get a pagination cursor via other means.
+                    |default| :code:`None`
+        :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
+        :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
+        :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
+        :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
+        :raises ~twitchAPI.type.TwitchResourceNotFound: if the conduit was not found
+        """
+        param = {
+            'conduit_id': conduit_id,
+            'status': status,
+            'after': after
+        }
+        return await self._build_iter_result('GET', 'eventsub/conduits/shards', param, AuthType.APP, [], GetConduitShardsResult)
+
+    async def update_conduit_shards(self, conduit_id: str, shards: List[dict]) -> UpdateConduitShardsResult:
+        """Updates shard(s) for a conduit.
+
+        Each shard is given as a dictionary containing its :code:`id` and :code:`transport`, e.g.
+        :code:`{'id': '0', 'transport': {'method': 'websocket', 'session_id': session_id}}`.
+
+        Requires App Authentication\n
+        For detailed documentation, see here: https://dev.twitch.tv/docs/api/reference#update-conduit-shards
+
+        :param conduit_id: Conduit ID.
+        :param shards: List of shards to update.
+        :raises ~twitchAPI.type.TwitchAPIException: if the request was malformed
+        :raises ~twitchAPI.type.UnauthorizedException: if app authentication is not set or invalid
+        :raises ~twitchAPI.type.TwitchAuthorizationException: if the used authentication token became invalid and a re authentication failed
+        :raises ~twitchAPI.type.TwitchBackendException: if the Twitch API itself runs into problems
+        :raises ~twitchAPI.type.TwitchResourceNotFound: if the conduit was not found
+        """
+        body = {
+            'conduit_id': conduit_id,
+            'shards': shards
+        }
+        return await self._build_result('PATCH', 'eventsub/conduits/shards', {}, AuthType.APP, [], UpdateConduitShardsResult,
+                                        body_data=body, get_from_data=False)
+
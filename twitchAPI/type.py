@@ -10,7 +10,7 @@ from enum_tools.documentation import document_enum
 __all__ = ['AnalyticsReportType', 'AuthScope', 'ModerationEventType', 'TimePeriod', 'SortMethod', 'HypeTrainContributionMethod',
            'VideoType', 'AuthType', 'StatusCode', 'CustomRewardRedemptionStatus', 'SortOrder',
            'BlockSourceContext', 'BlockReason', 'EntitlementFulfillmentStatus', 'PollStatus', 'PredictionStatus', 'AutoModAction',
-           'AutoModCheckEntry', 'DropsEntitlementFulfillmentStatus', 'ChatEvent', 'ChatRoom',
+           'AutoModCheckEntry', 'DropsEntitlementFulfillmentStatus', 'DecodingMode', 'OverflowPolicy', 'ChatEvent', 'ChatRoom',
            'TwitchAPIException', 'InvalidRefreshTokenException', 'InvalidTokenException', 'NotFoundException', 'TwitchAuthorizationException',
            'UnauthorizedException', 'MissingScopeException', 'TwitchBackendException', 'MissingAppSecretException',
            'EventSubSubscriptionTimeout', 'EventSubSubscriptionConflict', 'EventSubSubscriptionError', 'DeprecatedError', 'TwitchResourceNotFound',
@@ -754,6 +754,38 @@ class DropsEntitlementFulfillmentStatus(Enum):
     FULFILLED = 'FULFILLED'
 
 
+@document_enum
+class DecodingMode(Enum):
+    """How results of API calls are returned, see :const:`~twitchAPI.twitch.Twitch.decoding_mode`"""
+    OBJECT = 0
+    """Results are decoded into the documented :const:`~twitchAPI.object.base.TwitchObject`"""
+    RAW = 1
+    """Results are returned as the raw dictionaries of the API response without any decoding.
+    Each call gets its own dictionaries, even if its response was shared with other calls or came from the response cache."""
+    READ_ONLY = 2
+    """Results are returned as read only mapping views of the raw dictionaries of the API response"""
+    COLUMNS = 3
+    """Paginated results are returned as one batch per page instead of one entry at a time.
+    Each batch is a dictionary mapping every field of the documented object to a column with the values of all entries of that page.
+    Columns of :code:`int`, :code:`float` and :code:`bool` fields are typed :code:`array.array` if all values are set, timestamps are parsed,
+    nested objects are kept as raw dictionaries. Results without pagination are returned as with :const:`~twitchAPI.type.DecodingMode.RAW`"""
+
+
+@document_enum
+class OverflowPolicy(Enum):
+    """What a :const:`~twitchAPI.eventsub.dispatch.DispatchQueue` does with new notifications once it is full"""
+    BLOCK = 0
+    """Wait until there is space in the queue again. This slows down receiving of further notifications.
+    Note that the EventSub websocket reconnects if no message was read for longer than the keepalive timeout.
+    :const:`~twitchAPI.eventsub.webhook.EventSubWebhook` does not wait, it answers with status 503 so that Twitch sends the notification again later."""
+    DROP_OLDEST = 1
+    """Discard the oldest queued notification to make space for the new one"""
+    SPILL_TO_DISK = 2
+    """Write notifications to a file on disk until there is space in the queue again"""
+    DROP_NEWEST = 3
+    """Discard the new notification and keep the queued ones"""
+
+
 class AutoModCheckEntry(TypedDict):
     msg_id: str
     """Developer-generated identifier for mapping messages to results."""